@@ -1,7 +1,13 @@
+import importlib.util
+
 import uvicorn
 
 from src.config.settings import settings
 
+# uvicorn[standard]在非Windows平台附带uvloop和httptools，可用时显式启用
+EVENT_LOOP = "uvloop" if importlib.util.find_spec("uvloop") else "asyncio"
+HTTP_PROTOCOL = "httptools" if importlib.util.find_spec("httptools") else "h11"
+
 
 def main():
     """主入口函数"""
@@ -10,7 +16,9 @@ def main():
         host=settings.host,
         port=settings.port,
         reload=settings.debug,
-        log_level=settings.log_level.lower()
+        log_level=settings.log_level.lower(),
+        loop=EVENT_LOOP,
+        http=HTTP_PROTOCOL,
     )
 
 
@@ -0,0 +1,6 @@
+-- 回测任务表增加乐观锁版本号
+-- 迁移脚本: 004_add_backtest_task_version.sql
+-- 描述: 任务状态更新使用 version 字段做乐观锁，避免并发更新互相覆盖
+
+ALTER TABLE backtest_tasks
+    ADD COLUMN version INT NOT NULL DEFAULT 0 COMMENT '乐观锁版本号' AFTER error_message;
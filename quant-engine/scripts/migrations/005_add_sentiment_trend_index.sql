@@ -0,0 +1,10 @@
+-- 新闻情绪因子表增加趋势查询覆盖索引
+-- 迁移脚本: 005_add_sentiment_trend_index.sql
+-- 描述: 情绪趋势查询按 stock_code 过滤并按 calculation_date 倒序取最近N条，
+--       降序复合索引附带 factor_value、news_count 列，查询只读索引无需回表和排序（需 MySQL 8.0+）
+
+CREATE INDEX idx_sentiment_stock_date_desc
+    ON news_sentiment_factors(stock_code, calculation_date DESC, factor_value, news_count);
+
+-- 新索引前缀已覆盖原 (stock_code, calculation_date) 索引的查询
+DROP INDEX idx_sentiment_stock_date ON news_sentiment_factors;
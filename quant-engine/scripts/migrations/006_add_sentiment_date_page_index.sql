@@ -0,0 +1,10 @@
+-- 新闻情绪因子表增加按日期分页索引
+-- 迁移脚本: 006_add_sentiment_date_page_index.sql
+-- 描述: 按日期查询情绪因子时按 factor_value 降序、stock_code 升序做游标分页，
+--       索引顺序与排序一致并附带 news_count 列，每页只读取索引中的 limit 条记录（需 MySQL 8.0+）
+
+CREATE INDEX idx_sentiment_date_factor_value
+    ON news_sentiment_factors(calculation_date, factor_value DESC, stock_code, news_count);
+
+-- 新索引前缀已覆盖原 calculation_date 单列索引的查询
+DROP INDEX idx_sentiment_calculation_date ON news_sentiment_factors;
@@ -97,6 +97,8 @@ async def config_info() -> dict[str, Any]:
                 "mysql_port": settings.mysql_port,
                 "mysql_database": settings.mysql_database,
                 "mysql_charset": settings.mysql_charset,
+                "mysql_pool_size": settings.mysql_pool_size,
+                "mysql_max_overflow": settings.mysql_max_overflow,
             },
             "redis": {
                 "host": settings.redis_host,
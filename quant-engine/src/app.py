@@ -1,19 +1,27 @@
 """FastAPI应用实例"""
 
+import importlib.util
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 from typing import Any
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse
 from loguru import logger
 
 from .api.v1.router import api_v1_router
+from .clients.data_collector_client import close_data_collector_client
+from .clients.tushare_client import close_tushare_client
 from .config.connection_pool import connection_pool_manager
 from .config.settings import settings
 from .utils.exceptions import setup_exception_handlers
 from .utils.logger import init_logger
 
+# 安装orjson时以ORJSONResponse直接输出字节，大列表响应的序列化开销更低
+DEFAULT_RESPONSE_CLASS = ORJSONResponse if importlib.util.find_spec("orjson") else JSONResponse
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
@@ -29,9 +37,16 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         await connection_pool_manager.initialize()
 
         # 启动任务调度器
+        from .backtest_engine.dao.task_dao import TaskDAO
+        from .backtest_engine.services.factor_combination_manager import (
+            FactorCombinationManager,
+        )
         from .backtest_engine.services.task_scheduler import TaskScheduler
         logger.info("正在初始化任务调度器...")
-        task_scheduler = TaskScheduler()
+        task_scheduler = TaskScheduler(
+            factor_combination_manager=FactorCombinationManager(),
+            task_dao=TaskDAO(),
+        )
         logger.info("任务调度器实例创建完成，正在启动...")
         await task_scheduler.start()
         logger.info("任务调度器已启动")
@@ -52,6 +67,8 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
             await task_scheduler.stop()
             logger.info("任务调度器已停止")
 
+        await close_data_collector_client()
+        await close_tushare_client()
         await connection_pool_manager.cleanup()
         logger.info("应用已关闭")
 
@@ -70,6 +87,7 @@ def create_app() -> FastAPI:
         docs_url="/docs" if settings.debug else None,
         redoc_url="/redoc" if settings.debug else None,
         lifespan=lifespan,
+        default_response_class=DEFAULT_RESPONSE_CLASS,
     )
 
     # 设置CORS中间件
@@ -81,6 +99,9 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
 
+    # 客户端支持时压缩较大的响应，历史数据等长时间序列JSON重复度高，压缩率可观
+    app.add_middleware(GZipMiddleware, minimum_size=settings.gzip_minimum_size)
+
     # 设置异常处理器
     setup_exception_handlers(app)
 
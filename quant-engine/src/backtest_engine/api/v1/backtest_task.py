@@ -6,6 +6,7 @@ from fastapi import APIRouter, HTTPException, Query
 from loguru import logger
 from pydantic import BaseModel, Field
 
+from ...dao.task_dao import MAX_PAGE_SIZE, TaskDAO
 from ...models.task_models import TaskRequest, TaskStatus
 from ...services.task_manager import TaskManager
 from ....utils.exceptions import DataNotFoundError, ValidationException
@@ -64,7 +65,8 @@ class BatchTasksResponse(BaseModel):
     """批次任务响应模型"""
     batch_id: str = Field(..., description="批次ID")
     tasks: list[TaskStatusResponse] = Field(..., description="任务列表")
-    total_count: int = Field(..., description="任务总数")
+    total_count: int = Field(..., description="本页任务数")
+    next_cursor: str | None = Field(default=None, description="下一页游标（创建时间|任务ID），无更多数据时为空")
 
 
 class TaskCancelResponse(BaseModel):
@@ -162,11 +164,19 @@ async def get_task_status(task_id: str = Query(..., description="任务ID")) ->
 
 
 @router.get("/getTasksByBatch", response_model=BatchTasksResponse, summary="按批次查询任务")
-async def get_tasks_by_batch(batch_id: str = Query(..., description="批次ID")) -> BatchTasksResponse:
-    """按批次查询任务列表
+async def get_tasks_by_batch(
+    batch_id: str = Query(..., description="批次ID"),
+    skip: int = Query(default=0, ge=0, description="跳过的记录数"),
+    limit: int = Query(default=500, ge=1, le=MAX_PAGE_SIZE, description="限制返回的记录数"),
+    cursor: str | None = Query(default=None, description="分页游标，取上一页返回的next_cursor，不能与skip同时使用")
+) -> BatchTasksResponse:
+    """按批次分页查询任务列表
 
     Args:
         batch_id: 批次ID
+        skip: 跳过的记录数
+        limit: 限制返回的记录数
+        cursor: 分页游标
 
     Returns:
         批次任务列表
@@ -175,10 +185,12 @@ async def get_tasks_by_batch(batch_id: str = Query(..., description="批次ID"))
         HTTPException: 查询失败
     """
     try:
-        logger.info(f"查询批次任务: {batch_id}")
+        logger.info(f"查询批次任务: {batch_id}, limit={limit}, cursor={cursor}")
 
         task_manager = TaskManager()
-        task_infos = await task_manager.get_tasks_by_batch(batch_id)
+        task_infos = await task_manager.get_tasks_by_batch(
+            batch_id, skip=skip, limit=limit, cursor=cursor
+        )
 
         tasks = []
         for task_info in task_infos:
@@ -198,9 +210,16 @@ async def get_tasks_by_batch(batch_id: str = Query(..., description="批次ID"))
         return BatchTasksResponse(
             batch_id=batch_id,
             tasks=tasks,
-            total_count=len(tasks)
+            total_count=len(tasks),
+            next_cursor=(
+                TaskDAO.task_cursor(task_infos[-1].created_at, task_infos[-1].task_id)
+                if len(task_infos) == limit else None
+            )
         )
 
+    except ValidationException as e:
+        logger.error(f"批次任务分页参数无效: {str(e)}")
+        raise HTTPException(status_code=400, detail=str(e)) from e
     except Exception as e:
         logger.error(f"查询批次任务失败: {str(e)}")
         raise HTTPException(status_code=500, detail=f"查询批次任务失败: {str(e)}") from e
@@ -286,7 +305,8 @@ async def list_tasks(
     status: str | None = Query(default=None, description="任务状态过滤"),
     batch_id: str | None = Query(default=None, description="批次ID过滤"),
     skip: int = Query(default=0, ge=0, description="跳过的记录数"),
-    limit: int = Query(default=100, ge=1, le=1000, description="限制返回的记录数")
+    limit: int = Query(default=100, ge=1, le=MAX_PAGE_SIZE, description="限制返回的记录数"),
+    cursor: str | None = Query(default=None, description="分页游标，格式为上一页末条任务的“创建时间|任务ID”，不能与skip同时使用")
 ) -> list[TaskStatusResponse]:
     """列表查询任务
 
@@ -295,6 +315,7 @@ async def list_tasks(
         batch_id: 批次ID过滤
         skip: 跳过的记录数
         limit: 限制返回的记录数
+        cursor: 分页游标
 
     Returns:
         任务列表
@@ -318,7 +339,8 @@ async def list_tasks(
             status=task_status,
             batch_id=batch_id,
             skip=skip,
-            limit=limit
+            limit=limit,
+            cursor=cursor
         )
 
         tasks = []
@@ -340,6 +362,9 @@ async def list_tasks(
 
     except HTTPException:
         raise
+    except ValidationException as e:
+        logger.error(f"列表查询参数无效: {str(e)}")
+        raise HTTPException(status_code=400, detail=str(e)) from e
     except Exception as e:
         logger.error(f"列表查询任务失败: {str(e)}")
         raise HTTPException(status_code=500, detail=f"列表查询任务失败: {str(e)}") from e
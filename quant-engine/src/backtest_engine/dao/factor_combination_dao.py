@@ -20,6 +20,71 @@ from ..models.factor_combination import (
 
 logger = logging.getLogger(__name__)
 
+# 固定结构的SQL语句在模块加载时构建一次，避免每次调用重复解析绑定参数
+_INSERT_SQL = text("""
+    INSERT INTO factor_combinations (
+        combination_id, name, description, factors,
+        total_weight, is_active, created_by, created_at, updated_at
+    ) VALUES (
+        :combination_id, :name, :description, :factors,
+        :total_weight, :is_active, :created_by, :created_at, :updated_at
+    )
+""")
+
+_SELECT_BY_ID_SQL = text("""
+    SELECT combination_id, name, description, factors,
+           total_weight, is_active, created_by, created_at, updated_at
+    FROM factor_combinations
+    WHERE combination_id = :config_id
+""")
+
+_SELECT_BY_NAME_SQL = text("""
+    SELECT combination_id, name, description, factors,
+           total_weight, is_active, created_by, created_at, updated_at
+    FROM factor_combinations
+    WHERE name = :name
+""")
+
+_UPDATE_SQL = text("""
+    UPDATE factor_combinations
+    SET name = :name,
+        description = :description,
+        factors = :factors,
+        total_weight = :total_weight,
+        updated_at = :updated_at
+    WHERE combination_id = :config_id
+""")
+
+_DELETE_SQL = text("""
+    DELETE FROM factor_combinations
+    WHERE combination_id = :config_id
+""")
+
+
+def _parse_factors(factors_json: str) -> list[FactorConfig]:
+    """解析数据库中存储的因子配置JSON
+
+    Args:
+        factors_json: 因子配置JSON字符串
+
+    Returns:
+        List[FactorConfig]: 因子配置列表
+    """
+    return [
+        FactorConfig(
+            id=factor_data["id"],
+            name=factor_data["name"],
+            factor_type=FactorType(factor_data["factor_type"]),
+            weight=factor_data["weight"],
+            parameters=factor_data["parameters"],
+            is_active=factor_data["is_active"],
+            description=factor_data["description"],
+            created_at=datetime.fromisoformat(factor_data["created_at"]),
+            updated_at=datetime.fromisoformat(factor_data["updated_at"])
+        )
+        for factor_data in json.loads(factors_json)
+    ]
+
 
 class FactorCombinationDAO:
     """因子组合配置数据访问对象
@@ -66,18 +131,8 @@ class FactorCombinationDAO:
                 ], ensure_ascii=False)
 
                 # 插入数据库
-                insert_sql = text("""
-                    INSERT INTO factor_combinations (
-                        combination_id, name, description, factors,
-                        total_weight, is_active, created_by, created_at, updated_at
-                    ) VALUES (
-                        :combination_id, :name, :description, :factors,
-                        :total_weight, :is_active, :created_by, :created_at, :updated_at
-                    )
-                """)
-
                 current_time = datetime.now()
-                await session.execute(insert_sql, {
+                await session.execute(_INSERT_SQL, {
                     "combination_id": config_id,
                     "name": config.name,
                     "description": config.description,
@@ -114,14 +169,7 @@ class FactorCombinationDAO:
         """
         try:
             async with get_db_session() as session:
-                select_sql = text("""
-                    SELECT combination_id, name, description, factors,
-                           total_weight, is_active, created_by, created_at, updated_at
-                    FROM factor_combinations
-                    WHERE combination_id = :config_id
-                """)
-
-                result = await session.execute(select_sql, {"config_id": config_id})
+                result = await session.execute(_SELECT_BY_ID_SQL, {"config_id": config_id})
                 row = result.fetchone()
 
                 logger.info(f"查询配置 {config_id}, 结果: {row}")
@@ -131,24 +179,9 @@ class FactorCombinationDAO:
                     return None
 
                 # 解析因子数据
-                factors_data = json.loads(row.factors)
+                factors = _parse_factors(row.factors)
 
                 # 构建FactorCombination对象
-                factors = []
-                for factor_data in factors_data:
-                    factor = FactorConfig(
-                        id=factor_data["id"],
-                        name=factor_data["name"],
-                        factor_type=FactorType(factor_data["factor_type"]),
-                        weight=factor_data["weight"],
-                        parameters=factor_data["parameters"],
-                        is_active=factor_data["is_active"],
-                        description=factor_data["description"],
-                        created_at=datetime.fromisoformat(factor_data["created_at"]),
-                        updated_at=datetime.fromisoformat(factor_data["updated_at"])
-                    )
-                    factors.append(factor)
-
                 config = FactorCombination(
                     id=row.combination_id,
                     name=row.name,
@@ -202,17 +235,7 @@ class FactorCombinationDAO:
                 ], ensure_ascii=False)
 
                 # 更新数据库
-                update_sql = text("""
-                    UPDATE factor_combinations
-                    SET name = :name,
-                        description = :description,
-                        factors = :factors,
-                        total_weight = :total_weight,
-                        updated_at = :updated_at
-                    WHERE combination_id = :config_id
-                """)
-
-                result = await session.execute(update_sql, {
+                result = await session.execute(_UPDATE_SQL, {
                     "config_id": config_id,
                     "name": config.name,
                     "description": config.description,
@@ -252,12 +275,7 @@ class FactorCombinationDAO:
         """
         try:
             async with get_db_session() as session:
-                delete_sql = text("""
-                    DELETE FROM factor_combinations
-                    WHERE combination_id = :config_id
-                """)
-
-                result = await session.execute(delete_sql, {"config_id": config_id})
+                result = await session.execute(_DELETE_SQL, {"config_id": config_id})
                 await session.commit()
 
                 # 检查是否有行被删除
@@ -325,29 +343,10 @@ class FactorCombinationDAO:
 
                 configs = []
                 for row in rows:
-                    # 解析因子数据
-                    factors_data = json.loads(row.factors)
-
-                    # 构建FactorCombination对象
-                    factors = []
-                    for factor_data in factors_data:
-                        factor = FactorConfig(
-                            id=factor_data["id"],
-                            name=factor_data["name"],
-                            factor_type=FactorType(factor_data["factor_type"]),
-                            weight=factor_data["weight"],
-                            parameters=factor_data["parameters"],
-                            is_active=factor_data["is_active"],
-                            description=factor_data["description"],
-                            created_at=datetime.fromisoformat(factor_data["created_at"]),
-                            updated_at=datetime.fromisoformat(factor_data["updated_at"])
-                        )
-                        factors.append(factor)
-
                     config = FactorCombination(
                         name=row.name,
                         description=row.description,
-                        factors=factors,
+                        factors=_parse_factors(row.factors),
                         created_by=row.created_by
                     )
                     configs.append(config)
@@ -375,38 +374,16 @@ class FactorCombinationDAO:
         """
         try:
             async with get_db_session() as session:
-                select_sql = text("""
-                    SELECT combination_id, name, description, factors,
-                           total_weight, is_active, created_by, created_at, updated_at
-                    FROM factor_combinations
-                    WHERE name = :name
-                """)
-
-                result = await session.execute(select_sql, {"name": name})
+                result = await session.execute(_SELECT_BY_NAME_SQL, {"name": name})
                 row = result.fetchone()
 
                 if not row:
                     return None
 
                 # 解析因子数据
-                factors_data = json.loads(row.factors)
+                factors = _parse_factors(row.factors)
 
                 # 构建FactorCombination对象
-                factors = []
-                for factor_data in factors_data:
-                    factor = FactorConfig(
-                        id=factor_data["id"],
-                        name=factor_data["name"],
-                        factor_type=FactorType(factor_data["factor_type"]),
-                        weight=factor_data["weight"],
-                        parameters=factor_data["parameters"],
-                        is_active=factor_data["is_active"],
-                        description=factor_data["description"],
-                        created_at=datetime.fromisoformat(factor_data["created_at"]),
-                        updated_at=datetime.fromisoformat(factor_data["updated_at"])
-                    )
-                    factors.append(factor)
-
                 config = FactorCombination(
                     name=row.name,
                     description=row.description,
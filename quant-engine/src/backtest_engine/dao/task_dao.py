@@ -3,17 +3,22 @@
 本模块实现了任务管理的数据访问功能，包括任务的CRUD操作和查询功能。
 """
 
+from collections.abc import Collection
 from datetime import datetime
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import desc, select, update
+from sqlalchemy import and_, desc, lambda_stmt, or_, select, update
 
 from ...config.connection_pool import get_db_session
+from ...utils.exceptions import ConcurrentUpdateError
 from ..models.database import BacktestTaskTable
 from ..models.task_models import TaskInfo, TaskStatus
 from .base import BaseDAO
 
+# 单次查询返回的最大记录数
+MAX_PAGE_SIZE = 1000
+
 
 class TaskDAO(BaseDAO[BacktestTaskTable]):
     """任务数据访问对象
@@ -49,15 +54,13 @@ class TaskDAO(BaseDAO[BacktestTaskTable]):
         Returns:
             任务对象，如果不存在则返回None
         """
-        # 如果是字符串，转换为UUID
-        if isinstance(task_id, str):
-            try:
-                task_id = UUID(task_id)
-            except ValueError:
-                return None
+        # 任务ID以字符串形式存储（如bt_前缀的ID），UUID统一转为字符串比较
+        task_key = str(task_id)
 
         async with get_db_session() as session:
-            stmt = select(BacktestTaskTable).where(BacktestTaskTable.id == task_id)
+            stmt = lambda_stmt(
+                lambda: select(BacktestTaskTable).where(BacktestTaskTable.id == task_key)
+            )
             result = await session.execute(stmt)
             task: BacktestTaskTable | None = result.scalar_one_or_none()
             return task
@@ -107,29 +110,69 @@ class TaskDAO(BaseDAO[BacktestTaskTable]):
                     return True
         return False
 
+    @staticmethod
+    def task_cursor(created_at: datetime, task_id: str) -> str:
+        """生成任务列表的分页游标：创建时间|任务ID"""
+        return f"{created_at.isoformat()}|{task_id}"
+
+    @staticmethod
+    def parse_task_cursor(cursor: str) -> tuple[datetime, str]:
+        """解析任务列表的分页游标
+
+        Raises:
+            ValueError: 游标格式无效
+        """
+        created_at, sep, task_id = cursor.rpartition("|")
+        if not sep or not task_id:
+            raise ValueError(f"无效的分页游标: {cursor}")
+        try:
+            return datetime.fromisoformat(created_at), task_id
+        except ValueError as e:
+            raise ValueError(f"无效的分页游标: {cursor}") from e
+
     async def list_objects(self, skip: int = 0, limit: int = 100, **filters: Any) -> list[BacktestTaskTable]:
         """列表查询任务
 
+        按创建时间、任务ID降序排列。创建时间只精确到秒，键集分页需同时比较任务ID，
+        否则会漏掉与上一页末条同一秒创建的任务
+
         Args:
             skip: 跳过的记录数
-            limit: 限制返回的记录数
-            **filters: 过滤条件
+            limit: 限制返回的记录数，最大为MAX_PAGE_SIZE
+            **filters: 过滤条件，cursor为上一页末条任务的(创建时间, 任务ID)，用于键集分页
 
         Returns:
             任务列表
         """
-        async with get_db_session() as session:
-            stmt = select(BacktestTaskTable)
-
-            # 应用过滤条件
-            if 'status' in filters:
-                stmt = stmt.where(BacktestTaskTable.status == filters['status'])
-            if 'batch_id' in filters:
-                stmt = stmt.where(BacktestTaskTable.batch_id == filters['batch_id'])
-
-            stmt = stmt.order_by(desc(BacktestTaskTable.created_at))
-            stmt = stmt.offset(skip).limit(limit)
+        page_size = min(limit, MAX_PAGE_SIZE)
+        status = filters.get('status')
+        batch_id = filters.get('batch_id')
+        cursor = filters.get('cursor')
+
+        # 使用lambda语句，按过滤条件组合缓存SQL，仅参数值随调用变化
+        stmt = lambda_stmt(lambda: select(BacktestTaskTable))
+        if 'status' in filters:
+            stmt += lambda s: s.where(BacktestTaskTable.status == status)
+        if 'batch_id' in filters:
+            stmt += lambda s: s.where(BacktestTaskTable.batch_id == batch_id)
+        if cursor is not None:
+            after_created_at, after_id = cursor
+            stmt += lambda s: s.where(
+                or_(
+                    BacktestTaskTable.created_at < after_created_at,
+                    and_(
+                        BacktestTaskTable.created_at == after_created_at,
+                        BacktestTaskTable.id < after_id,
+                    ),
+                )
+            )
+        stmt += lambda s: (
+            s.order_by(desc(BacktestTaskTable.created_at), desc(BacktestTaskTable.id))
+            .offset(skip)
+            .limit(page_size)
+        )
 
+        async with get_db_session() as session:
             result = await session.execute(stmt)
             return list(result.scalars().all())
 
@@ -191,67 +234,173 @@ class TaskDAO(BaseDAO[BacktestTaskTable]):
     async def update_task_status(self, task_id: str, status: TaskStatus,
                                 error_message: str | None = None,
                                 result_id: str | None = None,
-                                progress: float | None = None) -> bool:
+                                progress: float | None = None,
+                                *, expected_version: int | None = None,
+                                expected_status: TaskStatus | Collection[TaskStatus] | None = None) -> bool:
         """更新任务状态
 
+        以单条UPDATE完成状态检查与更新并递增版本号；指定expected_version或
+        expected_status时，仅在当前版本号/状态匹配时更新，无需先查询任务
+
         Args:
             task_id: 任务ID
             status: 新状态
             error_message: 错误信息
             result_id: 结果ID
-            progress: 进度
+            progress: 进度（任务表暂无进度字段，保留参数以兼容调用方）
+            expected_version: 期望的当前版本号
+            expected_status: 期望的当前状态，可传入多个允许的状态
 
         Returns:
             是否更新成功
-        """
-        task = await self.get_by_id(task_id)
-        if not task:
-            return False
 
-        # 更新状态
-        task.status = status.value
-        task.updated_at = datetime.utcnow()  # type: ignore[assignment]
+        Raises:
+            ConcurrentUpdateError: 版本号或状态不匹配，任务已被其他操作修改
+        """
+        now = datetime.utcnow()
+        values: dict[str, Any] = {
+            'status': status.value,
+            'updated_at': now,
+            'version': BacktestTaskTable.version + 1,
+        }
 
         if error_message is not None:
-            task.error_message = error_message
+            values['error_message'] = error_message
 
         if result_id is not None:
-            task.result_id = result_id
-
-        if progress is not None:
-            task.progress = progress
+            values['result_id'] = result_id
 
         # 根据状态更新时间字段
         if status == TaskStatus.RUNNING:
-            task.started_at = datetime.utcnow()  # type: ignore[assignment]
+            values['started_at'] = now
         elif status in [TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED]:
-            task.completed_at = datetime.utcnow()  # type: ignore[assignment]
+            values['completed_at'] = now
 
-        await self.update(task)
-        return True
+        stmt = update(BacktestTaskTable).where(BacktestTaskTable.id == str(task_id))
+        if expected_version is not None:
+            stmt = stmt.where(BacktestTaskTable.version == expected_version)
+        if expected_status is not None:
+            if isinstance(expected_status, TaskStatus):
+                expected_status = (expected_status,)
+            stmt = stmt.where(BacktestTaskTable.status.in_([s.value for s in expected_status]))
+        stmt = stmt.values(**values)
+
+        async with get_db_session() as session:
+            result = await session.execute(stmt)
+            await session.commit()
+            updated = (result.rowcount or 0) > 0
+
+        if not updated and (expected_version is not None or expected_status is not None):
+            raise ConcurrentUpdateError(
+                f"任务 {task_id} 已被并发修改",
+                details={
+                    'task_id': str(task_id),
+                    'expected_version': expected_version,
+                    'expected_status': [s.value for s in expected_status] if expected_status else None,
+                }
+            )
+
+        return updated
+
+    async def fail_task(self, task_id: str, error_message: str,
+                        *, expected_version: int | None = None,
+                        expected_status: TaskStatus | Collection[TaskStatus] | None = TaskStatus.RUNNING) -> bool:
+        """将任务标记为失败
 
-    async def get_tasks_by_batch(self, batch_id: str) -> list[BacktestTaskTable]:
-        """根据批次ID获取任务列表
+        状态、错误信息、完成时间和版本号在同一条UPDATE中写入；
+        条件不匹配（如任务已被取消）时不更新也不抛出异常
+
+        Args:
+            task_id: 任务ID
+            error_message: 错误信息
+            expected_version: 期望的当前版本号
+            expected_status: 期望的当前状态，默认要求任务仍在运行
+
+        Returns:
+            是否更新成功
+        """
+        try:
+            return await self.update_task_status(
+                task_id,
+                TaskStatus.FAILED,
+                error_message=error_message,
+                expected_version=expected_version,
+                expected_status=expected_status
+            )
+        except ConcurrentUpdateError:
+            return False
+
+    async def get_tasks_by_batch(self, batch_id: str, skip: int = 0, limit: int = 500,
+                                 cursor: tuple[datetime, str] | None = None) -> list[BacktestTaskTable]:
+        """根据批次ID分页获取任务列表
 
         Args:
             batch_id: 批次ID
+            skip: 跳过的记录数
+            limit: 限制返回的记录数
+            cursor: 键集分页游标，上一页末条任务的(创建时间, 任务ID)
 
         Returns:
             任务列表
         """
-        return await self.list_objects(batch_id=batch_id)
+        return await self.list_objects(
+            skip=skip, limit=limit, batch_id=batch_id, cursor=cursor
+        )
 
     async def get_pending_tasks(self, limit: int = 10) -> list[BacktestTaskTable]:
         """获取待执行的任务
 
         Args:
-            limit: 限制返回的任务数
+            limit: 限制返回的任务数，最大为MAX_PAGE_SIZE
 
         Returns:
             待执行任务列表
         """
         return await self.list_objects(status=TaskStatus.PENDING.value, limit=limit)
 
+    async def claim_pending_tasks(self, limit: int = 10) -> list[BacktestTaskTable]:
+        """认领待执行的任务
+
+        按创建时间顺序锁定pending任务（跳过已被其他调度器锁定的行），
+        并在同一事务中将其置为running，保证每个任务只被一个调度器认领
+
+        Args:
+            limit: 限制认领的任务数，最大为MAX_PAGE_SIZE
+
+        Returns:
+            已认领的任务列表
+        """
+        batch_size = min(limit, MAX_PAGE_SIZE)
+        pending = TaskStatus.PENDING.value
+
+        async with get_db_session() as session:
+            stmt = lambda_stmt(
+                lambda: select(BacktestTaskTable)
+                .where(BacktestTaskTable.status == pending)
+                .order_by(BacktestTaskTable.created_at)
+                .limit(batch_size)
+                .with_for_update(skip_locked=True)
+            )
+            result = await session.execute(stmt)
+            tasks = list(result.scalars().all())
+
+            if tasks:
+                now = datetime.utcnow()
+                await session.execute(
+                    update(BacktestTaskTable)
+                    .where(BacktestTaskTable.id.in_([task.id for task in tasks]))
+                    .where(BacktestTaskTable.status == TaskStatus.PENDING.value)
+                    .values(
+                        status=TaskStatus.RUNNING.value,
+                        started_at=now,
+                        updated_at=now,
+                        version=BacktestTaskTable.version + 1,
+                    )
+                )
+
+            await session.commit()
+            return tasks
+
     async def batch_create_tasks(self, tasks: list[BacktestTaskTable]) -> list[BacktestTaskTable]:
         """批量创建任务
 
@@ -392,6 +541,29 @@ class TaskDAO(BaseDAO[BacktestTaskTable]):
     async def convert_to_task_info(self, db_task: BacktestTaskTable) -> TaskInfo:
         """将数据库任务对象转换为TaskInfo
 
+        Args:
+            db_task: 数据库任务对象
+
+        Returns:
+            TaskInfo对象
+        """
+        return self._build_task_info(db_task)
+
+    async def convert_many_to_task_info(self, db_tasks: list[BacktestTaskTable]) -> list[TaskInfo]:
+        """批量将数据库任务对象转换为TaskInfo
+
+        Args:
+            db_tasks: 数据库任务对象列表
+
+        Returns:
+            TaskInfo对象列表
+        """
+        return [self._build_task_info(db_task) for db_task in db_tasks]
+
+    @staticmethod
+    def _build_task_info(db_task: BacktestTaskTable) -> TaskInfo:
+        """根据数据库任务对象构建TaskInfo
+
         Args:
             db_task: 数据库任务对象
 
@@ -418,7 +590,8 @@ class TaskDAO(BaseDAO[BacktestTaskTable]):
             created_at=db_task.created_at.replace(tzinfo=None) if db_task.created_at else datetime.now(),
             started_at=db_task.started_at.replace(tzinfo=None) if db_task.started_at else None,
             completed_at=db_task.completed_at.replace(tzinfo=None) if db_task.completed_at else None,
-            updated_at=db_task.updated_at.replace(tzinfo=None) if db_task.updated_at else datetime.now()
+            updated_at=db_task.updated_at.replace(tzinfo=None) if db_task.updated_at else datetime.now(),
+            version=db_task.version or 0
         )
 
     async def update_task_error(self, task_id: str, error_message: str) -> bool:
@@ -84,6 +84,7 @@ class BacktestTaskTable(Base):
     config: Any = Column(JSON, nullable=False, comment="回测配置")
     result_id: Any = Column(CHAR(36), comment="关联的结果ID")
     error_message: Any = Column(Text, comment="错误信息")
+    version: Any = Column(Integer(), nullable=False, default=0, comment="乐观锁版本号")
     created_at = Column(
         DateTime,
         default=func.current_timestamp(),
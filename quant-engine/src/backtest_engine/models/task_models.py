@@ -6,13 +6,58 @@
 - TaskInfo: 任务信息模型
 """
 
+import secrets
+import time
 from datetime import UTC, datetime
 from enum import Enum
 from typing import Any
-from uuid import uuid4
 
 from pydantic import BaseModel, Field, field_validator
 
+# Crockford Base32字母表，用于ULID编码
+_ULID_ALPHABET = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+_ULID_RANDOM_BITS = 80
+
+
+class _MonotonicUlidGenerator:
+    """单调递增的ULID生成器
+
+    48位毫秒时间戳 + 80位随机数；同一毫秒内随机部分递增，保证ID按生成顺序有序
+    """
+
+    def __init__(self) -> None:
+        self._last_ms = -1
+        self._last_random = 0
+
+    def new(self) -> str:
+        """生成一个26位ULID字符串"""
+        now_ms = time.time_ns() // 1_000_000
+        if now_ms > self._last_ms:
+            self._last_ms = now_ms
+            self._last_random = secrets.randbits(_ULID_RANDOM_BITS)
+        else:
+            self._last_random = (self._last_random + 1) & ((1 << _ULID_RANDOM_BITS) - 1)
+
+        value = (self._last_ms << _ULID_RANDOM_BITS) | self._last_random
+        chars = []
+        for _ in range(26):
+            chars.append(_ULID_ALPHABET[value & 0x1F])
+            value >>= 5
+        return "".join(reversed(chars))
+
+
+_ulid_generator = _MonotonicUlidGenerator()
+
+
+def generate_task_id() -> str:
+    """生成任务ID（bt_前缀 + 单调ULID）"""
+    return f"bt_{_ulid_generator.new()}"
+
+
+def generate_batch_id() -> str:
+    """生成批次ID（batch_前缀 + 单调ULID）"""
+    return f"batch_{_ulid_generator.new()}"
+
 
 class TaskStatus(str, Enum):
     """任务状态枚举
@@ -32,13 +77,7 @@ class TaskStatus(str, Enum):
         Returns:
             状态转换映射表
         """
-        return {
-            cls.PENDING: [cls.RUNNING, cls.CANCELLED],
-            cls.RUNNING: [cls.COMPLETED, cls.FAILED, cls.CANCELLED],
-            cls.COMPLETED: [],  # 完成状态不能转换
-            cls.FAILED: [cls.PENDING],  # 失败可以重新排队
-            cls.CANCELLED: [cls.PENDING]  # 取消可以重新排队
-        }
+        return {status: [t for t in cls if t in targets] for status, targets in _TRANSITIONS.items()}
 
     def can_transition_to(self, target_status: 'TaskStatus') -> bool:
         """检查是否可以转换到目标状态
@@ -49,8 +88,7 @@ class TaskStatus(str, Enum):
         Returns:
             是否可以转换
         """
-        valid_transitions = self.get_valid_transitions()
-        return target_status in valid_transitions.get(self, [])
+        return target_status in _TRANSITIONS[self]
 
     def get_description(self) -> str:
         """获取状态描述
@@ -68,6 +106,16 @@ class TaskStatus(str, Enum):
         return descriptions.get(self, "未知状态")
 
 
+# 状态转换规则表，模块加载时构建一次
+_TRANSITIONS: dict[TaskStatus, frozenset[TaskStatus]] = {
+    TaskStatus.PENDING: frozenset({TaskStatus.RUNNING, TaskStatus.CANCELLED}),
+    TaskStatus.RUNNING: frozenset({TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED}),
+    TaskStatus.COMPLETED: frozenset(),  # 完成状态不能转换
+    TaskStatus.FAILED: frozenset({TaskStatus.PENDING}),  # 失败可以重新排队
+    TaskStatus.CANCELLED: frozenset({TaskStatus.PENDING}),  # 取消可以重新排队
+}
+
+
 class TaskRequest(BaseModel):
     """任务创建请求模型
 
@@ -156,6 +204,7 @@ class TaskInfo(BaseModel):
     started_at: datetime | None = Field(None, description="开始时间")
     completed_at: datetime | None = Field(None, description="完成时间")
     updated_at: datetime = Field(default_factory=lambda: datetime.now(UTC), description="更新时间")
+    version: int = Field(default=0, description="乐观锁版本号")
 
     class Config:
         """Pydantic配置"""
@@ -178,10 +227,10 @@ class TaskInfo(BaseModel):
             TaskInfo实例
         """
         if task_id is None:
-            task_id = f"bt_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid4().hex[:8]}"
+            task_id = generate_task_id()
 
         if batch_id is None:
-            batch_id = request.batch_id or f"batch_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+            batch_id = request.batch_id or generate_batch_id()
 
         return cls(
             task_id=task_id,
@@ -23,6 +23,48 @@ from ..models.backtest_models import (
     BacktestResult,
 )
 
+# 成交记录结构化类型：定长字段按记录紧凑存储，便于向量化统计
+TRADE_DTYPE = np.dtype([
+    ('ts', '<i8'),      # 成交时间（Unix时间戳，秒）
+    ('code', 'S12'),    # 股票代码
+    ('type', 'u1'),     # 成交方向
+    ('price', 'f8'),    # 成交价格
+    ('shares', 'i4'),   # 成交数量
+    ('cost', 'f8'),     # 交易佣金
+    ('pnl', 'f8'),      # 已实现盈亏（仅卖出成交有效）
+])
+
+TRADE_TYPE_BUY = 0
+TRADE_TYPE_SELL = 1
+
+
+def calculate_trade_stats(trades: np.ndarray) -> dict[str, float]:
+    """基于成交记录向量化计算交易统计
+
+    Args:
+        trades: TRADE_DTYPE结构化数组
+
+    Returns:
+        交易统计字典
+    """
+    closed_pnl = trades['pnl'][trades['type'] == TRADE_TYPE_SELL]
+    wins = closed_pnl > 0
+    losses = closed_pnl < 0
+
+    win_count = int(wins.sum())
+    loss_count = int(losses.sum())
+    avg_profit = float(closed_pnl[wins].mean()) if win_count else 0.0
+    avg_loss = float(-closed_pnl[losses].mean()) if loss_count else 0.0
+
+    return {
+        'closed_trades': int(closed_pnl.size),
+        'win_rate': win_count / closed_pnl.size if closed_pnl.size else 0.0,
+        'avg_profit': avg_profit,
+        'avg_loss': avg_loss,
+        'profit_loss_ratio': avg_profit / avg_loss if avg_loss > 0 else 0.0,
+        'total_commission': float(trades['cost'].sum()),
+    }
+
 
 class BacktraderAnalyzer:
     """Backtrader分析器
@@ -65,6 +107,7 @@ class BacktraderAnalyzer:
             # 5. 自定义分析器
             cerebro.addanalyzer(CalmarRatioAnalyzer, _name='calmar')
             cerebro.addanalyzer(PortfolioValueAnalyzer, _name='portfolio_value')
+            cerebro.addanalyzer(TradeRecordAnalyzer, _name='trade_records')
 
             logger.info("分析器添加完成")
 
@@ -225,9 +268,17 @@ class BacktraderAnalyzer:
             if hasattr(analyzers, 'time_return'):
                 time_return_analysis = analyzers.time_return.get_analysis()
                 if time_return_analysis:
-                    returns = list(time_return_analysis.values())
-                    if returns:
-                        metrics['volatility'] = float(np.std(returns) * np.sqrt(252))  # 年化波动率
+                    # 收益序列以float32存储，归约时按float64累加以保证精度
+                    returns = np.fromiter(
+                        time_return_analysis.values(),
+                        dtype=np.float32,
+                        count=len(time_return_analysis),
+                    )
+                    metrics['volatility'] = float(np.std(returns, dtype=np.float64) * np.sqrt(252))  # 年化波动率
+
+                    # 95% VaR（历史模拟法）
+                    k = int(0.05 * (returns.size - 1))
+                    metrics['var_95'] = float(-np.partition(returns, k)[k])
 
             # VWR (Variability-Weighted Return)
             if hasattr(analyzers, 'vwr'):
@@ -279,6 +330,13 @@ class BacktraderAnalyzer:
                 total_lost = abs(trade_analysis.get('lost', {}).get('pnl', {}).get('total', 0.0))
                 stats['profit_factor'] = (total_won / total_lost) if total_lost > 0 else 0.0
 
+            # 基于成交记录的盈亏统计
+            if hasattr(analyzers, 'trade_records'):
+                record_stats = analyzers.trade_records.get_analysis()
+                if isinstance(record_stats, dict):
+                    stats['avg_profit'] = record_stats.get('avg_profit', 0.0)
+                    stats['profit_loss_ratio'] = record_stats.get('profit_loss_ratio', 0.0)
+
             logger.debug(f"交易统计提取完成: {stats}")
 
         except Exception as e:
@@ -426,3 +484,48 @@ class PortfolioValueAnalyzer(bt.Analyzer):
     def get_analysis(self) -> dict[Any, float]:
         """返回分析结果"""
         return self.portfolio_values
+
+
+class TradeRecordAnalyzer(bt.Analyzer):
+    """成交记录分析器
+
+    将每笔成交写入预分配的结构化数组，容量不足时按倍数扩容
+    """
+
+    INITIAL_CAPACITY = 4096
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._trades: np.ndarray = np.empty(self.INITIAL_CAPACITY, dtype=TRADE_DTYPE)
+        self._ntrades = 0
+
+    @property
+    def trades(self) -> np.ndarray:
+        """已记录的成交（结构化数组视图）"""
+        return self._trades[:self._ntrades]
+
+    def notify_order(self, order: bt.Order) -> None:
+        """订单成交时记录"""
+        if order.status != order.Completed:
+            return
+
+        if self._ntrades == len(self._trades):
+            grown = np.empty(len(self._trades) * 2, dtype=TRADE_DTYPE)
+            grown[:self._ntrades] = self._trades
+            self._trades = grown
+
+        executed = order.executed
+        self._trades[self._ntrades] = (
+            int(bt.num2date(executed.dt).timestamp()),
+            (order.data._name or '').encode(),
+            TRADE_TYPE_BUY if order.isbuy() else TRADE_TYPE_SELL,
+            executed.price,
+            abs(executed.size),
+            executed.comm,
+            executed.pnl,
+        )
+        self._ntrades += 1
+
+    def get_analysis(self) -> dict[str, float]:
+        """返回分析结果"""
+        return calculate_trade_stats(self.trades)
@@ -8,13 +8,102 @@
 """
 
 import math
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
 
+import numpy as np
 from loguru import logger
 
 import backtrader as bt  # type: ignore
 
 from ..models.backtest_models import BacktestFactorConfig, BacktestMode
 
+# 批量信号计算时每个线程处理的股票数量
+SIGNAL_CHUNK_SIZE = 4096
+
+
+def _composite_signal_kernel(
+    values: np.ndarray, present: np.ndarray, weights: np.ndarray
+) -> np.ndarray:
+    """按股票×因子矩阵计算综合信号
+
+    Args:
+        values: 因子值矩阵，缺失或非数值为NaN
+        present: 因子是否存在的掩码矩阵
+        weights: 因子权重向量
+
+    Returns:
+        每只股票的综合信号值 (0-1之间)
+    """
+    with np.errstate(over='ignore', invalid='ignore', divide='ignore'):
+        exp_neg = np.exp(-values)
+        # 与_normalize_factor_value一致：非数值、NaN、无穷大或溢出时取中性值0.5
+        normalized = np.where(
+            np.isfinite(values) & np.isfinite(exp_neg), 1.0 / (1.0 + exp_neg), 0.5
+        )
+
+        effective_weights = np.where(present, weights, 0.0)
+        total_weight = effective_weights.sum(axis=1)
+        weighted_sum = (normalized * effective_weights).sum(axis=1)
+        composite = np.where(total_weight > 0, weighted_sum / total_weight, 0.5)
+
+    return np.clip(composite, 0.0, 1.0)
+
+
+def calculate_composite_signals(
+    stock_factors: dict[str, dict[str, Any]],
+    factor_weights: dict[str, float],
+    max_workers: int | None = None,
+) -> dict[str, float]:
+    """批量计算多只股票的综合因子信号
+
+    计算口径与FactorStrategy单股票信号一致，股票数量超过SIGNAL_CHUNK_SIZE时
+    按块分派到线程池并行计算
+
+    Args:
+        stock_factors: 股票代码到当期因子值的映射
+        factor_weights: 因子权重映射
+        max_workers: 最大线程数，默认为CPU核数
+
+    Returns:
+        股票代码到综合信号值的映射
+    """
+    stock_codes = list(stock_factors)
+    if not stock_codes:
+        return {}
+
+    factor_names = list(factor_weights)
+    weights = np.fromiter(factor_weights.values(), dtype=np.float64, count=len(factor_names))
+    values = np.full((len(stock_codes), len(factor_names)), np.nan)
+    present = np.zeros(values.shape, dtype=bool)
+
+    for i, stock_code in enumerate(stock_codes):
+        current_factors = stock_factors[stock_code] or {}
+        for j, factor_name in enumerate(factor_names):
+            if factor_name in current_factors:
+                present[i, j] = True
+                value = current_factors[factor_name]
+                if isinstance(value, int | float):
+                    values[i, j] = value
+
+    signals = np.empty(len(stock_codes))
+
+    def _process_chunk(start: int) -> None:
+        stop = start + SIGNAL_CHUNK_SIZE
+        signals[start:stop] = _composite_signal_kernel(
+            values[start:stop], present[start:stop], weights
+        )
+
+    chunk_starts = range(0, len(stock_codes), SIGNAL_CHUNK_SIZE)
+    if len(chunk_starts) == 1:
+        _process_chunk(0)
+    else:
+        with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+            list(executor.map(_process_chunk, chunk_starts))
+
+    return dict(zip(stock_codes, signals.tolist(), strict=True))
+
 
 class FactorStrategy(bt.Strategy):
     """基于因子组合的交易策略
@@ -126,7 +215,8 @@ class FactorStrategy(bt.Strategy):
             标准化后的值 (0-1之间)
         """
         # 简单的标准化方法，可以根据具体因子类型优化
-        if value is None or not isinstance(value, int | float):
+        # NaN和无穷大与缺失值一样取中性值，与批量计算calculate_composite_signals保持一致
+        if value is None or not isinstance(value, int | float) or not math.isfinite(value):
             normalized = 0.5
         else:
             # 使用sigmoid函数进行标准化
@@ -3,14 +3,33 @@
 本模块实现了任务管理的核心功能，包括任务创建、状态查询、任务取消等操作。
 """
 
+import re
 from loguru import logger
-from datetime import datetime
+from datetime import date, datetime
 from typing import Any
-from uuid import uuid4
 
-from ...utils.exceptions import DataNotFoundError, ValidationException
-from ..dao.task_dao import TaskDAO
-from ..models.task_models import TaskInfo, TaskRequest, TaskStatus
+from ...config.connection_pool import get_redis_connection
+from ...utils.exceptions import ConcurrentUpdateError, DataNotFoundError, ValidationException
+from ..dao.task_dao import MAX_PAGE_SIZE, TaskDAO
+from ..models.task_models import (
+    TaskInfo,
+    TaskRequest,
+    TaskStatus,
+    generate_batch_id,
+    generate_task_id,
+)
+
+# 新任务通知频道，任务调度器订阅该频道以便及时拉取pending任务
+PENDING_TASK_CHANNEL = "backtest:pending_task"
+
+# 允许取消的任务状态
+CANCELLABLE_STATUSES = tuple(
+    status for status in TaskStatus if status.can_transition_to(TaskStatus.CANCELLED)
+)
+
+# 任务请求的日期格式（YYYY-MM-DD）和股票代码格式（6位数字.SH/.SZ）
+_DATE_RE = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+_STOCK_CODE_RE = re.compile(r'^\d{6}\.(SH|SZ)$')
 
 
 class TaskManager:
@@ -46,7 +65,7 @@ class TaskManager:
             ValidationException: 参数验证失败
         """
         try:
-            logger.info(f"开始创建任务: {request.task_name}")
+            logger.info("开始创建任务: {}", request.task_name)
 
             # 基本参数验证
             await self._validate_task_request(request)
@@ -66,11 +85,14 @@ class TaskManager:
             task_dao = await self._get_task_dao()
             await task_dao.save_task(task_info)
 
-            logger.info(f"任务创建成功: {task_id}")
+            # 通知调度器有新任务
+            await self._notify_pending_task(task_id)
+
+            logger.info("任务创建成功: {}", task_id)
             return task_info
 
         except Exception as e:
-            logger.error(f"创建任务失败: {str(e)}")
+            logger.error("创建任务失败: {}", e)
             raise ValidationException(f"创建任务失败: {str(e)}") from e
 
     async def get_task_status(self, task_id: str) -> TaskInfo:
@@ -98,12 +120,15 @@ class TaskManager:
         except DataNotFoundError:
             raise
         except Exception as e:
-            logger.error(f"获取任务状态失败: {str(e)}")
+            logger.error("获取任务状态失败: {}", e)
             raise
 
     async def cancel_task(self, task_id: str) -> bool:
         """取消任务
 
+        以单条带状态条件的UPDATE完成校验和取消，仅在更新未命中时
+        再查询任务以区分任务不存在和状态不允许取消
+
         Args:
             task_id: 任务ID
 
@@ -116,59 +141,57 @@ class TaskManager:
         """
         try:
             task_dao = await self._get_task_dao()
-            db_task = await task_dao.get_by_id(task_id)
-
-            if not db_task:
-                raise DataNotFoundError(f"任务不存在: {task_id}")
-
-            current_status = TaskStatus(db_task.status)
-
-            # 检查是否可以取消
-            if not current_status.can_transition_to(TaskStatus.CANCELLED):
-                raise ValidationException(f"任务状态 {current_status.value} 不允许取消")
-
-            # 更新状态为已取消
-            success = await task_dao.update_task_status(
-                task_id=task_id,
-                status=TaskStatus.CANCELLED,
-                error_message="任务已被用户取消"
-            )
 
-            if success:
-                logger.info(f"任务已取消: {task_id}")
-            else:
-                logger.error(f"取消任务失败: {task_id}")
-
-            return success
+            try:
+                await task_dao.update_task_status(
+                    task_id=task_id,
+                    status=TaskStatus.CANCELLED,
+                    error_message="任务已被用户取消",
+                    expected_status=CANCELLABLE_STATUSES
+                )
+            except ConcurrentUpdateError:
+                db_task = await task_dao.get_by_id(task_id)
+                if not db_task:
+                    raise DataNotFoundError(f"任务不存在: {task_id}") from None
+                raise ValidationException(f"任务状态 {db_task.status} 不允许取消") from None
+
+            logger.info("任务已取消: {}", task_id)
+            return True
 
         except (DataNotFoundError, ValidationException):
             raise
         except Exception as e:
-            logger.error(f"取消任务失败: {str(e)}")
+            logger.error("取消任务失败: {}", e)
             raise
 
-    async def get_tasks_by_batch(self, batch_id: str) -> list[TaskInfo]:
-        """根据批次ID获取任务列表
+    async def get_tasks_by_batch(self, batch_id: str, skip: int = 0, limit: int = 500,
+                                 cursor: str | None = None) -> list[TaskInfo]:
+        """根据批次ID分页获取任务列表
 
         Args:
             batch_id: 批次ID
+            skip: 跳过的记录数
+            limit: 限制返回的记录数
+            cursor: 键集分页游标，取上一页返回的next_cursor，不能与skip同时使用
 
         Returns:
             任务信息列表
+
+        Raises:
+            ValidationException: 分页参数无效
         """
+        after = self._parse_cursor(skip, limit, cursor)
+
         try:
             task_dao = await self._get_task_dao()
-            db_tasks = await task_dao.get_tasks_by_batch(batch_id)
-
-            task_infos = []
-            for db_task in db_tasks:
-                task_info = await task_dao.convert_to_task_info(db_task)
-                task_infos.append(task_info)
+            db_tasks = await task_dao.get_tasks_by_batch(
+                batch_id, skip=skip, limit=limit, cursor=after
+            )
 
-            return task_infos
+            return await task_dao.convert_many_to_task_info(db_tasks)
 
         except Exception as e:
-            logger.error(f"获取批次任务失败: {str(e)}")
+            logger.error("获取批次任务失败: {}", e)
             raise
 
     async def get_task_result(self, task_id: str) -> dict[str, Any]:
@@ -207,12 +230,13 @@ class TaskManager:
         except DataNotFoundError:
             raise
         except Exception as e:
-            logger.error(f"获取任务结果失败: {str(e)}")
+            logger.error("获取任务结果失败: {}", e)
             raise
 
     async def list_tasks(self, status: TaskStatus | None = None,
                         batch_id: str | None = None,
-                        skip: int = 0, limit: int = 100) -> list[TaskInfo]:
+                        skip: int = 0, limit: int = 100,
+                        cursor: str | None = None) -> list[TaskInfo]:
         """列表查询任务
 
         Args:
@@ -220,30 +244,33 @@ class TaskManager:
             batch_id: 批次ID过滤
             skip: 跳过的记录数
             limit: 限制返回的记录数
+            cursor: 键集分页游标，取上一页返回的next_cursor，不能与skip同时使用
 
         Returns:
             任务信息列表
+
+        Raises:
+            ValidationException: 分页参数无效
         """
+        after = self._parse_cursor(skip, limit, cursor)
+
         try:
             task_dao = await self._get_task_dao()
 
-            filters = {}
+            filters: dict[str, Any] = {}
             if status:
                 filters['status'] = status.value
             if batch_id:
                 filters['batch_id'] = batch_id
+            if after:
+                filters['cursor'] = after
 
             db_tasks = await task_dao.list_objects(skip=skip, limit=limit, **filters)
 
-            task_infos = []
-            for db_task in db_tasks:
-                task_info = await task_dao.convert_to_task_info(db_task)
-                task_infos.append(task_info)
-
-            return task_infos
+            return await task_dao.convert_many_to_task_info(db_tasks)
 
         except Exception as e:
-            logger.error(f"列表查询任务失败: {str(e)}")
+            logger.error("列表查询任务失败: {}", e)
             raise
 
     async def _validate_task_request(self, request: TaskRequest) -> None:
@@ -256,38 +283,92 @@ class TaskManager:
             ValidationException: 验证失败
         """
         # 验证日期格式和范围
-        try:
-            start_date = datetime.strptime(request.start_date, '%Y-%m-%d')
-            end_date = datetime.strptime(request.end_date, '%Y-%m-%d')
-
-            if end_date <= start_date:
-                raise ValidationException("结束日期必须大于开始日期")
-
-            # 检查日期不能是未来日期
-            today = datetime.now().date()
-            if end_date.date() > today:
-                raise ValidationException("结束日期不能是未来日期")
+        if not (_DATE_RE.match(request.start_date) and _DATE_RE.match(request.end_date)):
+            raise ValidationException("日期格式错误，应为YYYY-MM-DD")
 
+        try:
+            start_date = date.fromisoformat(request.start_date)
+            end_date = date.fromisoformat(request.end_date)
         except ValueError as e:
             raise ValidationException(f"日期格式错误: {str(e)}") from e
 
+        if end_date <= start_date:
+            raise ValidationException("结束日期必须大于开始日期")
+
+        # 检查日期不能是未来日期
+        if end_date > date.today():
+            raise ValidationException("结束日期不能是未来日期")
+
         # 验证股票代码格式
-        if not request.stock_code or len(request.stock_code) != 9:
+        if not request.stock_code or not _STOCK_CODE_RE.match(request.stock_code):
             raise ValidationException("股票代码格式错误，应为6位数字.SH或.SZ")
 
         # 验证初始资金
         if request.initial_capital <= 0:
             raise ValidationException("初始资金必须大于0")
 
+    async def _notify_pending_task(self, task_id: str) -> None:
+        """发布新任务通知
+
+        通知失败不影响任务创建，调度器仍会定时兜底扫描pending任务
+
+        Args:
+            task_id: 任务ID
+        """
+        try:
+            async with get_redis_connection() as redis_client:
+                await redis_client.publish(PENDING_TASK_CHANNEL, task_id)
+        except Exception as e:
+            logger.warning("发布新任务通知失败: {}, 错误: {}", task_id, e)
+
+    def _validate_pagination(self, skip: int, limit: int) -> None:
+        """验证分页参数
+
+        Args:
+            skip: 跳过的记录数
+            limit: 限制返回的记录数
+
+        Raises:
+            ValidationException: 验证失败
+        """
+        if skip < 0:
+            raise ValidationException("跳过的记录数不能为负数")
+
+        if not 1 <= limit <= MAX_PAGE_SIZE:
+            raise ValidationException(f"每页记录数必须在1-{MAX_PAGE_SIZE}之间")
+
+    def _parse_cursor(self, skip: int, limit: int, cursor: str | None) -> tuple[datetime, str] | None:
+        """验证分页参数并解析键集分页游标
+
+        Args:
+            skip: 跳过的记录数
+            limit: 限制返回的记录数
+            cursor: 分页游标，格式见TaskDAO.task_cursor
+
+        Returns:
+            (创建时间, 任务ID)，未传游标时为None
+
+        Raises:
+            ValidationException: 分页参数或游标无效
+        """
+        self._validate_pagination(skip, limit)
+        if not cursor:
+            return None
+
+        if skip:
+            raise ValidationException("skip不能与分页游标同时使用")
+        try:
+            return TaskDAO.parse_task_cursor(cursor)
+        except ValueError as e:
+            raise ValidationException(str(e)) from e
+
     def _generate_task_id(self) -> str:
         """生成任务ID
 
         Returns:
             任务ID
         """
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        uuid_part = uuid4().hex[:8]
-        return f"bt_{timestamp}_{uuid_part}"
+        return generate_task_id()
 
     def _generate_batch_id(self) -> str:
         """生成批次ID
@@ -295,9 +376,7 @@ class TaskManager:
         Returns:
             批次ID
         """
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        uuid_part = uuid4().hex[:8]
-        return f"batch_{timestamp}_{uuid_part}"
+        return generate_batch_id()
 
     async def close(self) -> None:
         """关闭资源"""
@@ -8,7 +8,6 @@ from decimal import Decimal
 from typing import Any
 
 from loguru import logger
-from redis import Redis
 
 from ..dao.task_dao import TaskDAO
 from ..models.backtest_models import (
@@ -19,10 +18,45 @@ from ..models.backtest_models import (
 from ..models.task_models import TaskInfo, TaskStatus
 from .backtest_engine import BacktestEngine
 from .factor_combination_manager import FactorCombinationManager
+from .task_manager import PENDING_TASK_CHANNEL
 from ...clients.tushare_client import TushareClient
-from ...config.connection_pool import get_db_session
-from ...factor_engine.dao.factor_dao import FactorDAO
+from ...config.redis import create_async_redis_client
 from ...factor_engine.services.factor_service import FactorService
+from ...utils.exceptions import ConcurrentUpdateError
+
+# 每轮调度从数据库拉取的pending任务上限
+PENDING_BATCH_SIZE = 50
+
+# 同时执行的任务数上限
+MAX_CONCURRENT_TASKS = 4
+
+# 未收到新任务通知时的兜底扫描间隔（秒）
+SCHEDULER_POLL_INTERVAL = 30
+
+# 通知订阅断开后的重连间隔（秒）
+LISTENER_RETRY_INTERVAL = 5
+
+
+def create_backtest_engine(db_session: Any = None) -> BacktestEngine:
+    """组装回测引擎及其依赖
+
+    因子服务通过FactorDAO的类方法按需访问数据库和缓存，每个调度器只需创建一次
+
+    Args:
+        db_session: 数据库会话
+
+    Returns:
+        BacktestEngine实例
+    """
+    data_client = TushareClient()
+    factor_service = FactorService(data_client)
+
+    return BacktestEngine(
+        factor_service=factor_service,
+        data_client=data_client,
+        db_session=db_session
+    )
+
 
 class TaskScheduler:
     """任务调度器
@@ -31,20 +65,34 @@ class TaskScheduler:
     采用FIFO队列调度策略，支持任务重试和错误处理。
     """
 
-    def __init__(self, retry_max_attempts: int = 3, db_session: Any = None) -> None:
+    def __init__(
+        self,
+        retry_max_attempts: int = 3,
+        db_session: Any = None,
+        backtest_engine: BacktestEngine | None = None,
+        factor_combination_manager: FactorCombinationManager | None = None,
+        task_dao: TaskDAO | None = None,
+    ) -> None:
         """初始化任务调度器
 
         Args:
             retry_max_attempts: 最大重试次数
             db_session: 数据库会话
+            backtest_engine: 回测引擎，为None时首次使用时创建
+            factor_combination_manager: 因子组合管理器，为None时首次使用时创建
+            task_dao: 任务DAO，为None时首次使用时创建
         """
         self.retry_max_attempts = retry_max_attempts
         self.db_session = db_session
-        self._task_dao: TaskDAO | None = None
+        self._task_dao = task_dao
         self._is_running = False
         self._scheduler_task: asyncio.Task[Any] | None = None
-        self._backtest_engine: BacktestEngine | None = None
-        self._factor_combination_manager: FactorCombinationManager | None = None
+        self._listener_task: asyncio.Task[Any] | None = None
+        self._wakeup_event = asyncio.Event()
+        self._backtest_engine = backtest_engine
+        self._factor_combination_manager = factor_combination_manager
+        # 当前批次预取的因子组合配置，键为因子组合ID
+        self._prefetched_combinations: dict[str, asyncio.Task[Any]] = {}
 
 
 
@@ -65,17 +113,7 @@ class TaskScheduler:
             BacktestEngine实例
         """
         if self._backtest_engine is None:
-            # 创建必要的依赖实例
-            data_client = TushareClient()
-            redis_client = Redis(host='localhost', port=6379, db=0, decode_responses=True)
-            factor_dao = FactorDAO(db_session=self.db_session, redis_client=redis_client)
-            factor_service = FactorService(factor_dao=factor_dao, data_client=data_client)
-
-            self._backtest_engine = BacktestEngine(
-                factor_service=factor_service,
-                data_client=data_client,
-                db_session=self.db_session
-            )
+            self._backtest_engine = create_backtest_engine(self.db_session)
         return self._backtest_engine
 
     async def _get_factor_combination_manager(self) -> FactorCombinationManager:
@@ -98,6 +136,7 @@ class TaskScheduler:
             self._is_running = True
             logger.info("正在创建调度器主循环任务...")
             self._scheduler_task = asyncio.create_task(self._scheduler_loop())
+            self._listener_task = asyncio.create_task(self._listen_pending_tasks())
             logger.info("任务调度器已启动")
             
             # 等待一小段时间确保调度器主循环启动
@@ -107,11 +146,11 @@ class TaskScheduler:
             if self._scheduler_task.done():
                 exception = self._scheduler_task.exception()
                 if exception:
-                    logger.error(f"调度器主循环启动失败: {exception}")
+                    logger.error("调度器主循环启动失败: {}", exception)
                     raise exception
                     
         except Exception as e:
-            logger.error(f"启动任务调度器失败: {e}")
+            logger.error("启动任务调度器失败: {}", e)
             self._is_running = False
             raise
 
@@ -122,115 +161,179 @@ class TaskScheduler:
 
         self._is_running = False
 
-        # 取消调度器主循环
-        if self._scheduler_task:
-            self._scheduler_task.cancel()
-            try:
-                await self._scheduler_task
-            except asyncio.CancelledError:
-                pass
+        # 取消调度器主循环和通知订阅
+        for task in (self._scheduler_task, self._listener_task):
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
 
         logger.info("任务调度器已停止")
 
-    async def cancel_task(self, task_id: str) -> bool:
-        """取消任务
-
-        Args:
-            task_id: 任务ID
-
-        Returns:
-            是否取消成功
-        """
-        try:
-            # 更新数据库中的任务状态
-            task_dao = await self._get_task_dao()
-            await task_dao.update_task_status(task_id, TaskStatus.CANCELLED)
-            logger.info(f"已取消任务: {task_id}")
-            return True
-
-        except Exception as e:
-            logger.error(f"取消任务失败: {str(e)}")
-            return False
-
     async def _scheduler_loop(self) -> None:
         """调度器主循环
 
-        每30秒检查一次数据库中的pending任务，逐个处理
+        收到新任务通知时立即处理pending任务，无通知时每30秒兜底扫描一次
         """
         try:
             logger.info("调度器主循环已启动")
         except Exception as e:
-            logger.error(f"调度器主循环启动时出错: {e}")
+            logger.error("调度器主循环启动时出错: {}", e)
             return
 
         while self._is_running:
             try:
+                # 处理前清除唤醒标记，处理期间到达的通知会触发下一轮
+                self._wakeup_event.clear()
+
                 # 从数据库查询pending任务并逐个处理
                 await self._process_pending_tasks()
 
-                # 等待30秒后进行下一轮检查
-                await asyncio.sleep(30)
+                # 等待新任务通知或兜底扫描超时
+                await self._wait_for_wakeup()
 
             except Exception as e:
-                logger.error(f"调度器循环出错: {str(e)}")
-                await asyncio.sleep(30)
+                logger.error("调度器循环出错: {}", e)
+                await asyncio.sleep(SCHEDULER_POLL_INTERVAL)
 
         logger.info("调度器主循环已退出")
 
+    async def _wait_for_wakeup(self) -> None:
+        """等待新任务通知，超时后返回以进行兜底扫描"""
+        try:
+            await asyncio.wait_for(self._wakeup_event.wait(), timeout=SCHEDULER_POLL_INTERVAL)
+        except TimeoutError:
+            pass
 
+    async def _listen_pending_tasks(self) -> None:
+        """订阅新任务通知，收到通知后唤醒调度器主循环"""
+        while self._is_running:
+            redis_client = create_async_redis_client()
+            try:
+                async with redis_client.pubsub() as pubsub:
+                    await pubsub.subscribe(PENDING_TASK_CHANNEL)
+                    logger.info("已订阅新任务通知: {}", PENDING_TASK_CHANNEL)
 
+                    async for message in pubsub.listen():
+                        if message.get('type') == 'message':
+                            self._wakeup_event.set()
 
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("新任务通知订阅中断，将依赖定时扫描: {}", e)
+                await asyncio.sleep(LISTENER_RETRY_INTERVAL)
+            finally:
+                await redis_client.aclose()
 
     async def _process_pending_tasks(self) -> None:
         """处理数据库中的pending任务
 
-        查询数据库中状态为pending的任务，按创建时间顺序逐个处理
+        原子地认领一批pending任务（置为running），再以有限并发执行，
+        多个调度器实例可同时运行而不会重复处理同一任务
         """
         logger.info("开始处理pending任务")
         try:
             task_dao = await self._get_task_dao()
-            pending_tasks = await task_dao.get_pending_tasks(limit=50)
+            claimed_tasks = await task_dao.claim_pending_tasks(limit=PENDING_BATCH_SIZE)
 
-            if not pending_tasks:
+            if not claimed_tasks:
                 logger.info("数据库中没有待执行任务")
                 return
 
-            logger.info(f"发现 {len(pending_tasks)} 个待执行任务")
+            logger.info("认领 {} 个待执行任务", len(claimed_tasks))
 
-            # 按创建时间顺序处理任务（FIFO）
-            for db_task in pending_tasks:
-                try:
-                    # 转换为任务信息
-                    task_info = await task_dao.convert_to_task_info(db_task)
+            # 预取本批任务的因子组合配置，与前面任务的执行重叠
+            await self._prefetch_inputs(claimed_tasks)
 
-                    # 更新任务状态为运行中
-                    await task_dao.update_task_status(task_info.task_id, TaskStatus.RUNNING)
+            semaphore = asyncio.Semaphore(MAX_CONCURRENT_TASKS)
 
-                    # 执行任务（集成BacktestEngine）
-                    logger.info(f"开始执行任务: {task_info.task_id}")
+            async def _run_with_limit(db_task: Any) -> None:
+                async with semaphore:
+                    await self._run_claimed_task(task_dao, db_task)
 
-                    # 在事务中执行回测任务和状态更新
-                    backtest_result_id = await self._execute_backtest_task_with_transaction(task_info)
+            await asyncio.gather(*(_run_with_limit(db_task) for db_task in claimed_tasks))
 
-                    logger.info(f"任务执行完成: {task_info.task_id}, 回测结果ID: {backtest_result_id}")
+        except Exception as e:
+            logger.error("处理pending任务失败: {}", e)
+        finally:
+            self._clear_prefetched_inputs()
 
-                except Exception as task_error:
-                    logger.error(f"处理任务失败: {task_info.task_id if 'task_info' in locals() else 'unknown'}, 错误: {str(task_error)}")
+    async def _prefetch_inputs(self, db_tasks: list[Any]) -> None:
+        """为一批已认领任务后台预取因子组合配置
 
-                    # 更新任务状态为失败
-                    if 'task_info' in locals():
-                        try:
-                            await task_dao.update_task_status(task_info.task_id, TaskStatus.FAILED)
-                        except Exception:
-                            logger.error(f"更新任务失败状态时出错: {task_info.task_id}")
+        Args:
+            db_tasks: 已认领的数据库任务对象列表
+        """
+        factor_manager = await self._get_factor_combination_manager()
 
-        except Exception as e:
-            logger.error(f"处理pending任务失败: {str(e)}")
+        for db_task in db_tasks:
+            combination_id = (db_task.config or {}).get('factor_combination_id')
+            if combination_id and combination_id not in self._prefetched_combinations:
+                self._prefetched_combinations[combination_id] = asyncio.create_task(
+                    factor_manager.get_combination(combination_id)
+                )
+
+        if self._prefetched_combinations:
+            logger.debug("预取因子组合配置: {} 个", len(self._prefetched_combinations))
+
+    def _clear_prefetched_inputs(self) -> None:
+        """清理本批次的预取结果，取消仍未完成的预取"""
+        for prefetch in self._prefetched_combinations.values():
+            prefetch.cancel()
+        self._prefetched_combinations.clear()
+
+    async def _get_factor_combination(self, combination_id: str) -> Any:
+        """获取因子组合配置，优先使用预取结果
+
+        Args:
+            combination_id: 因子组合ID
+
+        Returns:
+            因子组合配置，不存在时为None
+        """
+        prefetch = self._prefetched_combinations.get(combination_id)
+        if prefetch is not None:
+            return await prefetch
+
+        factor_manager = await self._get_factor_combination_manager()
+        return await factor_manager.get_combination(combination_id)
+
+    async def _run_claimed_task(self, task_dao: TaskDAO, db_task: Any) -> None:
+        """执行一个已认领的任务
+
+        Args:
+            task_dao: 任务DAO
+            db_task: 已置为running的数据库任务对象
+        """
+        task_info: TaskInfo | None = None
+        try:
+            # 转换为任务信息
+            task_info = await task_dao.convert_to_task_info(db_task)
+
+            # 执行任务（集成BacktestEngine）
+            logger.info("开始执行任务: {}", task_info.task_id)
+
+            # 在事务中执行回测任务和状态更新
+            backtest_result_id = await self._execute_backtest_task_with_transaction(task_info)
+
+            logger.info("任务执行完成: {}, 回测结果ID: {}", task_info.task_id, backtest_result_id)
+
+        except Exception as task_error:
+            task_id = task_info.task_id if task_info else str(db_task.id)
+            logger.error("处理任务失败: {}, 错误: {}", task_id, task_error)
+
+            # 任务开始执行后的失败已由执行流程写入，这里只处理执行前的失败
+            if task_info is None:
+                await self._fail_task(task_dao, task_id, str(task_error))
 
     async def _execute_backtest_task_with_transaction(self, task_info: 'TaskInfo') -> str:
-        """在事务中执行回测任务
+        """执行回测任务并写回最终状态
 
-        确保任务状态更新与回测结果保存的事务一致性
+        完成/失败状态各以一条带状态与版本号条件的UPDATE写入，
+        不再为每个任务额外占用一个数据库会话
 
         Args:
             task_info: 任务信息
@@ -241,44 +344,49 @@ class TaskScheduler:
         Raises:
             Exception: 回测执行失败时抛出异常
         """
-        
+        task_dao = await self._get_task_dao()
 
-        async with get_db_session() as session:
-            try:
-                # 在事务中执行回测任务
-                backtest_result_id = await self._execute_backtest_task(task_info)
+        try:
+            backtest_result_id = await self._execute_backtest_task(task_info)
 
-                # 在同一事务中更新任务状态为已完成
-                task_dao = await self._get_task_dao()
+            # 更新任务状态为已完成（版本号不匹配说明任务已被取消等并发操作修改）
+            try:
                 await task_dao.update_task_status(
                     task_info.task_id,
                     TaskStatus.COMPLETED,
-                    result_id=backtest_result_id
+                    result_id=backtest_result_id,
+                    expected_version=task_info.version,
+                    expected_status=TaskStatus.RUNNING
                 )
+                logger.info("任务 {} 状态已更新为已完成", task_info.task_id)
+            except ConcurrentUpdateError:
+                logger.warning("任务状态已被并发修改，跳过完成状态更新: {}", task_info.task_id)
 
-                # 提交事务
-                await session.commit()
-                logger.info(f"事务提交成功: 任务 {task_info.task_id} 状态已更新")
+            return backtest_result_id
 
-                return backtest_result_id
-
-            except Exception as e:
-                # 回滚事务
-                await session.rollback()
-                logger.error(f"事务回滚: 任务 {task_info.task_id} 执行失败, 错误: {str(e)}")
+        except Exception as e:
+            logger.error("任务执行失败: {}, 错误: {}", task_info.task_id, e)
+            await self._fail_task(task_dao, task_info.task_id, str(e), task_info.version)
+            raise
 
-                # 更新任务状态为失败（在新的事务中）
-                try:
-                    task_dao = await self._get_task_dao()
-                    await task_dao.update_task_status(
-                        task_info.task_id,
-                        TaskStatus.FAILED,
-                        error_message=str(e)
-                    )
-                except Exception as update_error:
-                    logger.error(f"更新任务失败状态时出错: {task_info.task_id}, 错误: {str(update_error)}")
+    async def _fail_task(self, task_dao: TaskDAO, task_id: str, error_message: str,
+                         expected_version: int | None = None) -> None:
+        """将运行中的任务标记为失败，任务已被取消等情况下跳过
 
-                raise
+        Args:
+            task_dao: 任务DAO
+            task_id: 任务ID
+            error_message: 错误信息
+            expected_version: 期望的当前版本号
+        """
+        try:
+            failed = await task_dao.fail_task(
+                task_id, error_message, expected_version=expected_version
+            )
+            if not failed:
+                logger.warning("任务已不在运行状态，跳过失败状态更新: {}", task_id)
+        except Exception as update_error:
+            logger.error("更新任务失败状态时出错: {}, 错误: {}", task_id, update_error)
 
     async def _execute_backtest_task(self, task_info: 'TaskInfo') -> str:
         """执行回测任务
@@ -295,16 +403,14 @@ class TaskScheduler:
         try:
             # 获取服务实例
             backtest_engine = await self._get_backtest_engine()
-            factor_manager = await self._get_factor_combination_manager()
-            task_dao = await self._get_task_dao()
 
             # 获取因子组合配置
             factor_combination = None
             if task_info.factor_combination_id:
-                factor_combination = await factor_manager.get_combination(
+                factor_combination = await self._get_factor_combination(
                     task_info.factor_combination_id
                 )
-                logger.info(f"获取因子组合配置: {task_info.factor_combination_id}")
+                logger.info("获取因子组合配置: {}", task_info.factor_combination_id)
 
             # 构建回测配置
             # 构建BacktestFactorConfig
@@ -340,7 +446,7 @@ class TaskScheduler:
                 optimization_result_id=None
             )
 
-            logger.info(f"开始执行回测: {task_info.task_id}")
+            logger.info("开始执行回测: {}", task_info.task_id)
 
             # 执行回测
             backtest_result = await backtest_engine.run_backtest(backtest_config)
@@ -350,13 +456,11 @@ class TaskScheduler:
             if not result_id:
                 raise ValueError("回测引擎未返回有效的结果ID")
 
-            logger.info(f"回测任务执行成功: {task_info.task_id}, 结果ID: {result_id}")
+            logger.info("回测任务执行成功: {}, 结果ID: {}", task_info.task_id, result_id)
             return str(result_id)
 
         except Exception as e:
-            logger.error(f"回测任务执行失败: {task_info.task_id}, 错误: {str(e)}")
-            # 更新任务错误信息
-            await task_dao.update_task_error(task_info.task_id, str(e))
+            logger.error("回测任务执行失败: {}, 错误: {}", task_info.task_id, e)
             raise
 
     async def get_scheduler_status(self) -> dict[str, Any]:
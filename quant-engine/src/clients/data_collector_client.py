@@ -1,37 +1,202 @@
 """data-collector服务HTTP客户端"""
 
+import asyncio
+import importlib.util
+import time
+from collections import OrderedDict
 from typing import Any
 
 import httpx
 from loguru import logger
 
 from ..config.settings import settings
+from ..utils.exceptions import DataCollectorException
+from ..utils.json_codec import json_loads
+
+# 进程内共享的HTTP客户端，复用连接池、TLS会话和DNS解析结果
+_shared_client: httpx.AsyncClient | None = None
+_shared_client_lock = asyncio.Lock()
+
+# HTTP/2依赖h2包（httpx[http2]），未安装时回退到HTTP/1.1连接池
+HTTP2_ENABLED = importlib.util.find_spec("h2") is not None
+
+# 批量请求的最大并发数
+BATCH_CONCURRENCY = 20
+
+# get_bundle支持的数据类型
+BUNDLE_DATA_TYPES = frozenset({"stock", "financial", "market", "news"})
+
+# 可缓存的只读接口，结果在缓存有效期内视为不变
+CACHEABLE_ENDPOINTS = frozenset({"/api/v1/stock/data", "/api/v1/financial/data"})
+RESPONSE_CACHE_MAXSIZE = 10_000
+
+CacheKey = tuple[str, tuple[tuple[str, Any], ...]]
+
+
+class _ResponseCache:
+    """带过期时间的LRU响应缓存
+
+    仅在事件循环线程内访问，字典操作之间没有await，因此无需加锁
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[CacheKey, tuple[float, Any]] = OrderedDict()
+
+    @staticmethod
+    def make_key(endpoint: str, params: dict[str, Any] | None) -> CacheKey:
+        """按接口路径和排序后的参数生成缓存键"""
+        return endpoint, tuple(sorted((params or {}).items()))
+
+    def get(self, key: CacheKey) -> Any | None:
+        """读取缓存，过期或不存在时返回None"""
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return None
+
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: CacheKey, value: Any) -> None:
+        """写入缓存，超过容量时淘汰最久未使用的条目"""
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """清空缓存"""
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+_response_cache = _ResponseCache(RESPONSE_CACHE_MAXSIZE, settings.cache_ttl)
+
+# 健康检查结果缓存时间（秒）
+HEALTH_CHECK_CACHE_TTL = 5
+_health_cache = _ResponseCache(maxsize=1, ttl=HEALTH_CHECK_CACHE_TTL)
+
+# 熔断器参数：连续失败次数阈值和熔断后的恢复等待时间（秒）
+CIRCUIT_FAILURE_THRESHOLD = 5
+CIRCUIT_RESET_TIMEOUT = 30
+
+
+class _CircuitBreaker:
+    """熔断器
+
+    连续失败达到阈值后打开熔断，直接拒绝请求；等待恢复时间后放行一次试探请求
+    （同时重新计时，期间其余请求仍被拒绝），试探成功则关闭，失败则继续熔断。
+    仅在事件循环线程内访问，状态切换无需加锁
+    """
+
+    def __init__(self, failure_threshold: int, reset_timeout: float) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: float | None = None
+
+    @property
+    def is_open(self) -> bool:
+        """熔断是否处于打开状态"""
+        return self._opened_at is not None
+
+    def before_request(self) -> None:
+        """请求前检查，熔断期间抛出DataCollectorException"""
+        if self._opened_at is None:
+            return
+
+        now = time.monotonic()
+        if now - self._opened_at < self.reset_timeout:
+            raise DataCollectorException(
+                "data-collector服务熔断中，暂停请求",
+                details={"failures": self._failures, "reset_timeout": self.reset_timeout},
+            )
+
+        # 放行本次试探请求，并重新计时以拒绝其余请求
+        self._opened_at = now
+
+    def record_success(self) -> None:
+        """记录成功请求，关闭熔断"""
+        self._failures = 0
+        self._opened_at = None
+
+    def record_failure(self) -> None:
+        """记录失败请求，达到阈值或试探失败时打开熔断"""
+        self._failures += 1
+        if self._opened_at is None and self._failures < self.failure_threshold:
+            return
+
+        if self._opened_at is None:
+            logger.warning(f"data-collector服务连续失败 {self._failures} 次，熔断 {self.reset_timeout} 秒")
+        self._opened_at = time.monotonic()
+
+
+_circuit_breaker = _CircuitBreaker(CIRCUIT_FAILURE_THRESHOLD, CIRCUIT_RESET_TIMEOUT)
+
+
+async def _get_shared_client() -> httpx.AsyncClient:
+    """获取进程内共享的HTTP客户端（首次调用时创建）"""
+    global _shared_client
+
+    if _shared_client is None or _shared_client.is_closed:
+        async with _shared_client_lock:
+            if _shared_client is None or _shared_client.is_closed:
+                _shared_client = httpx.AsyncClient(
+                    base_url=settings.data_collector_base_url,
+                    timeout=settings.data_collector_timeout,
+                    limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+                    http2=HTTP2_ENABLED,
+                    headers={
+                        "Content-Type": "application/json",
+                        "User-Agent": f"{settings.app_name}/{settings.app_version}",
+                    },
+                )
+                logger.info("data-collector HTTP客户端已创建")
+
+    return _shared_client
+
+
+async def close_data_collector_client() -> None:
+    """关闭共享的HTTP客户端，应用关闭时调用"""
+    global _shared_client
+
+    if _shared_client is not None:
+        await _shared_client.aclose()
+        _shared_client = None
+        logger.info("data-collector HTTP客户端已关闭")
+
+
+def clear_data_collector_cache() -> None:
+    """清空data-collector响应缓存"""
+    _response_cache.clear()
+    _health_cache.clear()
 
 
 class DataCollectorClient:
-    """data-collector服务客户端"""
+    """data-collector服务客户端
+
+    所有实例共享同一个HTTP连接池，可直接调用，也兼容async with用法
+    """
 
     def __init__(self) -> None:
         self.base_url = settings.data_collector_base_url
         self.timeout = settings.data_collector_timeout
-        self._client: httpx.AsyncClient | None = None
 
     async def __aenter__(self) -> "DataCollectorClient":
         """异步上下文管理器入口"""
-        self._client = httpx.AsyncClient(
-            base_url=self.base_url,
-            timeout=self.timeout,
-            headers={
-                "Content-Type": "application/json",
-                "User-Agent": f"{settings.app_name}/{settings.app_version}",
-            },
-        )
+        await _get_shared_client()
         return self
 
     async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
-        """异步上下文管理器退出"""
-        if self._client:
-            await self._client.aclose()
+        """异步上下文管理器退出（共享连接池由应用统一关闭）"""
 
     async def _request(
         self,
@@ -40,26 +205,49 @@ class DataCollectorClient:
         params: dict[str, Any] | None = None,
         json_data: dict[str, Any] | None = None,
     ) -> Any:
-        """通用请求方法"""
-        if not self._client:
-            raise RuntimeError("客户端未初始化，请使用async with语句")
+        """通用请求方法
+
+        只读接口的GET请求优先命中响应缓存；连接失败和5xx响应计入熔断器，
+        熔断期间直接抛出DataCollectorException
+        """
+        cache_key = None
+        if method == "GET" and endpoint in CACHEABLE_ENDPOINTS:
+            cache_key = _response_cache.make_key(endpoint, params)
+            cached = _response_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        _circuit_breaker.before_request()
+        client = await _get_shared_client()
 
         try:
-            response = await self._client.request(
+            response = await client.request(
                 method=method, url=endpoint, params=params, json=json_data
             )
             response.raise_for_status()
-            return response.json()
+            # 直接解析响应字节，比response.json()少一次解码和字符串拷贝
+            result = json_loads(response.content)
         except httpx.HTTPStatusError as e:
             logger.error(f"HTTP请求失败: {e.response.status_code} - {e.response.text}")
+            if e.response.is_server_error:
+                _circuit_breaker.record_failure()
+            else:
+                _circuit_breaker.record_success()
             raise
         except httpx.RequestError as e:
             logger.error(f"请求异常: {e}")
+            _circuit_breaker.record_failure()
             raise
         except Exception as e:
             logger.error(f"未知异常: {e}")
+            _circuit_breaker.record_failure()
             raise
 
+        _circuit_breaker.record_success()
+        if cache_key is not None:
+            _response_cache.set(cache_key, result)
+        return result
+
     async def get_stock_data(
         self, symbol: str, start_date: str | None = None, end_date: str | None = None
     ) -> Any:
@@ -141,14 +329,71 @@ class DataCollectorClient:
         result = await self._request("GET", "/api/v1/policy/data", params=params)
         return result.get("data", [])
 
+    async def get_bundle(self, symbol: str, needs: set[str]) -> dict[str, Any]:
+        """并发获取单只股票的多类数据
+
+        Args:
+            symbol: 股票代码
+            needs: 需要的数据类型，取值见BUNDLE_DATA_TYPES
+
+        Returns:
+            以数据类型为键的结果字典
+        """
+        unknown = needs - BUNDLE_DATA_TYPES
+        if unknown:
+            raise ValueError(f"不支持的数据类型: {sorted(unknown)}")
+
+        requests = {
+            "stock": lambda: self.get_stock_data(symbol),
+            "financial": lambda: self.get_financial_data(symbol),
+            "market": lambda: self.get_market_data(),
+            "news": lambda: self.get_news_data(symbol=symbol),
+        }
+        keys = [key for key in requests if key in needs]
+        results = await asyncio.gather(*(requests[key]() for key in keys))
+        return dict(zip(keys, results, strict=True))
+
+    async def get_stock_data_many(
+        self,
+        symbols: list[str],
+        start_date: str | None = None,
+        end_date: str | None = None,
+    ) -> dict[str, Any]:
+        """并发获取多只股票的数据，并发数受BATCH_CONCURRENCY限制
+
+        Args:
+            symbols: 股票代码列表
+            start_date: 开始日期
+            end_date: 结束日期
+
+        Returns:
+            以股票代码为键的结果字典
+        """
+        semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+
+        async def fetch(symbol: str) -> Any:
+            async with semaphore:
+                return await self.get_stock_data(symbol, start_date, end_date)
+
+        results = await asyncio.gather(*(fetch(symbol) for symbol in symbols))
+        return dict(zip(symbols, results, strict=True))
+
     async def health_check(self) -> Any:
-        """健康检查"""
+        """健康检查，结果缓存HEALTH_CHECK_CACHE_TTL秒"""
+        cache_key = _health_cache.make_key("/health", None)
+        cached = _health_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         try:
             result = await self._request("GET", "/health")
-            return result.get("status") == "ok"
+            healthy = result.get("status") == "ok"
         except Exception as e:
             logger.error(f"data-collector服务健康检查失败: {e}")
-            return False
+            healthy = False
+
+        _health_cache.set(cache_key, healthy)
+        return healthy
 
 
 # 全局客户端实例工厂
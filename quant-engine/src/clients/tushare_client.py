@@ -1,26 +1,190 @@
 """Tushare金融数据客户端"""
 
 import asyncio
-from collections.abc import Callable
-from typing import Any
-
+import hashlib
+import json
+from collections import namedtuple
+from collections.abc import Awaitable, Callable, Iterator, Sequence
+from functools import lru_cache
+from typing import Any, ClassVar, Final, overload
+
+import httpx
+import numpy as np
 import pandas as pd
-import tushare as ts  # type: ignore
+import redis.asyncio
 from loguru import logger
 
+from ..config.redis import async_redis_client
 from ..config.settings import settings
 from ..utils.exceptions import DataSourceError
+from ..utils.json_codec import json_dumps, json_loads
+
+# Tushare Pro HTTP接口地址
+TUSHARE_API_URL = "http://api.tushare.pro"
+
+# 各接口请求的返回字段
+_DAILY_FIELDS: Final[str] = "ts_code,trade_date,open,high,low,close,pre_close,change,pct_chg,vol,amount"
+_INCOME_FIELDS: Final[str] = "ts_code,ann_date,f_ann_date,end_date,report_type,comp_type,total_revenue,revenue,oper_profit,total_profit,n_income,n_income_attr_p"
+_BALANCESHEET_FIELDS: Final[str] = "ts_code,ann_date,f_ann_date,end_date,report_type,comp_type,total_assets,total_liab,total_hldr_eqy_exc_min_int,total_hldr_eqy_inc_min_int"
+_CASHFLOW_FIELDS: Final[str] = "ts_code,ann_date,f_ann_date,end_date,report_type,comp_type,net_profit,finan_exp,c_fr_sale_sg,recp_tax_rends,n_cashflow_act,c_paid_invest,c_disp_withdrwl_invest,n_cashflow_inv_act,c_recp_borrow,proc_issue_bonds,c_pay_dist_dpcp_int_exp,n_cashflow_fin_act,c_recp_cap_contrib,n_incr_cash_cash_equ"
+_FINA_INDICATOR_FIELDS: Final[str] = "ts_code,ann_date,end_date,eps,dt_eps,total_revenue_ps,revenue_ps,capital_rese_ps,surplus_rese_ps,undist_profit_ps,extra_item,profit_dedt,gross_margin,current_ratio,quick_ratio,cash_ratio,invturn_days,arturn_days,inv_turn,ar_turn,ca_turn,fa_turn,assets_turn,op_income,valuechange_income,interst_income,daa,ebit,ebitda,fcff,fcfe,current_exint,noncurrent_exint,interestdebt,netdebt,tangible_asset,working_capital,networking_capital,invest_capital,retained_earnings,diluted2_eps,bps,ocfps,retainedps,cfps,ebit_ps,fcff_ps,fcfe_ps,netprofit_margin,grossprofit_margin,cogs_of_sales,expense_of_sales,profit_to_gr,saleexp_to_gr,adminexp_of_gr,finaexp_of_gr,impai_ttm,gc_of_gr,op_of_gr,ebit_of_gr,roe,roe_waa,roe_dt,roa,npta,roic,roe_yearly,roa_yearly,roe_avg,opincome_of_ebt,investincome_of_ebt,n_op_profit_of_ebt,tax_to_ebt,dtprofit_to_profit,salescash_to_or,ocf_to_or,ocf_to_opincome,capitalized_to_da,debt_to_assets,assets_to_eqt,dp_assets_to_eqt,ca_to_assets,nca_to_assets,tbassets_to_totalassets,int_to_talcap,eqt_to_talcapital,currentdebt_to_debt,longdeb_to_debt,ocf_to_shortdebt,debt_to_eqt,eqt_to_debt,eqt_to_interestdebt,tangibleasset_to_debt,tangasset_to_intdebt,tangibleasset_to_netdebt,ocf_to_debt,ocf_to_interestdebt,ocf_to_netdebt,ebit_to_interest,longdebt_to_workingcapital,ebitda_to_debt,turn_days,roa_dp,fixed_assets,profit_prefin_exp,non_op_profit,op_to_ebt,nop_to_ebt,ocf_to_profit,cash_to_liqdebt,cash_to_liqdebt_withinterest,op_to_liqdebt,op_to_debt,roic_yearly,total_fa_trun,profit_to_op,q_opincome,q_investincome,q_dtprofit,q_eps,q_netprofit_margin,q_gsprofit_margin,q_exp_to_sales,q_profit_to_gr,q_saleexp_to_gr,q_adminexp_to_gr,q_finaexp_to_gr,q_impair_to_gr_ttm,q_gc_to_gr,q_op_to_gr,q_roe,q_dt_roe,q_npta,q_ocf_to_sales,q_ocf_to_or,basic_eps_yoy,dt_eps_yoy,cfps_yoy,op_yoy,ebt_yoy,netprofit_yoy,dt_netprofit_yoy,ocf_yoy,roe_yoy,bps_yoy,assets_yoy,eqt_yoy,tr_yoy,or_yoy,q_gr_yoy,q_gr_qoq,q_sales_yoy,q_sales_qoq,q_op_yoy,q_op_qoq,q_profit_yoy,q_profit_qoq,q_netprofit_yoy,q_netprofit_qoq,equity_yoy,rd_exp,update_flag"
+_FINA_INDICATOR_FIELDS_SET: Final[frozenset[str]] = frozenset(_FINA_INDICATOR_FIELDS.split(","))
+# 财务指标按需取字段时始终返回的标识字段
+_FINA_INDICATOR_KEY_FIELDS: Final[tuple[str, ...]] = ("ts_code", "ann_date", "end_date")
+
+# 进程内共享的HTTP客户端，所有TushareClient实例复用同一连接池
+_shared_client: httpx.AsyncClient | None = None
+_shared_client_lock = asyncio.Lock()
+
+# 接口响应缓存键前缀
+CACHE_KEY_PREFIX = "ts:"
+
+# 接口响应的Redis缓存客户端
+_cache_client: redis.asyncio.Redis = async_redis_client
+
+# 批量请求的并发上限，按Tushare账号限流，所有实例共享
+_request_semaphore = asyncio.Semaphore(settings.tushare_concurrency)
+
+
+async def _get_shared_client() -> httpx.AsyncClient:
+    """获取进程内共享的HTTP客户端（首次调用时创建）"""
+    global _shared_client
+
+    if _shared_client is None or _shared_client.is_closed:
+        async with _shared_client_lock:
+            if _shared_client is None or _shared_client.is_closed:
+                _shared_client = httpx.AsyncClient(
+                    timeout=settings.tushare_timeout,
+                    limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+                )
+                logger.info("Tushare HTTP客户端已创建")
+
+    return _shared_client
+
+
+def _make_cache_key(api_name: str, params: dict[str, Any], fields: str | None) -> str:
+    """根据接口名、参数和返回字段生成缓存键"""
+    raw = f"{api_name}|{json.dumps(params, sort_keys=True)}|{fields or ''}"
+    return CACHE_KEY_PREFIX + hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+
+async def close_tushare_client() -> None:
+    """关闭共享的HTTP客户端，应用关闭时调用"""
+    global _shared_client
+
+    if _shared_client is not None:
+        await _shared_client.aclose()
+        _shared_client = None
+        logger.info("Tushare HTTP客户端已关闭")
+
+
+@lru_cache(maxsize=64)
+def _row_type(name: str, fields: tuple[str, ...]) -> Any:
+    """获取命名元组行类型，相同接口字段的类型只创建一次
+
+    字段在运行时才确定，静态类型只能标注为Any
+    """
+    return namedtuple(name, fields)
+
+
+class ColumnarRecords(Sequence[dict[str, Any]]):
+    """按列存储的记录集合
+
+    保留接口返回的列式数据，按下标访问时才构建对应行的字典，
+    需要整列数据的调用方可直接使用columns或to_dataframe()
+    """
+
+    __slots__ = ('columns', '_length')
+
+    def __init__(self, columns: dict[str, list[Any]]) -> None:
+        self.columns = columns
+        self._length = len(next(iter(columns.values()))) if columns else 0
+
+    def __len__(self) -> int:
+        return self._length
+
+    @overload
+    def __getitem__(self, index: int) -> dict[str, Any]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[dict[str, Any]]: ...
+
+    def __getitem__(self, index: int | slice) -> dict[str, Any] | list[dict[str, Any]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._length))]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("记录下标越界")
+        return {name: values[index] for name, values in self.columns.items()}
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        names = list(self.columns)
+        for row in zip(*self.columns.values(), strict=True):
+            yield dict(zip(names, row, strict=True))
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, ColumnarRecords):
+            return self.columns == other.columns
+        if isinstance(other, list):
+            return list(self) == other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"ColumnarRecords(rows={self._length}, fields={list(self.columns)})"
+
+    def itertuples(self, name: str = "Record") -> Iterator[tuple[Any, ...]]:
+        """按行迭代命名元组
+
+        只读取少数字段的调用方可按属性访问，比逐行构建字典更省内存
+
+        Args:
+            name: 命名元组的类型名
+        """
+        row_type = _row_type(name, tuple(self.columns))
+        return map(row_type._make, zip(*self.columns.values(), strict=True))
+
+    def column_array(self, name: str, dtype: Any = np.float64) -> np.ndarray:
+        """将一列数据一次性转换为数值数组
+
+        None转换为NaN，适合对全市场数据做向量化计算
+
+        Args:
+            name: 字段名
+            dtype: 目标数值类型
+        """
+        return np.array(self.columns[name], dtype=dtype)
+
+    def to_dataframe(self, float_dtype: Any = None) -> pd.DataFrame:
+        """转换为DataFrame（按列构建，无需逐行转换）
+
+        Args:
+            float_dtype: 浮点列的目标类型，如np.float32。换手率、市盈率等比率字段
+                精度足够时可减半内存；总市值等大数值字段保持默认float64
+
+        Returns:
+            按列构建的DataFrame
+        """
+        frame = pd.DataFrame(self.columns)
+        if float_dtype is not None:
+            float_columns = frame.select_dtypes(include='float').columns
+            frame[float_columns] = frame[float_columns].astype(float_dtype)
+        return frame
 
 
 class TushareClient:
     """Tushare金融数据客户端
 
-    提供股票基本信息、日线数据、财务报表数据等金融数据获取功能
+    提供股票基本信息、日线数据、财务报表数据等金融数据获取功能。
+    直接以异步HTTP请求调用Tushare Pro接口，不占用线程池
     """
 
+    # 已通过连接测试的token，所有实例共享，新建实例时不再重复测试
+    _verified_token: ClassVar[str | None] = None
+    _verify_lock: ClassVar[asyncio.Lock] = asyncio.Lock()
+
     def __init__(self) -> None:
         """初始化Tushare客户端"""
-        self._api: Any | None = None
         self._initialized = False
 
     async def __aenter__(self) -> "TushareClient":
@@ -29,9 +193,7 @@ class TushareClient:
         return self
 
     async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
-        """异步上下文管理器退出"""
-        # Tushare客户端不需要特殊的清理操作
-        pass
+        """异步上下文管理器退出（共享连接池由应用统一关闭）"""
 
     async def initialize(self) -> None:
         """初始化Tushare API连接"""
@@ -39,14 +201,11 @@ class TushareClient:
             if not settings.tushare_token:
                 raise DataSourceError("Tushare token未配置")
 
-            # 设置token
-            ts.set_token(settings.tushare_token)
-
-            # 获取API实例
-            self._api = ts.pro_api()
-
-            # 测试连接
-            await self._test_connection()
+            # 测试连接，同一token只测试一次
+            async with TushareClient._verify_lock:
+                if TushareClient._verified_token != settings.tushare_token:
+                    await self._test_connection()
+                    TushareClient._verified_token = settings.tushare_token
 
             self._initialized = True
             logger.info("Tushare客户端初始化成功")
@@ -58,18 +217,11 @@ class TushareClient:
     async def _test_connection(self) -> None:
         """测试Tushare连接"""
         try:
-            # 获取交易日历测试连接
-            if self._api is None:
-                raise DataSourceError("API未初始化")
-            api = self._api  # 类型断言
-
-            # 直接调用API，不使用重试机制避免递归
-            loop = asyncio.get_event_loop()
-            result = await loop.run_in_executor(
-                None,
-                lambda: api.trade_cal(exchange='SSE', start_date='20240101', end_date='20240102')
+            # 获取交易日历测试连接，直接调用接口，不使用重试机制避免递归
+            result = await self._post(
+                'trade_cal', {'exchange': 'SSE', 'start_date': '20240101', 'end_date': '20240102'}
             )
-            if result is None or len(result) == 0:
+            if not result or not next(iter(result.values())):
                 raise DataSourceError("Tushare连接测试失败")
             logger.info("Tushare连接测试成功")
         except Exception as e:
@@ -81,30 +233,101 @@ class TushareClient:
             # 其他错误仍然抛出异常
             raise DataSourceError(f"Tushare连接测试失败: {e}") from e
 
-    async def _execute_with_retry(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
-        """带重试机制的API调用"""
+    async def _post(self, api_name: str, params: dict[str, Any],
+                    fields: str | None = None) -> dict[str, list[Any]]:
+        """调用一次Tushare Pro接口
+
+        Args:
+            api_name: 接口名称（如daily、income）
+            params: 接口参数
+            fields: 返回字段，逗号分隔
+
+        Returns:
+            按列组织的数据，键为字段名，值为该列的值列表
+        """
+        client = await _get_shared_client()
+        response = await client.post(
+            TUSHARE_API_URL,
+            content=json_dumps({
+                'api_name': api_name,
+                'token': settings.tushare_token,
+                'params': params,
+                'fields': fields or '',
+            }),
+            headers={'Content-Type': 'application/json'},
+        )
+        response.raise_for_status()
+        payload = json_loads(response.content)
+
+        if payload.get('code') != 0:
+            raise DataSourceError(f"Tushare接口{api_name}返回错误: {payload.get('msg')}")
+
+        data = payload.get('data') or {}
+        field_names: list[str] = data.get('fields') or []
+        items: list[list[Any]] = data.get('items') or []
+
+        # 行转列，避免逐行构建字典
+        columns = list(zip(*items, strict=True)) if items else [() for _ in field_names]
+        return {name: list(values) for name, values in zip(field_names, columns, strict=True)}
+
+    async def _call_api(self, api_name: str, fields: str | None = None,
+                        **params: Any) -> dict[str, list[Any]]:
+        """带重试机制的API调用
+
+        Args:
+            api_name: 接口名称
+            fields: 返回字段，逗号分隔
+            **params: 接口参数，值为None的参数不发送
+
+        Returns:
+            按列组织的数据
+        """
         if not self._initialized:
             await self.initialize()
 
+        params = {key: value for key, value in params.items() if value is not None}
+        cache_key = _make_cache_key(api_name, params, fields)
+
+        cached = await self._get_cached(cache_key)
+        if cached is not None:
+            return cached
+
+        # 重试参数在单次调用内只读取一次
+        retry_count = settings.tushare_retry_count
+        retry_delay = settings.tushare_retry_delay
         last_error = None
 
-        for attempt in range(settings.tushare_retry_count):
+        for attempt in range(retry_count):
             try:
-                # 在线程池中执行同步调用
-                loop = asyncio.get_event_loop()
-                result = await loop.run_in_executor(None, func, *args, **kwargs)
-                return result
+                columns = await self._post(api_name, params, fields)
+                await self._set_cached(cache_key, columns)
+                return columns
 
             except Exception as e:
                 last_error = e
-                logger.warning(f"Tushare API调用失败 (尝试 {attempt + 1}/{settings.tushare_retry_count}): {e}")
+                logger.warning("Tushare API调用失败 (尝试 {}/{}): {}", attempt + 1, retry_count, e)
 
-                if attempt < settings.tushare_retry_count - 1:
-                    await asyncio.sleep(settings.tushare_retry_delay)
+                if attempt < retry_count - 1:
+                    await asyncio.sleep(retry_delay)
 
-        raise DataSourceError(f"Tushare API调用失败，已重试{settings.tushare_retry_count}次: {last_error}")
+        raise DataSourceError(f"Tushare API调用失败，已重试{retry_count}次: {last_error}")
 
+    async def _get_cached(self, cache_key: str) -> dict[str, list[Any]] | None:
+        """读取缓存的接口响应，Redis不可用时视为未命中"""
+        try:
+            cached = await _cache_client.get(cache_key)
+        except Exception as e:
+            logger.warning(f"读取Tushare缓存失败: {e}")
+            return None
+
+        return json_loads(cached) if cached is not None else None
 
+    async def _set_cached(self, cache_key: str, columns: dict[str, list[Any]]) -> None:
+        """缓存接口响应，写入失败不影响本次调用"""
+        try:
+            await _cache_client.set(cache_key, json_dumps(columns), ex=settings.cache_ttl)
+        except Exception as e:
+            logger.warning(f"写入Tushare缓存失败: {e}")
 
     async def get_daily_data(self,
                            ts_code: str,
@@ -123,25 +346,26 @@ class TushareClient:
             包含日线数据的DataFrame
         """
         try:
-            if self._api is None:
-                raise DataSourceError("API未初始化")
-            api = self._api  # 类型断言
-            result = await self._execute_with_retry(
-                lambda: api.daily(
-                    ts_code=ts_code,
-                    start_date=start_date,
-                    end_date=end_date,
-                    limit=limit,
-                    fields='ts_code,trade_date,open,high,low,close,pre_close,change,pct_chg,vol,amount'
-                )
+            columns = await self._call_api(
+                'daily',
+                ts_code=ts_code,
+                start_date=start_date,
+                end_date=end_date,
+                limit=limit,
+                fields=_DAILY_FIELDS
             )
+            result = pd.DataFrame(columns)
 
-            if result is None or len(result) == 0:
+            if result.empty:
                 logger.warning(f"股票{ts_code}日线数据为空")
                 return pd.DataFrame()
 
-            # 按日期排序
-            result = result.sort_values('trade_date')
+            # 接口按交易日期倒序返回，直接反转为正序；顺序不符时才排序
+            trade_dates = result['trade_date']
+            if trade_dates.is_monotonic_decreasing:
+                result = result.iloc[::-1].reset_index(drop=True)
+            elif not trade_dates.is_monotonic_increasing:
+                result = result.sort_values('trade_date', ignore_index=True)
 
             logger.info(f"成功获取股票{ts_code}的{len(result)}条日线数据")
             return result
@@ -167,20 +391,17 @@ class TushareClient:
             包含利润表数据的DataFrame
         """
         try:
-            if self._api is None:
-                raise DataSourceError("API未初始化")
-            api = self._api  # 类型断言
-            result = await self._execute_with_retry(
-                lambda: api.income(
-                    ts_code=ts_code,
-                    start_date=start_date,
-                    end_date=end_date,
-                    period=period,
-                    fields='ts_code,ann_date,f_ann_date,end_date,report_type,comp_type,total_revenue,revenue,oper_profit,total_profit,n_income,n_income_attr_p'
-                )
+            columns = await self._call_api(
+                'income',
+                ts_code=ts_code,
+                start_date=start_date,
+                end_date=end_date,
+                period=period,
+                fields=_INCOME_FIELDS
             )
+            result = pd.DataFrame(columns)
 
-            if result is None or len(result) == 0:
+            if result.empty:
                 logger.warning(f"股票{ts_code}利润表数据为空")
                 return pd.DataFrame()
 
@@ -208,20 +429,17 @@ class TushareClient:
             包含资产负债表数据的DataFrame
         """
         try:
-            if self._api is None:
-                raise DataSourceError("API未初始化")
-            api = self._api  # 类型断言
-            result = await self._execute_with_retry(
-                lambda: api.balancesheet(
-                    ts_code=ts_code,
-                    start_date=start_date,
-                    end_date=end_date,
-                    period=period,
-                    fields='ts_code,ann_date,f_ann_date,end_date,report_type,comp_type,total_assets,total_liab,total_hldr_eqy_exc_min_int,total_hldr_eqy_inc_min_int'
-                )
+            columns = await self._call_api(
+                'balancesheet',
+                ts_code=ts_code,
+                start_date=start_date,
+                end_date=end_date,
+                period=period,
+                fields=_BALANCESHEET_FIELDS
             )
+            result = pd.DataFrame(columns)
 
-            if result is None or len(result) == 0:
+            if result.empty:
                 logger.warning(f"股票{ts_code}资产负债表数据为空")
                 return pd.DataFrame()
 
@@ -249,20 +467,17 @@ class TushareClient:
             包含现金流量表数据的DataFrame
         """
         try:
-            if self._api is None:
-                raise DataSourceError("API未初始化")
-            api = self._api  # 类型断言
-            result = await self._execute_with_retry(
-                lambda: api.cashflow(
-                    ts_code=ts_code,
-                    start_date=start_date,
-                    end_date=end_date,
-                    period=period,
-                    fields='ts_code,ann_date,f_ann_date,end_date,report_type,comp_type,net_profit,finan_exp,c_fr_sale_sg,recp_tax_rends,n_cashflow_act,c_paid_invest,c_disp_withdrwl_invest,n_cashflow_inv_act,c_recp_borrow,proc_issue_bonds,c_pay_dist_dpcp_int_exp,n_cashflow_fin_act,c_recp_cap_contrib,n_incr_cash_cash_equ'
-                )
+            columns = await self._call_api(
+                'cashflow',
+                ts_code=ts_code,
+                start_date=start_date,
+                end_date=end_date,
+                period=period,
+                fields=_CASHFLOW_FIELDS
             )
+            result = pd.DataFrame(columns)
 
-            if result is None or len(result) == 0:
+            if result.empty:
                 logger.warning(f"股票{ts_code}现金流量表数据为空")
                 return pd.DataFrame()
 
@@ -277,7 +492,8 @@ class TushareClient:
                                      ts_code: str,
                                      start_date: str | None = None,
                                      end_date: str | None = None,
-                                     period: str = 'A') -> Any:
+                                     period: str = 'A',
+                                     fields: list[str] | None = None) -> Any:
         """获取财务指标数据
 
         Args:
@@ -285,25 +501,33 @@ class TushareClient:
             start_date: 开始日期
             end_date: 结束日期
             period: 报告期类型 A年报 Q季报
+            fields: 需要的指标字段，为空时返回全部指标；ts_code、ann_date、end_date始终返回
 
         Returns:
             包含财务指标数据的DataFrame
+
+        Raises:
+            ValueError: 包含不支持的指标字段时抛出
         """
+        requested_fields = _FINA_INDICATOR_FIELDS
+        if fields:
+            unknown = set(fields) - _FINA_INDICATOR_FIELDS_SET
+            if unknown:
+                raise ValueError(f"不支持的财务指标字段: {sorted(unknown)}")
+            requested_fields = ",".join(dict.fromkeys((*_FINA_INDICATOR_KEY_FIELDS, *fields)))
+
         try:
-            if self._api is None:
-                raise DataSourceError("API未初始化")
-            api = self._api  # 类型断言
-            result = await self._execute_with_retry(
-                lambda: api.fina_indicator(
-                    ts_code=ts_code,
-                    start_date=start_date,
-                    end_date=end_date,
-                    period=period,
-                    fields='ts_code,ann_date,end_date,eps,dt_eps,total_revenue_ps,revenue_ps,capital_rese_ps,surplus_rese_ps,undist_profit_ps,extra_item,profit_dedt,gross_margin,current_ratio,quick_ratio,cash_ratio,invturn_days,arturn_days,inv_turn,ar_turn,ca_turn,fa_turn,assets_turn,op_income,valuechange_income,interst_income,daa,ebit,ebitda,fcff,fcfe,current_exint,noncurrent_exint,interestdebt,netdebt,tangible_asset,working_capital,networking_capital,invest_capital,retained_earnings,diluted2_eps,bps,ocfps,retainedps,cfps,ebit_ps,fcff_ps,fcfe_ps,netprofit_margin,grossprofit_margin,cogs_of_sales,expense_of_sales,profit_to_gr,saleexp_to_gr,adminexp_of_gr,finaexp_of_gr,impai_ttm,gc_of_gr,op_of_gr,ebit_of_gr,roe,roe_waa,roe_dt,roa,npta,roic,roe_yearly,roa_yearly,roe_avg,opincome_of_ebt,investincome_of_ebt,n_op_profit_of_ebt,tax_to_ebt,dtprofit_to_profit,salescash_to_or,ocf_to_or,ocf_to_opincome,capitalized_to_da,debt_to_assets,assets_to_eqt,dp_assets_to_eqt,ca_to_assets,nca_to_assets,tbassets_to_totalassets,int_to_talcap,eqt_to_talcapital,currentdebt_to_debt,longdeb_to_debt,ocf_to_shortdebt,debt_to_eqt,eqt_to_debt,eqt_to_interestdebt,tangibleasset_to_debt,tangasset_to_intdebt,tangibleasset_to_netdebt,ocf_to_debt,ocf_to_interestdebt,ocf_to_netdebt,ebit_to_interest,longdebt_to_workingcapital,ebitda_to_debt,turn_days,roa_yearly,roa_dp,fixed_assets,profit_prefin_exp,non_op_profit,op_to_ebt,nop_to_ebt,ocf_to_profit,cash_to_liqdebt,cash_to_liqdebt_withinterest,op_to_liqdebt,op_to_debt,roic_yearly,total_fa_trun,profit_to_op,q_opincome,q_investincome,q_dtprofit,q_eps,q_netprofit_margin,q_gsprofit_margin,q_exp_to_sales,q_profit_to_gr,q_saleexp_to_gr,q_adminexp_to_gr,q_finaexp_to_gr,q_impair_to_gr_ttm,q_gc_to_gr,q_op_to_gr,q_roe,q_dt_roe,q_npta,q_ocf_to_sales,q_ocf_to_or,basic_eps_yoy,dt_eps_yoy,cfps_yoy,op_yoy,ebt_yoy,netprofit_yoy,dt_netprofit_yoy,ocf_yoy,roe_yoy,bps_yoy,assets_yoy,eqt_yoy,tr_yoy,or_yoy,q_gr_yoy,q_gr_qoq,q_sales_yoy,q_sales_qoq,q_op_yoy,q_op_qoq,q_profit_yoy,q_profit_qoq,q_netprofit_yoy,q_netprofit_qoq,equity_yoy,rd_exp,update_flag'
-                )
+            columns = await self._call_api(
+                'fina_indicator',
+                ts_code=ts_code,
+                start_date=start_date,
+                end_date=end_date,
+                period=period,
+                fields=requested_fields
             )
+            result = pd.DataFrame(columns)
 
-            if result is None or len(result) == 0:
+            if result.empty:
                 logger.warning(f"股票{ts_code}财务指标数据为空")
                 return pd.DataFrame()
 
@@ -314,8 +538,57 @@ class TushareClient:
             logger.error(f"获取股票{ts_code}财务指标数据失败: {e}")
             raise DataSourceError(f"获取股票{ts_code}财务指标数据失败: {e}") from e
 
+    async def _fetch_batch(self, fetch: Callable[..., Awaitable[Any]],
+                           codes: list[str], **kwargs: Any) -> dict[str, Any]:
+        """并发获取多只股票的数据，并发数受tushare_concurrency限制
+
+        Args:
+            fetch: 单只股票的获取方法
+            codes: 股票代码列表
+            **kwargs: 传给获取方法的其他参数
+
+        Returns:
+            以股票代码为键的结果字典，获取失败的股票对应其异常
+        """
+        async def bounded(code: str) -> Any:
+            async with _request_semaphore:
+                return await fetch(code, **kwargs)
+
+        results = await asyncio.gather(*(bounded(code) for code in codes), return_exceptions=True)
+        return dict(zip(codes, results, strict=True))
+
+    async def get_income_statement_batch(self, codes: list[str], start_date: str | None = None,
+                                         end_date: str | None = None, period: str = 'A') -> dict[str, Any]:
+        """批量获取利润表数据，参见get_income_statement"""
+        return await self._fetch_batch(
+            self.get_income_statement, codes, start_date=start_date, end_date=end_date, period=period
+        )
+
+    async def get_balance_sheet_batch(self, codes: list[str], start_date: str | None = None,
+                                      end_date: str | None = None, period: str = 'A') -> dict[str, Any]:
+        """批量获取资产负债表数据，参见get_balance_sheet"""
+        return await self._fetch_batch(
+            self.get_balance_sheet, codes, start_date=start_date, end_date=end_date, period=period
+        )
+
+    async def get_cashflow_statement_batch(self, codes: list[str], start_date: str | None = None,
+                                           end_date: str | None = None, period: str = 'A') -> dict[str, Any]:
+        """批量获取现金流量表数据，参见get_cashflow_statement"""
+        return await self._fetch_batch(
+            self.get_cashflow_statement, codes, start_date=start_date, end_date=end_date, period=period
+        )
+
+    async def get_financial_indicators_batch(self, codes: list[str], start_date: str | None = None,
+                                             end_date: str | None = None, period: str = 'A',
+                                             fields: list[str] | None = None) -> dict[str, Any]:
+        """批量获取财务指标数据，参见get_financial_indicators"""
+        return await self._fetch_batch(
+            self.get_financial_indicators, codes, start_date=start_date, end_date=end_date,
+            period=period, fields=fields
+        )
+
     async def get_daily_basic(self, ts_code: str | None = None, trade_date: str | None = None,
-                             start_date: str | None = None, end_date: str | None = None) -> list[dict[str, Any]]:
+                             start_date: str | None = None, end_date: str | None = None) -> ColumnarRecords:
         """
         获取股票每日基本面数据（市值、换手率等）
 
@@ -326,38 +599,27 @@ class TushareClient:
             end_date: 结束日期（YYYYMMDD格式）
 
         Returns:
-            包含每日基本面数据的字典列表
+            每日基本面数据记录，可按下标取得单行字典
 
         Raises:
             DataSourceError: 当数据获取失败时抛出
         """
         try:
-            if self._api is None:
-                raise DataSourceError("API未初始化")
-            api = self._api  # 类型断言
-
-            params = {}
-            if ts_code:
-                params['ts_code'] = ts_code
-            if trade_date:
-                params['trade_date'] = trade_date
-            if start_date:
-                params['start_date'] = start_date
-            if end_date:
-                params['end_date'] = end_date
-
-            result: Any = await self._execute_with_retry(
-                lambda: api.daily_basic(**params)
+            columns = await self._call_api(
+                'daily_basic',
+                ts_code=ts_code or None,
+                trade_date=trade_date or None,
+                start_date=start_date or None,
+                end_date=end_date or None
             )
 
-            if result is None or len(result) == 0:
+            records = ColumnarRecords(columns)
+            if not records:
                 logger.warning("未获取到每日基本面数据")
-                return []
+                return records
 
-            # 转换为字典列表格式
-            data_list: list[dict[str, Any]] = result.to_dict('records')
-            logger.info(f"成功获取{len(data_list)}条每日基本面数据")
-            return data_list
+            logger.info(f"成功获取{len(records)}条每日基本面数据")
+            return records
 
         except Exception as e:
             logger.error(f"获取每日基本面数据失败: {e}")
@@ -365,7 +627,7 @@ class TushareClient:
 
     async def get_stock_basic(self, ts_code: str | None = None, name: str | None = None,
                              exchange: str | None = None, market: str | None = None,
-                             is_hs: str | None = None, list_status: str = 'L') -> list[dict[str, Any]]:
+                             is_hs: str | None = None, list_status: str = 'L') -> ColumnarRecords:
         """
         获取股票基本信息
 
@@ -378,51 +640,53 @@ class TushareClient:
             list_status: 上市状态（L上市 D退市 P暂停上市）
 
         Returns:
-            包含股票基本信息的字典列表
+            股票基本信息记录，可按下标取得单行字典
 
         Raises:
             DataSourceError: 当数据获取失败时抛出
         """
         try:
-            params = {'list_status': list_status}
-            if ts_code:
-                params['ts_code'] = ts_code
-            if name:
-                params['name'] = name
-            if exchange:
-                params['exchange'] = exchange
-            if market:
-                params['market'] = market
-            if is_hs:
-                params['is_hs'] = is_hs
-
-            if self._api is None:
-                raise DataSourceError("API未初始化")
-            api = self._api
-            result: Any = await self._execute_with_retry(
-                lambda: api.stock_basic(**params)
+            # 空值参数由_call_api统一剔除
+            columns = await self._call_api(
+                'stock_basic',
+                ts_code=ts_code or None,
+                name=name or None,
+                exchange=exchange or None,
+                market=market or None,
+                is_hs=is_hs or None,
+                list_status=list_status,
             )
 
-            if result and 'data' in result:
-                # 转换为字典列表格式
-                columns = result['data']['fields']
-                rows = result['data']['items']
-
-                data_list: list[dict[str, Any]] = []
-                for row in rows:
-                    data_dict = dict(zip(columns, row, strict=False))
-                    data_list.append(data_dict)
-
-                logger.info(f"成功获取{len(data_list)}条股票基本信息")
-                return data_list
+            records = ColumnarRecords(columns)
+            if records:
+                logger.info(f"成功获取{len(records)}条股票基本信息")
             else:
                 logger.warning("未获取到股票基本信息")
-                return []
+            return records
 
         except Exception as e:
             logger.error(f"获取股票基本信息失败: {e}")
             raise DataSourceError(f"获取股票基本信息失败: {e}") from e
 
+    async def get_stock_basic_rows(self, **filters: Any) -> Iterator[tuple[Any, ...]]:
+        """获取股票基本信息的命名元组行
+
+        参数同get_stock_basic，行可按属性访问（如row.ts_code），
+        需要字典时调用row._asdict()
+
+        Returns:
+            StockBasicRow命名元组迭代器
+        """
+        records = await self.get_stock_basic(**filters)
+        return records.itertuples("StockBasicRow")
+
 
 # 全局Tushare客户端实例
 tushare_client = TushareClient()
+
+
+async def get_tushare_client() -> TushareClient:
+    """获取全局Tushare客户端的依赖注入函数（首次使用时初始化）"""
+    if not tushare_client._initialized:
+        await tushare_client.initialize()
+    return tushare_client
@@ -1,14 +1,20 @@
 """连接池管理模块"""
 
+import asyncio
+import time
 from contextlib import asynccontextmanager
 from typing import Any
 
-import redis
+import redis.asyncio
 from loguru import logger
 from sqlalchemy import text
 
 from ..config.database import AsyncSessionLocal, async_engine
-from ..config.redis import get_redis_client
+from ..config.redis import async_redis_client
+from ..config.settings import settings
+
+# 健康检查结果缓存时间（秒），就绪探针高频访问时合并为一次检查
+HEALTH_CHECK_CACHE_TTL = 5
 
 
 class ConnectionPoolManager:
@@ -17,24 +23,25 @@ class ConnectionPoolManager:
     def __init__(self) -> None:
         self._mysql_initialized = False
         self._redis_initialized = False
-        self._redis_client: redis.Redis | None = None
+        self._redis_client: redis.asyncio.Redis | None = None
+        self._health_lock = asyncio.Lock()
+        self._health_cache: tuple[float, dict] | None = None
 
     async def initialize(self) -> None:
         """初始化所有连接池"""
         try:
             logger.info("开始初始化连接池...")
 
-            # 初始化MySQL连接池
-            async with AsyncSessionLocal() as session:
-                await session.execute(text("SELECT 1"))
+            # 初始化MySQL连接池，预先建立常驻连接，避免首批请求等待握手
+            await self._prewarm_mysql_pool()
             self._mysql_initialized = True
             logger.info("MySQL连接池初始化完成")
 
             # 初始化Redis连接池
             try:
-                self._redis_client = get_redis_client()
+                self._redis_client = async_redis_client
                 # 测试Redis连接
-                self._redis_client.ping()
+                await self._redis_client.ping()
                 self._redis_initialized = True
                 logger.info("Redis连接池初始化完成")
             except Exception as e:
@@ -48,6 +55,23 @@ class ConnectionPoolManager:
             await self.cleanup()
             raise
 
+    async def _prewarm_mysql_pool(self) -> None:
+        """并发建立pool_size个MySQL连接并归还连接池"""
+        results = await asyncio.gather(
+            *(async_engine.connect().start() for _ in range(settings.mysql_pool_size)),
+            return_exceptions=True,
+        )
+        connections = [result for result in results if not isinstance(result, BaseException)]
+        try:
+            errors = [result for result in results if isinstance(result, BaseException)]
+            if errors:
+                raise errors[0]
+            await connections[0].execute(text("SELECT 1"))
+        finally:
+            await asyncio.gather(*(connection.close() for connection in connections))
+
+        logger.info(f"MySQL连接池预热完成: {len(connections)}个连接")
+
     async def cleanup(self) -> None:
         """清理所有连接池"""
         try:
@@ -59,7 +83,7 @@ class ConnectionPoolManager:
 
             if self._redis_initialized and self._redis_client:
                 try:
-                    self._redis_client.close()
+                    await self._redis_client.aclose()
                     logger.info("Redis连接池已关闭")
                 except Exception as e:
                     logger.warning(f"关闭Redis连接池时出错: {e}")
@@ -79,7 +103,23 @@ class ConnectionPoolManager:
         return self._mysql_initialized and self._redis_initialized
 
     async def health_check(self) -> dict:
-        """连接池健康检查"""
+        """连接池健康检查
+
+        结果缓存HEALTH_CHECK_CACHE_TTL秒，并发的检查请求等待同一次检查结果
+        """
+        async with self._health_lock:
+            if (
+                self._health_cache is not None
+                and time.monotonic() - self._health_cache[0] < HEALTH_CHECK_CACHE_TTL
+            ):
+                return dict(self._health_cache[1])
+
+            health_status = await self._check_health()
+            self._health_cache = (time.monotonic(), health_status)
+            return dict(health_status)
+
+    async def _check_health(self) -> dict:
+        """检查MySQL和Redis连接"""
         health_status = {"mysql": False, "redis": False, "overall": False}
 
         # 检查MySQL连接
@@ -94,7 +134,7 @@ class ConnectionPoolManager:
         # 检查Redis连接
         try:
             if self._redis_client:
-                self._redis_client.ping()
+                await self._redis_client.ping()
                 health_status["redis"] = True
                 logger.debug("Redis连接健康")
             else:
@@ -118,6 +158,7 @@ async def get_db_session() -> Any:
     if not connection_pool_manager.is_initialized:
         raise RuntimeError("连接池未初始化")
 
+    # 退出async with时会话自动关闭并归还连接，无需再显式close
     async with AsyncSessionLocal() as session:
         try:
             yield session
@@ -125,13 +166,14 @@ async def get_db_session() -> Any:
             await session.rollback()
             logger.error(f"数据库会话异常: {e}")
             raise
-        finally:
-            await session.close()
 
 
 @asynccontextmanager
 async def get_redis_connection() -> Any:
-    """获取Redis连接的上下文管理器"""
+    """获取Redis连接的上下文管理器
+
+    返回共享的异步客户端，命令执行时从连接池借用连接
+    """
     if not connection_pool_manager.is_initialized:
         raise RuntimeError("连接池未初始化")
 
@@ -166,7 +208,7 @@ async def get_connection_stats() -> dict[str, Any]:
     # Redis统计信息
     try:
         if connection_pool_manager._redis_client:
-            redis_info = connection_pool_manager._redis_client.info()
+            redis_info = await connection_pool_manager._redis_client.info()
             redis_stats = {
                 "connected_clients": redis_info.get("connected_clients", 0),
                 "used_memory": redis_info.get("used_memory", 0),
@@ -18,8 +18,8 @@ sync_engine = create_engine(
     settings.mysql_url,
     pool_pre_ping=True,
     pool_recycle=3600,
-    pool_size=10,
-    max_overflow=20,
+    pool_size=settings.mysql_pool_size,
+    max_overflow=settings.mysql_max_overflow,
     echo=settings.debug,
 )
 
@@ -28,9 +28,14 @@ async_mysql_url = settings.mysql_url.replace("mysql+pymysql://", "mysql+aiomysql
 async_engine = create_async_engine(
     async_mysql_url,
     pool_pre_ping=True,
-    pool_recycle=3600,
-    pool_size=10,
-    max_overflow=20,
+    pool_recycle=1800,
+    pool_timeout=30,
+    pool_size=settings.mysql_pool_size,
+    max_overflow=settings.mysql_max_overflow,
+    # 优先复用最近归还的连接，空闲连接可被pool_recycle自然回收
+    pool_use_lifo=True,
+    # 扩大编译缓存，避免热点查询的SQL编译结果被挤出
+    query_cache_size=1200,
     echo=settings.debug,
 )
 
@@ -1,9 +1,11 @@
 """Redis配置模块
 
-提供Redis客户端配置和依赖注入功能
+提供Redis客户端配置和依赖注入功能。
+同步客户端供因子缓存等同步代码使用，异步代码应使用async_redis_client
 """
 
 import redis
+import redis.asyncio
 from loguru import logger
 
 from .settings import settings
@@ -36,13 +38,39 @@ def get_redis_client() -> redis.Redis:
         raise
 
 
-def close_redis_client() -> None:
-    """关闭Redis客户端连接"""
-    try:
-        redis_client.close()
-        logger.info("Redis客户端连接已关闭")
-    except Exception as e:
-        logger.warning(f"关闭Redis客户端时出错: {e}")
+# 异步Redis连接池，供事件循环中的调用方共享
+async_redis_pool = redis.asyncio.ConnectionPool(
+    host=settings.redis_host,
+    port=settings.redis_port,
+    db=settings.redis_db,
+    password=settings.redis_password,
+    decode_responses=True,
+    max_connections=50,
+    socket_connect_timeout=5,
+    socket_timeout=5,
+    retry_on_timeout=True,
+    health_check_interval=30,
+)
+
+# 异步Redis客户端，命令在连接池上多路复用，关闭客户端时一并关闭连接池
+async_redis_client = redis.asyncio.Redis.from_pool(async_redis_pool)
+
+
+def create_async_redis_client() -> redis.asyncio.Redis:
+    """创建独立的异步Redis客户端
+
+    用于发布订阅等需要在事件循环中长时间等待的场景
+    """
+    return redis.asyncio.Redis(
+        host=settings.redis_host,
+        port=settings.redis_port,
+        db=settings.redis_db,
+        password=settings.redis_password,
+        decode_responses=True,
+        socket_connect_timeout=5,
+        retry_on_timeout=True,
+        health_check_interval=30,
+    )
 
 
 logger.info("Redis配置初始化完成")
@@ -19,6 +19,9 @@ class Settings(BaseSettings):
     # 服务配置
     host: str = Field(default="0.0.0.0", description="服务监听地址")
     port: int = Field(default=8002, description="服务监听端口")
+    gzip_minimum_size: int = Field(
+        default=1024, description="响应体超过该字节数时启用gzip压缩"
+    )
 
     # MySQL数据库配置
     mysql_host: str = Field(default="localhost", description="MySQL主机地址")
@@ -27,6 +30,8 @@ class Settings(BaseSettings):
     mysql_password: str = Field(default="qtrade123", description="MySQL密码")
     mysql_database: str = Field(default="qtrade", description="MySQL数据库名")
     mysql_charset: str = Field(default="utf8mb4", description="MySQL字符集")
+    mysql_pool_size: int = Field(default=32, description="MySQL连接池常驻连接数")
+    mysql_max_overflow: int = Field(default=64, description="MySQL连接池允许的溢出连接数")
 
     # Redis配置
     redis_host: str = Field(default="localhost", description="Redis主机地址")
@@ -45,6 +50,7 @@ class Settings(BaseSettings):
     tushare_timeout: int = Field(default=30, description="Tushare请求超时时间（秒）")
     tushare_retry_count: int = Field(default=3, description="Tushare请求重试次数")
     tushare_retry_delay: float = Field(default=1.0, description="Tushare请求重试延迟（秒）")
+    tushare_concurrency: int = Field(default=10, description="Tushare批量请求的最大并发数")
 
     # 日志配置
     log_level: str = Field(default="INFO", description="日志级别")
@@ -8,20 +8,17 @@
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 from loguru import logger
-from redis import Redis
-from sqlalchemy.orm import Session
 
-from src.clients.tushare_client import TushareClient
-from src.config.database import get_db_session
-from src.config.redis import get_redis_client
-from src.factor_engine.dao.factor_dao import FactorDAO
 from src.factor_engine.models.schemas import (
     BatchFundamentalFactorRequest,
     BatchFundamentalFactorResponse,
     FundamentalFactorRequest,
     FundamentalFactorResponse,
 )
-from src.factor_engine.services.factor_service import FactorService
+from src.factor_engine.services.factor_service import (
+    FactorService,
+    get_factor_service,
+)
 from src.utils.exceptions import DataNotFoundError, FactorCalculationException
 
 router = APIRouter(prefix="/fundamental", tags=["fundamental-factors"])
@@ -30,16 +27,14 @@ router = APIRouter(prefix="/fundamental", tags=["fundamental-factors"])
 @router.post("/calculate", response_model=FundamentalFactorResponse)
 async def calculate_fundamental_factors(
     request: FundamentalFactorRequest,
-    db_session: Session = Depends(get_db_session),
-    redis_client: Redis = Depends(get_redis_client),
+    factor_service: FactorService = Depends(get_factor_service),
 ) -> FundamentalFactorResponse:
     """
     计算基本面因子
 
     Args:
         request: 基本面因子计算请求
-        db_session: 数据库会话
-        redis_client: Redis客户端
+        factor_service: 因子服务实例
 
     Returns:
         基本面因子计算结果
@@ -52,13 +47,8 @@ async def calculate_fundamental_factors(
             f"开始计算基本面因子: stock_code={request.stock_code}, period={request.period}"
         )
 
-        # 使用async with确保TushareClient在整个请求生命周期内保持活跃
-        async with TushareClient() as data_client:
-            factor_dao = FactorDAO(db_session, redis_client)
-            factor_service = FactorService(factor_dao, data_client)
-
-            # 调用因子服务计算基本面因子
-            result = await factor_service.calculate_fundamental_factors(request)
+        # 调用因子服务计算基本面因子
+        result = await factor_service.calculate_fundamental_factors(request)
 
         logger.info(f"基本面因子计算完成: stock_code={request.stock_code}")
         return result
@@ -80,8 +70,7 @@ async def get_fundamental_factor_history(
     factor_name: str = Query(..., description="因子名称"),
     start_period: str = Query(..., description="开始期间，格式：YYYY-Q[1-4] 或 YYYY"),
     end_period: str = Query(..., description="结束期间，格式：YYYY-Q[1-4] 或 YYYY"),
-    db_session: Session = Depends(get_db_session),
-    redis_client: Redis = Depends(get_redis_client),
+    factor_service: FactorService = Depends(get_factor_service),
 ) -> list[dict]:
     """
     查询基本面因子历史数据
@@ -91,8 +80,7 @@ async def get_fundamental_factor_history(
         factor_name: 因子名称
         start_period: 开始期间
         end_period: 结束期间
-        db_session: 数据库会话
-        redis_client: Redis客户端
+        factor_service: 因子服务实例
 
     Returns:
         基本面因子历史数据
@@ -105,17 +93,12 @@ async def get_fundamental_factor_history(
             f"查询基本面因子历史数据: stock_code={stock_code}, factor={factor_name}"
         )
 
-        # 使用async with确保TushareClient在整个请求生命周期内保持活跃
-        async with TushareClient() as data_client:
-            factor_dao = FactorDAO(db_session, redis_client)
-            factor_service = FactorService(factor_dao, data_client)
-
-            result = await factor_service.get_fundamental_factor_history(
-                stock_code=stock_code,
-                factor_name=factor_name,
-                start_period=start_period,
-                end_period=end_period,
-            )
+        result = await factor_service.get_fundamental_factor_history(
+            stock_code=stock_code,
+            factor_name=factor_name,
+            start_period=start_period,
+            end_period=end_period,
+        )
 
         logger.info(
             f"基本面因子历史数据查询完成: stock_code={stock_code}, 记录数={len(result)}"
@@ -133,16 +116,14 @@ async def get_fundamental_factor_history(
 @router.post("/batch-calculate", response_model=BatchFundamentalFactorResponse)
 async def batch_calculate_fundamental_factors(
     request: BatchFundamentalFactorRequest,
-    db_session: Session = Depends(get_db_session),
-    redis_client: Redis = Depends(get_redis_client),
+    factor_service: FactorService = Depends(get_factor_service),
 ) -> BatchFundamentalFactorResponse:
     """
     批量计算基本面因子
 
     Args:
         request: 批量基本面因子计算请求
-        db_session: 数据库会话
-        redis_client: Redis客户端
+        factor_service: 因子服务实例
 
     Returns:
         批量基本面因子计算结果
@@ -155,13 +136,8 @@ async def batch_calculate_fundamental_factors(
             f"开始批量计算基本面因子: stock_codes={len(request.stock_codes)}, period={request.period}"
         )
 
-        # 使用async with确保TushareClient在整个请求生命周期内保持活跃
-        async with TushareClient() as data_client:
-            factor_dao = FactorDAO(db_session, redis_client)
-            factor_service = FactorService(factor_dao, data_client)
-
-            # 调用因子服务批量计算基本面因子
-            result = await factor_service.batch_calculate_fundamental_factors(request)
+        # 调用因子服务批量计算基本面因子
+        result = await factor_service.batch_calculate_fundamental_factors(request)
 
         logger.info(f"批量基本面因子计算完成: 处理股票数={len(request.stock_codes)}")
         return result
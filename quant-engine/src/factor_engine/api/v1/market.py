@@ -9,15 +9,9 @@
 import logging
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from redis import Redis
-from sqlalchemy.orm import Session
 
 from src.utils.exceptions import DataNotFoundError, FactorCalculationException
 
-from ....clients.tushare_client import TushareClient
-from ....config.database import get_db_session
-from ....config.redis import get_redis_client
-from ...dao.factor_dao import FactorDAO
 from ...models.schemas import (
     BatchMarketFactorRequest,
     BatchMarketFactorResponse,
@@ -25,24 +19,13 @@ from ...models.schemas import (
     MarketFactorRequest,
     MarketFactorResponse,
 )
-from ...services.factor_service import FactorService
+from ...services.factor_service import FactorService, get_factor_service
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/market", tags=["market-factors"])
 
 
-async def get_factor_service(
-    db_session: Session = Depends(get_db_session),
-    redis_client: Redis = Depends(get_redis_client),
-) -> FactorService:
-    """获取因子服务实例"""
-    factor_dao = FactorDAO(db_session, redis_client)
-    data_client = TushareClient()
-    await data_client.initialize()  # 确保TushareClient被正确初始化
-    return FactorService(factor_dao, data_client)
-
-
 @router.post("/calculate", response_model=MarketFactorResponse)
 async def calculate_market_factors(
     request: MarketFactorRequest,
@@ -1,11 +1,14 @@
 """情绪因子API接口"""
 
+from collections.abc import AsyncIterator
 from datetime import datetime, timedelta
 from typing import Optional
 
-from fastapi import APIRouter, HTTPException, Query, Depends
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Query, Depends, Response
+from fastapi.responses import StreamingResponse
 from loguru import logger
 
+from ...dao.base import NewsSentimentFactorDAO
 from ...services.sentiment_service import SentimentFactorService
 from ...models.schemas import (
     ApiResponse,
@@ -22,8 +25,21 @@ router = APIRouter(prefix="/sentiment", tags=["sentiment-factors"])
 _sentiment_service_instance: Optional[SentimentFactorService] = None
 
 
-def get_sentiment_service() -> SentimentFactorService:
-    """获取情感因子服务实例（单例模式）"""
+def _json_response(response: ApiResponse) -> Response:
+    """由Pydantic直接序列化为JSON响应
+
+    返回Response时FastAPI不再按response_model对结果做一次转换和校验，
+    response_model仍用于生成接口文档
+    """
+    return Response(content=response.model_dump_json(), media_type="application/json")
+
+
+async def get_sentiment_service() -> SentimentFactorService:
+    """获取情感因子服务实例（单例模式）
+
+    定义为协程依赖，在事件循环中执行而非线程池，检查与创建之间没有await，
+    并发请求不会重复创建服务及其情感分析模型
+    """
     global _sentiment_service_instance
     if _sentiment_service_instance is None:
         _sentiment_service_instance = SentimentFactorService()
@@ -38,12 +54,16 @@ def get_sentiment_service() -> SentimentFactorService:
 )
 async def calculate_sentiment_factor(
     request: SentimentFactorRequest,
+    background_tasks: BackgroundTasks,
     sentiment_service: SentimentFactorService = Depends(get_sentiment_service),
-) -> ApiResponse:
+) -> Response:
     """计算单个股票情绪因子
 
+    计算结果在响应返回后由后台任务写入数据库
+
     Args:
         request: 情绪因子计算请求
+        background_tasks: 后台任务
 
     Returns:
         ApiResponse: 包含情绪因子结果的响应
@@ -52,13 +72,15 @@ async def calculate_sentiment_factor(
         HTTPException: 计算失败时抛出异常
     """
     try:
-        response_data = await sentiment_service.calculate_sentiment_factor(request)
+        response_data = await sentiment_service.calculate_sentiment_factor(
+            request, background_tasks
+        )
         
-        return ApiResponse(
+        return _json_response(ApiResponse(
             code=200,
             message="情绪因子计算成功",
-            data=response_data.dict(),
-        )
+            data=response_data.model_dump(),
+        ))
     except ValueError as e:
         raise HTTPException(
             status_code=404,
@@ -84,7 +106,7 @@ async def calculate_sentiment_factor(
 async def batch_calculate_sentiment_factors(
     request: BatchSentimentFactorRequest,
     sentiment_service: SentimentFactorService = Depends(get_sentiment_service),
-) -> ApiResponse:
+) -> Response:
     """批量计算情绪因子
 
     Args:
@@ -96,11 +118,11 @@ async def batch_calculate_sentiment_factors(
     try:
         response_data = await sentiment_service.batch_calculate_sentiment_factors(request)
         
-        return ApiResponse(
+        return _json_response(ApiResponse(
             code=200,
             message="批量情绪因子计算完成",
-            data=response_data.dict(),
-        )
+            data=response_data.model_dump(),
+        ))
 
     except Exception as e:
         logger.error(f"批量计算情绪因子失败: {e}")
@@ -120,7 +142,7 @@ async def get_sentiment_factor(
     stock_code: str = Query(..., description="股票代码"),
     calculation_date: str = Query(..., description="计算日期，格式：YYYY-MM-DD"),
     sentiment_service: SentimentFactorService = Depends(get_sentiment_service),
-) -> ApiResponse:
+) -> Response:
     """获取股票情绪因子
 
     Args:
@@ -138,17 +160,17 @@ async def get_sentiment_factor(
         )
 
         if result is None:
-            return ApiResponse(
+            return _json_response(ApiResponse(
                 code=404,
                 message="未找到情绪因子数据",
                 data=None,
-            )
+            ))
 
-        return ApiResponse(
+        return _json_response(ApiResponse(
             code=200,
             message="获取情绪因子成功",
             data=result,
-        )
+        ))
 
     except ValueError as e:
         raise HTTPException(
@@ -171,34 +193,43 @@ async def get_sentiment_factor(
 )
 async def get_sentiment_factors_by_date(
     calculation_date: str = Query(..., description="计算日期，格式：YYYY-MM-DD"),
-    limit: int = Query(default=100, description="返回记录数限制"),
+    limit: int = Query(default=100, ge=1, le=1000, description="返回记录数限制"),
+    cursor: str | None = Query(default=None, description="分页游标，取上一页返回的next_cursor"),
     sentiment_service: SentimentFactorService = Depends(get_sentiment_service),
-) -> ApiResponse:
+) -> Response:
     """获取指定日期的所有情绪因子
 
     Args:
         calculation_date: 计算日期
         limit: 返回记录数限制
+        cursor: 分页游标
         sentiment_service: 情绪因子服务
 
     Returns:
-        ApiResponse: 包含情绪因子数据列表的响应
+        ApiResponse: 包含情绪因子数据列表及下一页游标的响应
     """
     try:
         results = await sentiment_service.get_sentiment_factors_by_date(
             date=calculation_date,
             limit=limit,
+            cursor=cursor,
+        )
+        next_cursor = (
+            NewsSentimentFactorDAO.by_date_cursor(results[-1])
+            if len(results) == limit
+            else None
         )
 
-        return ApiResponse(
+        return _json_response(ApiResponse(
             code=200,
             message=f"获取 {calculation_date} 情绪因子数据成功",
             data={
                 "calculation_date": calculation_date,
                 "count": len(results),
                 "factors": results,
+                "next_cursor": next_cursor,
             },
-        )
+        ))
 
     except ValueError as e:
         raise HTTPException(
@@ -213,6 +244,60 @@ async def get_sentiment_factors_by_date(
         ) from e
 
 
+@router.get(
+    "/factors/date/stream",
+    summary="流式获取指定日期的所有情绪因子",
+    description="以NDJSON（每行一个JSON对象）逐条返回指定日期的情绪因子，适合全市场数据导出",
+)
+async def stream_sentiment_factors_by_date(
+    calculation_date: str = Query(..., description="计算日期，格式：YYYY-MM-DD"),
+    limit: int = Query(default=10000, ge=1, le=10000, description="返回记录数限制"),
+    cursor: str | None = Query(default=None, description="起始游标，取分页接口返回的next_cursor"),
+    sentiment_service: SentimentFactorService = Depends(get_sentiment_service),
+) -> StreamingResponse:
+    """流式获取指定日期的所有情绪因子
+
+    响应开始后无法再修改状态码，因此先取出第一条记录，
+    日期、游标无效或数据库错误仍以400/500返回
+
+    Args:
+        calculation_date: 计算日期
+        limit: 返回记录数限制
+        cursor: 起始游标
+        sentiment_service: 情绪因子服务
+
+    Returns:
+        StreamingResponse: application/x-ndjson格式的情绪因子数据
+    """
+    factors = sentiment_service.iter_sentiment_factors_by_date(
+        date=calculation_date,
+        limit=limit,
+        cursor=cursor,
+    )
+    try:
+        first = await anext(factors, None)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=400,
+            detail=str(e)
+        ) from e
+    except Exception as e:
+        logger.error(f"流式获取日期情绪因子失败: {e}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"获取日期情绪因子时发生错误: {str(e)}"
+        ) from e
+
+    async def ndjson_lines() -> AsyncIterator[str]:
+        if first is None:
+            return
+        yield first.model_dump_json() + "\n"
+        async for factor in factors:
+            yield factor.model_dump_json() + "\n"
+
+    return StreamingResponse(ndjson_lines(), media_type="application/x-ndjson")
+
+
 @router.post(
     "/trend",
     response_model=ApiResponse,
@@ -222,7 +307,7 @@ async def get_sentiment_factors_by_date(
 async def get_sentiment_trend(
     request: SentimentTrendRequest,
     sentiment_service: SentimentFactorService = Depends(get_sentiment_service),
-) -> ApiResponse:
+) -> Response:
     """获取股票情绪趋势
 
     Args:
@@ -235,11 +320,11 @@ async def get_sentiment_trend(
     try:
         response_data = await sentiment_service.get_sentiment_trend(request)
 
-        return ApiResponse(
+        return _json_response(ApiResponse(
             code=200,
             message="获取情绪趋势成功",
-            data=response_data.dict(),
-        )
+            data=response_data.model_dump(),
+        ))
 
     except Exception as e:
         logger.error(f"获取情绪趋势失败: {e}")
@@ -258,7 +343,7 @@ async def get_sentiment_trend(
 async def get_sentiment_statistics(
     request: SentimentTrendRequest,
     sentiment_service: SentimentFactorService = Depends(get_sentiment_service),
-) -> ApiResponse:
+) -> Response:
     """获取股票情绪统计
 
     Args:
@@ -270,17 +355,16 @@ async def get_sentiment_statistics(
     """
     try:
         # 获取统计数据
-        from ...dao.base import NewsSentimentFactorDAO
         statistics = await NewsSentimentFactorDAO.get_sentiment_statistics(
             stock_code=request.stock_code,
             days=request.days,
         )
 
-        return ApiResponse(
+        return _json_response(ApiResponse(
             code=200,
             message="获取情绪统计成功",
             data=statistics,
-        )
+        ))
 
     except Exception as e:
         logger.error(f"获取情绪统计失败: {e}")
@@ -7,17 +7,14 @@
 """
 
 import logging
+from collections.abc import AsyncIterator
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from redis import Redis
-from sqlalchemy.orm import Session
+from fastapi.responses import StreamingResponse
 
 from src.utils.exceptions import DataNotFoundError, FactorCalculationException
+from src.utils.json_codec import json_dumps
 
-from ....clients.tushare_client import TushareClient
-from ....config.database import get_db_session
-from ....config.redis import get_redis_client
-from ...dao.factor_dao import FactorDAO
 from ...models.schemas import (
     BatchTechnicalFactorRequest,
     BatchTechnicalFactorResponse,
@@ -25,24 +22,13 @@ from ...models.schemas import (
     TechnicalFactorRequest,
     TechnicalFactorResponse,
 )
-from ...services.factor_service import FactorService
+from ...services.factor_service import FactorService, get_factor_service
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/technical", tags=["technical-factors"])
 
 
-async def get_factor_service(
-    db_session: Session = Depends(get_db_session),
-    redis_client: Redis = Depends(get_redis_client),
-) -> FactorService:
-    """获取因子服务实例"""
-    factor_dao = FactorDAO(db_session, redis_client)
-    data_client = TushareClient()
-    await data_client.initialize()  # 确保TushareClient被正确初始化
-    return FactorService(factor_dao, data_client)
-
-
 @router.post("/calculate", response_model=TechnicalFactorResponse)
 async def calculate_technical_factors(
     request: TechnicalFactorRequest,
@@ -131,6 +117,59 @@ async def get_technical_factor_history(
         raise HTTPException(status_code=500, detail="内部服务器错误") from e
 
 
+@router.get(
+    "/history/stream",
+    summary="流式查询技术因子历史数据",
+    description="以NDJSON（每行一个JSON对象）逐条返回历史数据，适合较长的日期区间",
+)
+async def stream_technical_factor_history(
+    stock_code: str = Query(..., description="股票代码"),
+    factor_name: str = Query(..., description="因子名称"),
+    start_date: str = Query(..., description="开始日期，格式：YYYY-MM-DD"),
+    end_date: str = Query(..., description="结束日期，格式：YYYY-MM-DD"),
+    factor_service: FactorService = Depends(get_factor_service),
+) -> StreamingResponse:
+    """
+    流式查询技术因子历史数据
+
+    数据库按批读取，每行编码后立即输出，不在内存中构建完整响应。
+    响应开始后无法再修改状态码，因此先取出第一条记录，
+    日期无效或数据库错误仍以400/500返回
+
+    Args:
+        stock_code: 股票代码
+        factor_name: 因子名称
+        start_date: 开始日期
+        end_date: 结束日期
+        factor_service: 因子服务实例
+
+    Returns:
+        application/x-ndjson格式的历史数据，每行包含trade_date和factor_value
+    """
+    rows = factor_service.iter_technical_factor_history(
+        stock_code=stock_code,
+        factor_name=factor_name,
+        start_date=start_date,
+        end_date=end_date,
+    )
+    try:
+        first = await anext(rows, None)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    except Exception as e:
+        logger.error(f"技术因子历史数据流式查询异常: {str(e)}")
+        raise HTTPException(status_code=500, detail="内部服务器错误") from e
+
+    async def ndjson_lines() -> AsyncIterator[bytes]:
+        if first is None:
+            return
+        yield json_dumps(first) + b"\n"
+        async for row in rows:
+            yield json_dumps(row) + b"\n"
+
+    return StreamingResponse(ndjson_lines(), media_type="application/x-ndjson")
+
+
 @router.post("/batch-calculate", response_model=BatchTechnicalFactorResponse)
 async def batch_calculate_technical_factors(
     request: BatchTechnicalFactorRequest,
@@ -7,17 +7,12 @@
 """
 
 import logging
+from functools import lru_cache
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from redis import Redis
-from sqlalchemy.orm import Session
 
 from src.utils.exceptions import DataNotFoundError, FactorCalculationException
 
-from ....clients.tushare_client import TushareClient
-from ....config.database import get_db_session
-from ....config.redis import get_redis_client
-from ...dao.factor_dao import FactorDAO
 from ...models.schemas import (
     BatchUnifiedFactorRequest,
     BatchUnifiedFactorResponse,
@@ -25,22 +20,39 @@ from ...models.schemas import (
     UnifiedFactorRequest,
     UnifiedFactorResponse,
 )
-from ...services.factor_service import FactorService
+from ...services.factor_service import FactorService, get_factor_service
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/unified", tags=["unified-factors"])
 
+# 历史数据查询支持的因子名称，与入库时的因子名称一致
+# （MACD、BOLL按子指标分别入库，基本面因子同时保存同比增长率）
+_TECHNICAL_HISTORY_FACTORS = frozenset({
+    "MA", "RSI",
+    "MACD_MACD", "MACD_Signal", "MACD_Histogram",
+    "BOLL_Upper", "BOLL_Middle", "BOLL_Lower",
+})
+_FUNDAMENTAL_BASE_FACTORS = (
+    "ROE", "ROA", "GROSS_MARGIN", "NET_MARGIN", "DEBT_RATIO", "CURRENT_RATIO",
+)
+_FUNDAMENTAL_HISTORY_FACTORS = frozenset(
+    _FUNDAMENTAL_BASE_FACTORS + tuple(f"{name}_YOY" for name in _FUNDAMENTAL_BASE_FACTORS)
+)
+_MARKET_HISTORY_FACTORS = frozenset({
+    "MARKET_CAP", "FLOAT_MARKET_CAP", "TURNOVER_RATE", "VOLUME_RATIO",
+    "PRICE_VOLATILITY", "RETURN_VOLATILITY", "PRICE_MOMENTUM", "RETURN_MOMENTUM",
+})
+
+
+@lru_cache(maxsize=256)
+def _parse_factor_names(value: str, supported: frozenset[str]) -> tuple[str, ...]:
+    """解析逗号分隔的因子列表
 
-async def get_factor_service(
-    db_session: Session = Depends(get_db_session),
-    redis_client: Redis = Depends(get_redis_client),
-) -> FactorService:
-    """获取因子服务实例"""
-    factor_dao = FactorDAO(db_session, redis_client)
-    data_client = TushareClient()
-    await data_client.initialize()  # 确保TushareClient被正确初始化
-    return FactorService(factor_dao, data_client)
+    去除空白、重复及不支持的因子名称，相同查询参数直接复用解析结果
+    """
+    names = (name.strip() for name in value.split(","))
+    return tuple(dict.fromkeys(name for name in names if name in supported))
 
 
 @router.post("/calculate", response_model=UnifiedFactorResponse)
@@ -163,9 +175,21 @@ async def get_all_factors_history(
         )
 
         # 解析因子列表参数
-        tech_factors_list = technical_factors.split(",") if technical_factors else None
-        fund_factors_list = fundamental_factors.split(",") if fundamental_factors else None
-        market_factors_list = market_factors.split(",") if market_factors else None
+        tech_factors_list = (
+            list(_parse_factor_names(technical_factors, _TECHNICAL_HISTORY_FACTORS))
+            if technical_factors
+            else None
+        )
+        fund_factors_list = (
+            list(_parse_factor_names(fundamental_factors, _FUNDAMENTAL_HISTORY_FACTORS))
+            if fundamental_factors
+            else None
+        )
+        market_factors_list = (
+            list(_parse_factor_names(market_factors, _MARKET_HISTORY_FACTORS))
+            if market_factors
+            else None
+        )
 
         # 调用因子服务查询历史数据
         result = await factor_service.get_all_factors_history(
@@ -10,13 +10,185 @@
 - 同比和环比增长率计算
 """
 
+import asyncio
 import logging
+from datetime import date, timedelta
+from functools import lru_cache
 from typing import Any
 
+import numpy as np
+import pandas as pd
+
 from ...clients.tushare_client import TushareClient
+from ..dao.cache import redis_cached
 
 logger = logging.getLogger(__name__)
 
+# 基本面因子用到的财务指标字段，只向Tushare请求这些列
+INDICATOR_FIELDS = [
+    "roe", "roa", "grossprofit_margin", "netprofit_margin", "debt_to_assets", "current_ratio",
+]
+
+# 各报表首行读取的字段：财务数据键 -> 报表列名
+_INCOME_COLUMNS = {
+    "revenue": "revenue",  # 营业收入
+    "total_profit": "total_profit",  # 利润总额
+    "n_income": "n_income",  # 净利润
+    "operate_profit": "operate_profit",  # 营业利润
+    "oper_cost": "oper_cost",  # 营业成本
+}
+_BALANCE_COLUMNS = {
+    "total_assets": "total_assets",  # 总资产
+    "total_liab": "total_liab",  # 总负债
+    "total_hldr_eqy_exc_min_int": "total_hldr_eqy_exc_min_int",  # 股东权益
+    "total_cur_assets": "total_cur_assets",  # 流动资产
+    "total_cur_liab": "total_cur_liab",  # 流动负债
+}
+_CASHFLOW_COLUMNS = {
+    "n_cashflow_act": "n_cashflow_act",  # 经营活动现金流
+}
+_INDICATOR_COLUMNS = {
+    "roe": "roe",  # ROE
+    "roa": "roa",  # ROA
+    "gross_margin": "grossprofit_margin",  # 毛利率
+    "netprofit_margin": "netprofit_margin",  # 净利率
+    "debt_to_assets": "debt_to_assets",  # 资产负债率
+    "current_ratio": "current_ratio",  # 流动比率
+}
+
+# 第1至4季度的季末月日
+_QUARTER_END_DATES = ("0331", "0630", "0930", "1231")
+
+# 需要上期数据计算平均值的因子
+PRIOR_PERIOD_FACTORS = frozenset({"ROE", "ROA"})
+
+# 比率因子计算用到的财务数据字段，缺失时按0处理
+_RATIO_FIELDS = (
+    "net_profit", "total_equity", "total_assets", "revenue", "cost_of_sales",
+    "total_liabilities", "current_assets", "current_liabilities",
+)
+
+# 合并后财务数据的缓存Key模板及TTL（秒）
+FINANCIAL_DATA_KEY = "fundamental:financial:{ts_code}:{end_date}:{period_type}"
+FINANCIAL_DATA_TTL = 604800
+# 报告期结束后120天内财报仍在陆续披露或更正（年报截止次年4月底），缓存时间较短
+FINANCIAL_DATA_RECENT_TTL = 3600
+FINANCIAL_DATA_DISCLOSURE_DAYS = 120
+
+
+def _ratio(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    """逐元素相除并保留6位小数，分母为0时为NaN"""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(denominator != 0, np.round(numerator / denominator, 6), np.nan)
+
+
+def _compute_ratio_factors(
+    net_profit: np.ndarray,
+    total_equity: np.ndarray,
+    prev_equity: np.ndarray,
+    total_assets: np.ndarray,
+    prev_assets: np.ndarray,
+    revenue: np.ndarray,
+    cost_of_sales: np.ndarray,
+    total_liabilities: np.ndarray,
+    current_assets: np.ndarray,
+    current_liabilities: np.ndarray,
+) -> dict[str, np.ndarray]:
+    """按列一次性计算全部比率因子
+
+    各参数为等长的float64数组，每个元素对应一份财务数据（不同股票或报告期），
+    公式与calculate_roe等单因子方法一致；分母为0或数据缺失（NaN）时结果为NaN
+
+    Returns:
+        以因子名称为键的结果数组字典
+    """
+    # 期初值缺失时由调用方填入期末值，平均值即为期末值
+    avg_equity = np.where(total_equity != 0, (total_equity + prev_equity) / 2, 0.0)
+    avg_assets = np.where(total_assets != 0, (total_assets + prev_assets) / 2, 0.0)
+    return {
+        "ROE": _ratio(net_profit, avg_equity),
+        "ROA": _ratio(net_profit, avg_assets),
+        "GROSS_MARGIN": _ratio(revenue - cost_of_sales, revenue),
+        "NET_MARGIN": _ratio(net_profit, revenue),
+        "DEBT_RATIO": _ratio(total_liabilities, total_assets),
+        "CURRENT_RATIO": _ratio(current_assets, current_liabilities),
+    }
+
+
+def _first_row_values(frame: pd.DataFrame, columns: dict[str, str]) -> dict[str, Any]:
+    """按列读取报表首行的指定字段，不构建整行Series
+
+    数值转换为Python原生类型以便JSON缓存；报表缺少的列取0
+
+    Args:
+        frame: 报表DataFrame，最新一期在首行
+        columns: 财务数据键 -> 报表列名
+
+    Returns:
+        财务数据字典，报表为空时返回空字典
+    """
+    if frame.empty:
+        return {}
+    values: dict[str, Any] = {}
+    for key, column in columns.items():
+        if column in frame.columns:
+            value = frame[column].iat[0]
+            values[key] = value.item() if isinstance(value, np.generic) else value
+        else:
+            values[key] = 0
+    return values
+
+
+def _financial_data_ttl(arguments: dict[str, Any]) -> int:
+    """按报告期结束日期选择财务数据缓存TTL"""
+    disclosure_start = date.today() - timedelta(days=FINANCIAL_DATA_DISCLOSURE_DAYS)
+    if arguments["end_date"] >= disclosure_start.strftime("%Y%m%d"):
+        return FINANCIAL_DATA_RECENT_TTL
+    return FINANCIAL_DATA_TTL
+
+
+@lru_cache(maxsize=8192)
+def _convert_stock_code(stock_code: str) -> str:
+    """转换股票代码格式，结果按代码缓存
+
+    Args:
+        stock_code: 原始股票代码，如000001
+
+    Returns:
+        Tushare格式的股票代码，如000001.SZ
+    """
+    if '.' in stock_code:
+        return stock_code
+
+    # 根据股票代码判断交易所
+    if stock_code.startswith('6'):
+        return f"{stock_code}.SH"  # 上海证券交易所
+    elif stock_code.startswith(('0', '3')):
+        return f"{stock_code}.SZ"  # 深圳证券交易所
+    else:
+        # 默认深圳
+        return f"{stock_code}.SZ"
+
+
+@lru_cache(maxsize=256)
+def _parse_quarter_period(period: str) -> str:
+    """解析季度期间，结果按期间缓存
+
+    Args:
+        period: 季度期间，如2023Q3
+
+    Returns:
+        结束日期，如20230930
+    """
+    year, sep, quarter = period.partition('Q')
+    if not sep:
+        return f"{period}1231"  # 如果不是季度格式，默认为年末
+
+    try:
+        return year + _QUARTER_END_DATES[int(quarter) - 1]
+    except (ValueError, IndexError):
+        return f"{year}1231"
+
 
 class FundamentalFactorCalculator:
     """基本面因子计算器
@@ -46,6 +218,8 @@ class FundamentalFactorCalculator:
         factors: list[str],
         period: str,
         report_type: str = "quarterly",
+        financial_data: dict[str, Any] | None = None,
+        period_cache: dict[str, dict[str, Any] | None] | None = None,
     ) -> dict[str, float | None]:
         """计算指定的基本面因子
 
@@ -54,33 +228,38 @@ class FundamentalFactorCalculator:
             factors: 要计算的因子列表
             period: 报告期，如2023Q3
             report_type: 报告类型，quarterly或annual
+            financial_data: 已预取的财务数据（见get_financial_data_bulk），为空时单独获取
+            period_cache: 已预取的各报告期财务数据（见get_period_data），为空时按需获取
 
         Returns:
             计算结果字典，包含factors和growth_rates
         """
         try:
-            # 获取财务数据
-            financial_data = await self._get_financial_data(
-                stock_code, period, report_type
-            )
+            # 一次性获取本期及计算所需的上期财务数据
+            if period_cache is None:
+                period_cache = await self.get_period_data(
+                    stock_code, period, factors, report_type, financial_data=financial_data
+                )
+            financial_data = period_cache.get(period)
             if not financial_data:
                 raise ValueError(f"无法获取股票{stock_code}在{period}的财务数据")
 
-            # 计算各项因子
-            factor_results = {}
+            prev_financial_data = None
+            if PRIOR_PERIOD_FACTORS.intersection(factors):
+                prev_financial_data = await self._get_cached_period_data(
+                    stock_code, self._get_previous_period(period), period_cache
+                )
+
+            # 一次性计算全部比率因子
+            [values] = self.calculate_ratio_factors(
+                factors, [financial_data], [prev_financial_data]
+            )
+
+            factor_results: dict[str, float | None] = {}
             for factor in factors:
-                if factor in self.supported_factors:
-                    try:
-                        value = await self.supported_factors[factor](
-                            stock_code, period, financial_data
-                        )
-                        factor_results[factor] = value
-                    except Exception as e:
-                        logger.warning(f"计算因子{factor}失败: {e}")
-                        factor_results[factor] = None
-                else:
+                if factor not in values:
                     logger.warning(f"不支持的因子: {factor}")
-                    factor_results[factor] = None
+                factor_results[factor] = values.get(factor)
 
             return factor_results
 
@@ -89,7 +268,11 @@ class FundamentalFactorCalculator:
             raise
 
     async def calculate_roe(
-        self, stock_code: str, period: str, financial_data: dict
+        self,
+        stock_code: str,
+        period: str,
+        financial_data: dict,
+        period_cache: dict[str, dict[str, Any] | None] | None = None,
     ) -> float | None:
         """计算净资产收益率 ROE = 净利润 / 平均股东权益
 
@@ -97,41 +280,42 @@ class FundamentalFactorCalculator:
             stock_code: 股票代码
             period: 报告期
             financial_data: 财务数据
+            period_cache: 已预取的各报告期财务数据，包含上期时不再单独获取
 
         Returns:
             ROE值
         """
-        try:
-            net_profit = financial_data.get("net_profit", 0)
-            total_equity = financial_data.get("total_equity", 0)
+        net_profit = financial_data.get("net_profit", 0)
+        total_equity = financial_data.get("total_equity", 0)
 
-            if total_equity == 0:
-                return None
+        if net_profit is None or total_equity in (None, 0):
+            return None
 
-            # 获取期初股东权益计算平均值
-            prev_period = self._get_previous_period(period)
-            prev_financial_data = await self._get_financial_data(
-                stock_code, prev_period
-            )
+        # 获取期初股东权益计算平均值
+        prev_financial_data = await self._get_cached_period_data(
+            stock_code, self._get_previous_period(period), period_cache
+        )
 
-            if prev_financial_data:
-                prev_equity = prev_financial_data.get("total_equity", total_equity)
-                avg_equity = (total_equity + prev_equity) / 2
-            else:
-                avg_equity = total_equity
-
-            if avg_equity == 0:
+        if prev_financial_data:
+            prev_equity = prev_financial_data.get("total_equity", total_equity)
+            if prev_equity is None:
                 return None
+            avg_equity = (total_equity + prev_equity) / 2
+        else:
+            avg_equity = total_equity
 
-            roe = net_profit / avg_equity
-            return float(round(roe, 6))
-
-        except Exception as e:
-            logger.error(f"计算ROE失败: {e}")
+        if avg_equity == 0:
             return None
 
+        roe = net_profit / avg_equity
+        return float(round(roe, 6))
+
     async def calculate_roa(
-        self, stock_code: str, period: str, financial_data: dict
+        self,
+        stock_code: str,
+        period: str,
+        financial_data: dict,
+        period_cache: dict[str, dict[str, Any] | None] | None = None,
     ) -> float | None:
         """计算总资产收益率 ROA = 净利润 / 平均总资产
 
@@ -139,40 +323,37 @@ class FundamentalFactorCalculator:
             stock_code: 股票代码
             period: 报告期
             financial_data: 财务数据
+            period_cache: 已预取的各报告期财务数据，包含上期时不再单独获取
 
         Returns:
             ROA值
         """
-        try:
-            net_profit = financial_data.get("net_profit", 0)
-            total_assets = financial_data.get("total_assets", 0)
+        net_profit = financial_data.get("net_profit", 0)
+        total_assets = financial_data.get("total_assets", 0)
 
-            if total_assets == 0:
-                return None
+        if net_profit is None or total_assets in (None, 0):
+            return None
 
-            # 获取期初总资产计算平均值
-            prev_period = self._get_previous_period(period)
-            prev_financial_data = await self._get_financial_data(
-                stock_code, prev_period
-            )
+        # 获取期初总资产计算平均值
+        prev_financial_data = await self._get_cached_period_data(
+            stock_code, self._get_previous_period(period), period_cache
+        )
 
-            if prev_financial_data:
-                prev_assets = prev_financial_data.get("total_assets", total_assets)
-                avg_assets = (total_assets + prev_assets) / 2
-            else:
-                avg_assets = total_assets
-
-            if avg_assets == 0:
+        if prev_financial_data:
+            prev_assets = prev_financial_data.get("total_assets", total_assets)
+            if prev_assets is None:
                 return None
+            avg_assets = (total_assets + prev_assets) / 2
+        else:
+            avg_assets = total_assets
 
-            roa = net_profit / avg_assets
-            return float(round(roa, 6))
-
-        except Exception as e:
-            logger.error(f"计算ROA失败: {e}")
+        if avg_assets == 0:
             return None
 
-    async def calculate_gross_margin(
+        roa = net_profit / avg_assets
+        return float(round(roa, 6))
+
+    def calculate_gross_margin(
         self, stock_code: str, period: str, financial_data: dict
     ) -> float | None:
         """计算毛利率 = (营业收入 - 营业成本) / 营业收入
@@ -185,21 +366,16 @@ class FundamentalFactorCalculator:
         Returns:
             毛利率
         """
-        try:
-            revenue = financial_data.get("revenue", 0)
-            cost_of_sales = financial_data.get("cost_of_sales", 0)
-
-            if revenue == 0:
-                return None
-
-            gross_margin = (revenue - cost_of_sales) / revenue
-            return float(round(gross_margin, 6))
+        revenue = financial_data.get("revenue", 0)
+        cost_of_sales = financial_data.get("cost_of_sales", 0)
 
-        except Exception as e:
-            logger.error(f"计算毛利率失败: {e}")
+        if cost_of_sales is None or revenue in (None, 0):
             return None
 
-    async def calculate_net_profit_margin(
+        gross_margin = (revenue - cost_of_sales) / revenue
+        return float(round(gross_margin, 6))
+
+    def calculate_net_profit_margin(
         self, stock_code: str, period: str, financial_data: dict
     ) -> float | None:
         """计算净利率 = 净利润 / 营业收入
@@ -212,21 +388,16 @@ class FundamentalFactorCalculator:
         Returns:
             净利率
         """
-        try:
-            net_profit = financial_data.get("net_profit", 0)
-            revenue = financial_data.get("revenue", 0)
-
-            if revenue == 0:
-                return None
+        net_profit = financial_data.get("net_profit", 0)
+        revenue = financial_data.get("revenue", 0)
 
-            net_margin = net_profit / revenue
-            return float(round(net_margin, 6))
-
-        except Exception as e:
-            logger.error(f"计算净利率失败: {e}")
+        if net_profit is None or revenue in (None, 0):
             return None
 
-    async def calculate_debt_ratio(
+        net_margin = net_profit / revenue
+        return float(round(net_margin, 6))
+
+    def calculate_debt_ratio(
         self, stock_code: str, period: str, financial_data: dict
     ) -> float | None:
         """计算资产负债率 = 总负债 / 总资产
@@ -239,21 +410,16 @@ class FundamentalFactorCalculator:
         Returns:
             资产负债率
         """
-        try:
-            total_liabilities = financial_data.get("total_liabilities", 0)
-            total_assets = financial_data.get("total_assets", 0)
+        total_liabilities = financial_data.get("total_liabilities", 0)
+        total_assets = financial_data.get("total_assets", 0)
 
-            if total_assets == 0:
-                return None
-
-            debt_ratio = total_liabilities / total_assets
-            return float(round(debt_ratio, 6))
-
-        except Exception as e:
-            logger.error(f"计算资产负债率失败: {e}")
+        if total_liabilities is None or total_assets in (None, 0):
             return None
 
-    async def calculate_current_ratio(
+        debt_ratio = total_liabilities / total_assets
+        return float(round(debt_ratio, 6))
+
+    def calculate_current_ratio(
         self, stock_code: str, period: str, financial_data: dict
     ) -> float | None:
         """计算流动比率 = 流动资产 / 流动负债
@@ -266,26 +432,22 @@ class FundamentalFactorCalculator:
         Returns:
             流动比率
         """
-        try:
-            current_assets = financial_data.get("current_assets", 0)
-            current_liabilities = financial_data.get("current_liabilities", 0)
-
-            if current_liabilities == 0:
-                return None
-
-            current_ratio = current_assets / current_liabilities
-            return float(round(current_ratio, 6))
+        current_assets = financial_data.get("current_assets", 0)
+        current_liabilities = financial_data.get("current_liabilities", 0)
 
-        except Exception as e:
-            logger.error(f"计算流动比率失败: {e}")
+        if current_assets is None or current_liabilities in (None, 0):
             return None
 
+        current_ratio = current_assets / current_liabilities
+        return float(round(current_ratio, 6))
+
     async def calculate_growth_rates(
         self,
         stock_code: str,
         current_period: str,
         factors: list[str],
         report_type: str = "quarterly",
+        period_cache: dict[str, dict[str, Any] | None] | None = None,
     ) -> dict[str, float | None]:
         """计算同比增长率
 
@@ -294,6 +456,7 @@ class FundamentalFactorCalculator:
             current_period: 当前报告期
             factors: 因子列表
             report_type: 报告类型
+            period_cache: 已预取的各报告期财务数据（见get_period_data），为空时按需获取
 
         Returns:
             增长率字典
@@ -304,47 +467,202 @@ class FundamentalFactorCalculator:
             # 获取上年同期
             prev_year_period = self._get_previous_year_period(current_period)
 
-            # 获取当前期和上年同期的财务数据
-            current_data = await self._get_financial_data(
-                stock_code, current_period, report_type
-            )
-            prev_data = await self._get_financial_data(
-                stock_code, prev_year_period, report_type
-            )
+            # 一次性获取当前期、上年同期及其计算所需的上期财务数据
+            if period_cache is None:
+                period_cache = await self.get_period_data(
+                    stock_code, current_period, factors, report_type, include_prior_year=True
+                )
+            current_data = period_cache.get(current_period)
+            prev_data = period_cache.get(prev_year_period)
 
             if not current_data or not prev_data:
                 logger.warning(f"无法获取{stock_code}的历史数据进行同比计算")
                 return {f"{factor}_YOY": None for factor in factors}
 
-            # 计算各因子的同比增长率
-            for factor in factors:
-                if factor in self.supported_factors:
-                    try:
-                        current_value = await self.supported_factors[factor](
-                            stock_code, current_period, current_data
+            # 当前期和上年同期在同一次列运算中计算，缺失值为NaN
+            supported = [factor for factor in factors if factor in self.supported_factors]
+            prior_rows: list[dict[str, Any] | None] = [None, None]
+            if PRIOR_PERIOD_FACTORS.intersection(supported):
+                prior_rows = list(
+                    await asyncio.gather(
+                        *(
+                            self._get_cached_period_data(
+                                stock_code, self._get_previous_period(p), period_cache
+                            )
+                            for p in (current_period, prev_year_period)
                         )
-                        prev_value = await self.supported_factors[factor](
-                            stock_code, prev_year_period, prev_data
-                        )
-
-                        if (
-                            current_value is not None
-                            and prev_value is not None
-                            and prev_value != 0
-                        ):
-                            growth_rate = (current_value - prev_value) / abs(prev_value)
-                            growth_rates[f"{factor}_YOY"] = round(growth_rate, 6)
-                        else:
-                            growth_rates[f"{factor}_YOY"] = None
-                    except Exception as e:
-                        logger.warning(f"计算{factor}同比增长率失败: {e}")
-                        growth_rates[f"{factor}_YOY"] = None
+                    )
+                )
+            arrays = self._ratio_factor_arrays([current_data, prev_data], prior_rows)
+            current_values = np.array([arrays[factor][0] for factor in supported])
+            prev_values = np.array([arrays[factor][1] for factor in supported])
+
+            # 一次性计算全部增长率，任一期缺失或上年同期为0时结果为NaN
+            with np.errstate(divide="ignore", invalid="ignore"):
+                growth = np.where(
+                    prev_values != 0,
+                    np.round((current_values - prev_values) / np.abs(prev_values), 6),
+                    np.nan,
+                )
+            growth_rates = {
+                f"{factor}_YOY": None if np.isnan(rate) else rate
+                for factor, rate in zip(supported, growth.tolist(), strict=True)
+            }
 
         except Exception as e:
             logger.error(f"计算同比增长率失败: {e}")
 
         return growth_rates
 
+    def calculate_ratio_factors(
+        self,
+        factors: list[str],
+        financial_data: list[dict[str, Any]],
+        prev_financial_data: list[dict[str, Any] | None] | None = None,
+    ) -> list[dict[str, float | None]]:
+        """批量计算多份财务数据的比率因子
+
+        全部数据按字段组成数组后一次性计算，不逐份逐因子执行Python运算
+
+        Args:
+            factors: 要计算的因子列表，不支持的因子不返回
+            financial_data: 财务数据列表（不同股票或报告期）
+            prev_financial_data: 与financial_data一一对应的上期财务数据，
+                用于计算ROE/ROA的平均值，缺失时使用期末值
+
+        Returns:
+            与financial_data一一对应的因子结果字典，无法计算的因子为None
+        """
+        if prev_financial_data is None:
+            prev_financial_data = [None] * len(financial_data)
+        arrays = self._ratio_factor_arrays(financial_data, prev_financial_data)
+        supported = [factor for factor in factors if factor in arrays]
+        columns = {factor: arrays[factor].tolist() for factor in supported}
+        return [
+            {
+                factor: None if np.isnan(columns[factor][i]) else columns[factor][i]
+                for factor in supported
+            }
+            for i in range(len(financial_data))
+        ]
+
+    @staticmethod
+    def _ratio_factor_arrays(
+        financial_data: list[dict[str, Any]],
+        prev_financial_data: list[dict[str, Any] | None],
+    ) -> dict[str, np.ndarray]:
+        """将财务数据按字段组成float64数组并计算全部比率因子"""
+        columns = {
+            field: np.array([data.get(field, 0) for data in financial_data], dtype=float)
+            for field in _RATIO_FIELDS
+        }
+        # 无上期数据或上期缺少该字段时以期末值作为期初值
+        prev_columns = {
+            field: np.array(
+                [
+                    prev.get(field, data.get(field, 0)) if prev else data.get(field, 0)
+                    for data, prev in zip(financial_data, prev_financial_data, strict=True)
+                ],
+                dtype=float,
+            )
+            for field in ("total_equity", "total_assets")
+        }
+        return _compute_ratio_factors(
+            prev_equity=prev_columns["total_equity"],
+            prev_assets=prev_columns["total_assets"],
+            **columns,
+        )
+
+    async def get_period_data(
+        self,
+        stock_code: str,
+        period: str,
+        factors: list[str],
+        report_type: str = "quarterly",
+        include_prior_year: bool = False,
+        financial_data: dict[str, Any] | None = None,
+    ) -> dict[str, dict[str, Any] | None]:
+        """并发获取计算因子所需的各报告期财务数据
+
+        本期数据始终获取；ROE/ROA需要上期数据，同比增长率需要上年同期
+        （及其上期）数据，每个报告期只获取一次
+
+        Args:
+            stock_code: 股票代码
+            period: 报告期，如2023Q3
+            factors: 要计算的因子列表
+            report_type: 报告类型，quarterly或annual
+            include_prior_year: 是否包含计算同比增长率所需的上年同期数据
+            financial_data: 已预取的本期财务数据
+
+        Returns:
+            以报告期为键的财务数据字典，无数据的报告期对应None
+        """
+        base_periods = [period]
+        if include_prior_year:
+            base_periods.append(self._get_previous_year_period(period))
+
+        needed_periods = list(base_periods)
+        if PRIOR_PERIOD_FACTORS.intersection(factors):
+            needed_periods.extend(self._get_previous_period(p) for p in base_periods)
+
+        period_cache: dict[str, dict[str, Any] | None] = {}
+        if financial_data:
+            period_cache[period] = financial_data
+        missing = [p for p in dict.fromkeys(needed_periods) if p not in period_cache]
+        results = await asyncio.gather(
+            *(self._get_financial_data(stock_code, p, report_type) for p in missing)
+        )
+        period_cache.update(zip(missing, results, strict=True))
+        return period_cache
+
+    async def _get_cached_period_data(
+        self,
+        stock_code: str,
+        period: str,
+        period_cache: dict[str, dict[str, Any] | None] | None,
+    ) -> dict[str, Any] | None:
+        """优先从period_cache读取指定报告期的财务数据，未包含时单独获取"""
+        if period_cache is not None and period in period_cache:
+            return period_cache[period]
+        return await self._get_financial_data(stock_code, period)
+
+    async def get_financial_data_bulk(
+        self, stock_codes: list[str], period: str, report_type: str = "quarterly"
+    ) -> dict[str, dict[str, Any] | None]:
+        """批量获取多只股票同一报告期的财务数据
+
+        财务接口每次只能查询一只股票，按股票并发获取（并发数受客户端限制），
+        已缓存的股票直接读取缓存；批量计算时在入口处调用一次，结果传给calculate_factors
+
+        Args:
+            stock_codes: 股票代码列表
+            period: 报告期，如2023Q3或2023
+            report_type: 报告类型，quarterly或annual
+
+        Returns:
+            以股票代码为键的财务数据字典，获取失败或无数据的股票对应None
+        """
+        end_date, period_type = self._resolve_period(period, report_type)
+        outcomes = await asyncio.gather(
+            *(
+                self._fetch_financial_data(
+                    _convert_stock_code(stock_code), end_date, period_type
+                )
+                for stock_code in stock_codes
+            ),
+            return_exceptions=True,
+        )
+
+        financial_data: dict[str, dict[str, Any] | None] = {}
+        for stock_code, outcome in zip(stock_codes, outcomes, strict=True):
+            if isinstance(outcome, BaseException):
+                logger.error(f"获取股票{stock_code}财务数据失败: {outcome}")
+                financial_data[stock_code] = None
+            else:
+                financial_data[stock_code] = outcome
+        return financial_data
+
     async def _get_financial_data(
         self, stock_code: str, period: str, report_type: str = "quarterly"
     ) -> dict[str, Any] | None:
@@ -360,140 +678,99 @@ class FundamentalFactorCalculator:
         """
         try:
             # 转换股票代码格式（如000001 -> 000001.SZ）
-            ts_code = self._convert_stock_code(stock_code)
-
-            # 解析期间
-            if report_type == "quarterly":
-                # 解析季度期间，如2023Q3 -> 20230930
-                end_date = self._parse_quarter_period(period)
-                period_type = 'Q'
-            else:
-                # 年度数据
-                end_date = f"{period}1231"
-                period_type = 'A'
-
-            # 获取利润表数据
-            income_data = await self.data_client.get_income_statement(
-                ts_code=ts_code,
-                end_date=end_date,
-                period=period_type
-            )
-
-            # 获取资产负债表数据
-            balance_data = await self.data_client.get_balance_sheet(
-                ts_code=ts_code,
-                end_date=end_date,
-                period=period_type
-            )
-
-            # 获取现金流量表数据
-            cashflow_data = await self.data_client.get_cashflow_statement(
-                ts_code=ts_code,
-                end_date=end_date,
-                period=period_type
-            )
-
-            # 获取财务指标数据
-            indicator_data = await self.data_client.get_financial_indicators(
-                ts_code=ts_code,
-                end_date=end_date,
-                period=period_type
-            )
-
-            # 合并财务数据
-            financial_data = {}
-
-            # 处理利润表数据
-            if not income_data.empty:
-                latest_income = income_data.iloc[0].to_dict()
-                financial_data.update({
-                    'revenue': latest_income.get('revenue', 0),  # 营业收入
-                    'total_profit': latest_income.get('total_profit', 0),  # 利润总额
-                    'n_income': latest_income.get('n_income', 0),  # 净利润
-                    'operate_profit': latest_income.get('operate_profit', 0),  # 营业利润
-                    'oper_cost': latest_income.get('oper_cost', 0),  # 营业成本
-                })
-
-            # 处理资产负债表数据
-            if not balance_data.empty:
-                latest_balance = balance_data.iloc[0].to_dict()
-                financial_data.update({
-                    'total_assets': latest_balance.get('total_assets', 0),  # 总资产
-                    'total_liab': latest_balance.get('total_liab', 0),  # 总负债
-                    'total_hldr_eqy_exc_min_int': latest_balance.get('total_hldr_eqy_exc_min_int', 0),  # 股东权益
-                    'total_cur_assets': latest_balance.get('total_cur_assets', 0),  # 流动资产
-                    'total_cur_liab': latest_balance.get('total_cur_liab', 0),  # 流动负债
-                })
-
-            # 处理现金流量表数据
-            if not cashflow_data.empty:
-                latest_cashflow = cashflow_data.iloc[0].to_dict()
-                financial_data.update({
-                    'n_cashflow_act': latest_cashflow.get('n_cashflow_act', 0),  # 经营活动现金流
-                })
-
-            # 处理财务指标数据
-            if not indicator_data.empty:
-                latest_indicator = indicator_data.iloc[0].to_dict()
-                financial_data.update({
-                    'roe': latest_indicator.get('roe', 0),  # ROE
-                    'roa': latest_indicator.get('roa', 0),  # ROA
-                    'gross_margin': latest_indicator.get('grossprofit_margin', 0),  # 毛利率
-                    'netprofit_margin': latest_indicator.get('netprofit_margin', 0),  # 净利率
-                    'debt_to_assets': latest_indicator.get('debt_to_assets', 0),  # 资产负债率
-                    'current_ratio': latest_indicator.get('current_ratio', 0),  # 流动比率
-                })
-
-            return financial_data if financial_data else None
+            ts_code = _convert_stock_code(stock_code)
+            end_date, period_type = self._resolve_period(period, report_type)
+            return await self._fetch_financial_data(ts_code, end_date, period_type)
 
         except Exception as e:
             logger.error(f"获取财务数据失败: {e}")
             return None
 
-    def _convert_stock_code(self, stock_code: str) -> str:
-        """转换股票代码格式
+    @redis_cached(FINANCIAL_DATA_KEY, _financial_data_ttl)
+    async def _fetch_financial_data(
+        self, ts_code: str, end_date: str, period_type: str
+    ) -> dict[str, Any] | None:
+        """从Tushare获取并合并四张报表的数据
+
+        已披露报告期的财报基本不再变化，合并结果按报告期缓存到Redis，
+        ROE/ROA计算所需的上期数据同样命中缓存
 
         Args:
-            stock_code: 原始股票代码，如000001
+            ts_code: Tushare格式的股票代码
+            end_date: 报告期结束日期，如20230930
+            period_type: 报告期类型，Q季报或A年报
 
         Returns:
-            Tushare格式的股票代码，如000001.SZ
-        """
-        if '.' in stock_code:
-            return stock_code
-
-        # 根据股票代码判断交易所
-        if stock_code.startswith('6'):
-            return f"{stock_code}.SH"  # 上海证券交易所
-        elif stock_code.startswith(('0', '3')):
-            return f"{stock_code}.SZ"  # 深圳证券交易所
-        else:
-            # 默认深圳
-            return f"{stock_code}.SZ"
+            财务数据字典，无数据时返回None
 
-    def _parse_quarter_period(self, period: str) -> str:
-        """解析季度期间
+        Raises:
+            DataSourceError: 报表数据获取失败
+        """
+        # 四张报表互不依赖，并发请求；任一报表失败时整体失败，避免缓存不完整的数据
+        income_data, balance_data, cashflow_data, indicator_data = await asyncio.gather(
+            self.data_client.get_income_statement(
+                ts_code=ts_code, end_date=end_date, period=period_type
+            ),
+            self.data_client.get_balance_sheet(
+                ts_code=ts_code, end_date=end_date, period=period_type
+            ),
+            self.data_client.get_cashflow_statement(
+                ts_code=ts_code, end_date=end_date, period=period_type
+            ),
+            self.data_client.get_financial_indicators(
+                ts_code=ts_code, end_date=end_date, period=period_type,
+                fields=INDICATOR_FIELDS,
+            ),
+        )
+
+        return self._merge_financial_data(
+            income_data, balance_data, cashflow_data, indicator_data
+        )
+
+    def _resolve_period(self, period: str, report_type: str) -> tuple[str, str]:
+        """将报告期转换为Tushare查询的结束日期和报告期类型
 
         Args:
-            period: 季度期间，如2023Q3
+            period: 报告期，如2023Q3或2023
+            report_type: 报告类型，quarterly或annual
 
         Returns:
-            结束日期，如20230930
+            (结束日期, 报告期类型)，如("20230930", "Q")
         """
-        if 'Q' not in period:
-            return f"{period}1231"  # 如果不是季度格式，默认为年末
-
-        year, quarter = period.split('Q')
-        quarter_end_dates = {
-            '1': '0331',
-            '2': '0630',
-            '3': '0930',
-            '4': '1231'
-        }
+        if report_type == "quarterly":
+            # 解析季度期间，如2023Q3 -> 20230930
+            return _parse_quarter_period(period), 'Q'
+        # 年度数据
+        return f"{period}1231", 'A'
 
-        return f"{year}{quarter_end_dates.get(quarter, '1231')}"
+    def _merge_financial_data(
+        self,
+        income_data: Any,
+        balance_data: Any,
+        cashflow_data: Any,
+        indicator_data: Any,
+    ) -> dict[str, Any] | None:
+        """合并四张报表的最新一期数据
 
+        Args:
+            income_data: 利润表DataFrame
+            balance_data: 资产负债表DataFrame
+            cashflow_data: 现金流量表DataFrame
+            indicator_data: 财务指标DataFrame
+
+        Returns:
+            财务数据字典，全部为空时返回None
+        """
+        financial_data: dict[str, Any] = {}
+        for frame, columns in (
+            (income_data, _INCOME_COLUMNS),
+            (balance_data, _BALANCE_COLUMNS),
+            (cashflow_data, _CASHFLOW_COLUMNS),
+            (indicator_data, _INDICATOR_COLUMNS),
+        ):
+            financial_data.update(_first_row_values(frame, columns))
 
+        return financial_data if financial_data else None
 
     def _get_previous_period(self, period: str) -> str:
         """获取上一期间
@@ -517,7 +794,7 @@ class FundamentalFactorCalculator:
             else:
                 # 年度数据
                 return str(int(period) - 1)
-        except Exception:
+        except ValueError:
             return period
 
 
@@ -540,5 +817,5 @@ class FundamentalFactorCalculator:
             else:
                 # 年度数据
                 return str(int(period) - 1)
-        except Exception:
+        except ValueError:
             return period
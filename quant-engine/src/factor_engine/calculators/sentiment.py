@@ -6,11 +6,22 @@
 from datetime import datetime, timedelta
 from typing import Any
 
+import numpy as np
 from loguru import logger
 
 from ...clients.data_collector_client import DataCollectorClient
 from ...nlp.sentiment_analyzer import SentimentAnalyzer
 
+# 程度修饰词及其权重
+DEGREE_WORDS = {
+    "大幅": 1.5, "显著": 1.4, "明显": 1.3, "大量": 1.3,
+    "急剧": 1.6, "暴涨": 1.8, "暴跌": 1.8, "飙升": 1.7,
+    "轻微": 0.7, "略微": 0.6, "小幅": 0.8, "稍微": 0.7
+}
+
+# 情绪分析结果中参与加权的字段
+SENTIMENT_KEYS = ("positive", "negative", "neutral", "confidence")
+
 
 class SentimentFactorCalculator:
     """情绪因子计算器
@@ -30,22 +41,18 @@ class SentimentFactorCalculator:
             "volume_weight": 0.2      # 新闻量权重
         }
 
-    def _calculate_time_weight(self, news_time: datetime, current_time: datetime) -> float:
+    def _calculate_time_weights(self, hours: np.ndarray) -> np.ndarray:
         """计算时间权重
 
         Args:
-            news_time: 新闻时间
-            current_time: 当前时间
+            hours: 各条新闻距当前时间的小时数
 
         Returns:
-            float: 时间权重（0-1）
+            np.ndarray: 时间权重（0-1）
         """
-        time_diff = (current_time - news_time).total_seconds() / 3600  # 小时差
-
-        # 指数衰减：权重 = exp(-decay_factor * hours)
-        import math
-        weight = math.exp(-self.weights["time_decay_factor"] * time_diff)
-        return max(0.01, weight)  # 最小权重0.01
+        # 指数衰减：权重 = exp(-decay_factor * hours)，最小权重0.01
+        weights = np.exp(-self.weights["time_decay_factor"] * hours)
+        return np.maximum(weights, 0.01)
 
     def _get_degree_modifier(self, text: str) -> float:
         """获取程度修饰词权重
@@ -56,16 +63,10 @@ class SentimentFactorCalculator:
         Returns:
             float: 程度修饰权重
         """
-        degree_words = {
-            "大幅": 1.5, "显著": 1.4, "明显": 1.3, "大量": 1.3,
-            "急剧": 1.6, "暴涨": 1.8, "暴跌": 1.8, "飙升": 1.7,
-            "轻微": 0.7, "略微": 0.6, "小幅": 0.8, "稍微": 0.7
-        }
-
         max_modifier = 1.0
-        for word, weight in degree_words.items():
-            if word in text:
-                max_modifier = max(max_modifier, weight)
+        for word, weight in DEGREE_WORDS.items():
+            if weight > max_modifier and word in text:
+                max_modifier = weight
 
         return max_modifier
 
@@ -89,14 +90,12 @@ class SentimentFactorCalculator:
             }
 
         current_time = datetime.now()
-        total_weighted_score = 0.0
-        total_weight = 0.0
-
-        positive_sum = 0.0
-        negative_sum = 0.0
-        neutral_sum = 0.0
 
-        confidence_scores = []
+        # 逐条新闻只做情绪分析，加权汇总在循环外以数组一次完成
+        title_scores = []
+        content_scores = []
+        modifiers = []
+        hours = []
 
         for news in news_data:
             try:
@@ -117,7 +116,7 @@ class SentimentFactorCalculator:
                 title_sentiment = await self.sentiment_analyzer.analyze_sentiment(title)
                 
                 # 验证标题情绪分析结果
-                if not all(key in title_sentiment for key in ["positive", "negative", "neutral", "confidence"]):
+                if not all(key in title_sentiment for key in SENTIMENT_KEYS):
                     logger.error(f"标题情绪分析结果不完整: {title_sentiment}")
                     continue
 
@@ -125,80 +124,44 @@ class SentimentFactorCalculator:
                 content_sentiment = await self.sentiment_analyzer.analyze_sentiment(content)
                 
                 # 验证内容情绪分析结果
-                if not all(key in content_sentiment for key in ["positive", "negative", "neutral", "confidence"]):
+                if not all(key in content_sentiment for key in SENTIMENT_KEYS):
                     logger.error(f"内容情绪分析结果不完整: {content_sentiment}")
                     continue
 
-                # 计算综合情绪分数
-                title_score = (
-                    title_sentiment["positive"] -
-                    title_sentiment["negative"]
-                )
-
-                content_score = (
-                    content_sentiment["positive"] -
-                    content_sentiment["negative"]
-                )
-
-                # 加权平均
-                combined_score = (
-                    self.weights["title_weight"] * title_score +
-                    self.weights["content_weight"] * content_score
-                )
-
                 # 程度修饰词调整
-                title_modifier = self._get_degree_modifier(title)
-                content_modifier = self._get_degree_modifier(content)
-                modifier = max(title_modifier, content_modifier)
-
-                combined_score *= modifier
-
-                # 时间权重
-                time_weight = self._calculate_time_weight(publish_time, current_time)
-
-                # 最终权重
-                final_weight = time_weight
-
-                # 累积加权分数
-                total_weighted_score += combined_score * final_weight
-                total_weight += final_weight
+                modifier = max(self._get_degree_modifier(title), self._get_degree_modifier(content))
 
-                # 累积各类情绪分数
-                avg_positive = (
-                    self.weights["title_weight"] * title_sentiment["positive"] +
-                    self.weights["content_weight"] * content_sentiment["positive"]
-                )
-                avg_negative = (
-                    self.weights["title_weight"] * title_sentiment["negative"] +
-                    self.weights["content_weight"] * content_sentiment["negative"]
-                )
-                avg_neutral = (
-                    self.weights["title_weight"] * title_sentiment["neutral"] +
-                    self.weights["content_weight"] * content_sentiment["neutral"]
-                )
+                # 距当前时间的小时差
+                hour_diff = (current_time - publish_time).total_seconds() / 3600
 
-                positive_sum += avg_positive * final_weight
-                negative_sum += avg_negative * final_weight
-                neutral_sum += avg_neutral * final_weight
-
-                # 收集置信度
-                avg_confidence = (
-                    self.weights["title_weight"] * title_sentiment["confidence"] +
-                    self.weights["content_weight"] * content_sentiment["confidence"]
-                )
-                confidence_scores.append(avg_confidence)
+                title_scores.append([title_sentiment[key] for key in SENTIMENT_KEYS])
+                content_scores.append([content_sentiment[key] for key in SENTIMENT_KEYS])
+                modifiers.append(modifier)
+                hours.append(hour_diff)
 
             except Exception as e:
                 logger.error(f"处理新闻数据失败: {str(e)}")
                 continue
 
         # 计算最终结果
-        if total_weight > 0:
-            final_sentiment_score = total_weighted_score / total_weight
-            final_positive = positive_sum / total_weight
-            final_negative = negative_sum / total_weight
-            final_neutral = neutral_sum / total_weight
-            final_confidence = sum(confidence_scores) / len(confidence_scores) if confidence_scores else 0.0
+        if hours:
+            # 标题与内容按权重合成，列依次为positive、negative、neutral、confidence
+            blended = (
+                self.weights["title_weight"] * np.asarray(title_scores, dtype=np.float64) +
+                self.weights["content_weight"] * np.asarray(content_scores, dtype=np.float64)
+            )
+            # 综合情绪分数 = (积极 - 消极) * 程度修饰
+            combined = (blended[:, 0] - blended[:, 1]) * np.asarray(modifiers, dtype=np.float64)
+
+            # 时间权重
+            time_weights = self._calculate_time_weights(np.asarray(hours, dtype=np.float64))
+            total_weight = time_weights.sum()
+
+            final_sentiment_score = float(time_weights @ combined / total_weight)
+            final_positive, final_negative, final_neutral = (
+                float(value) for value in time_weights @ blended[:, :3] / total_weight
+            )
+            final_confidence = float(blended[:, 3].mean())
         else:
             final_sentiment_score = 0.0
             final_positive = 0.0
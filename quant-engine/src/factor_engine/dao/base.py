@@ -4,11 +4,25 @@
 """
 
 from abc import ABC, abstractmethod
-from datetime import date, datetime
+from collections.abc import AsyncIterator
+from datetime import date, datetime, timedelta
+from decimal import Decimal, InvalidOperation
 from typing import Any, ClassVar
 
 from loguru import logger
-from sqlalchemy import and_, desc, func, select, text
+from sqlalchemy import (
+    Float,
+    Integer,
+    and_,
+    cast,
+    desc,
+    func,
+    lambda_stmt,
+    or_,
+    select,
+    type_coerce,
+)
+from sqlalchemy.dialects.mysql import insert as mysql_insert
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -19,8 +33,21 @@ from ..models.database import (
     TechnicalFactor,
 )
 from ..models.schemas import SentimentFactorResponse
+from .cache import (
+    SENTIMENT_BY_DATE_KEY,
+    SENTIMENT_FACTOR_KEY,
+    SENTIMENT_KEY_ARGS,
+    SENTIMENT_TREND_KEY,
+    SENTIMENT_TREND_TTL,
+    invalidate_sentiment_cache,
+    redis_cached,
+    ttl_by_date,
+)
 from ...config.connection_pool import get_db_session
 
+# 情绪因子目前只有新闻一个来源，各响应共享同一权重字典
+_NEWS_SOURCE_WEIGHTS: dict[str, float] = {"news": 1.0}
+
 
 class BaseFactorDAO(ABC):
     """因子数据访问基础类"""
@@ -192,6 +219,96 @@ class TechnicalFactorDAO(BaseFactorDAO):
             logger.error(f"根据股票代码和因子名称获取技术因子数据失败: {e}")
             raise e
 
+    # 流式读取历史数据时每批获取的行数
+    HISTORY_PARTITION_SIZE: ClassVar[int] = 500
+
+    @staticmethod
+    def _history_statement(
+        stock_code: str, factor_names: list[str], start_date: date, end_date: date
+    ) -> Any:
+        """构建技术因子历史查询语句
+
+        因子名称、日期区间过滤和排序均在SQL中完成，命中(stock_code, factor_name,
+        trade_date)联合索引；只查询响应需要的列，不构建ORM对象
+        """
+        return (
+            select(
+                TechnicalFactor.factor_name,
+                TechnicalFactor.trade_date,
+                TechnicalFactor.factor_value,
+            )
+            .where(
+                TechnicalFactor.stock_code == stock_code,
+                TechnicalFactor.factor_name.in_(factor_names),
+                TechnicalFactor.trade_date.between(start_date, end_date),
+            )
+            .order_by(TechnicalFactor.factor_name, TechnicalFactor.trade_date)
+        )
+
+    @classmethod
+    async def get_history(
+        cls,
+        stock_code: str,
+        factor_names: list[str],
+        start_date: date,
+        end_date: date,
+    ) -> list[Any]:
+        """获取股票多个技术因子在日期区间内的历史数据
+
+        Args:
+            stock_code: 股票代码
+            factor_names: 因子名称列表
+            start_date: 开始日期
+            end_date: 结束日期
+
+        Returns:
+            (factor_name, trade_date, factor_value)行列表，按因子名称、交易日期升序排列
+        """
+        try:
+            async with get_db_session() as session:
+                result = await session.execute(
+                    cls._history_statement(stock_code, factor_names, start_date, end_date)
+                )
+                return list(result.all())
+        except SQLAlchemyError as e:
+            logger.error(f"获取技术因子历史数据失败: {e}")
+            raise e
+
+    @classmethod
+    async def iter_history(
+        cls,
+        stock_code: str,
+        factor_names: list[str],
+        start_date: date,
+        end_date: date,
+    ) -> AsyncIterator[Any]:
+        """逐行产出股票多个技术因子在日期区间内的历史数据
+
+        与get_history查询相同，以服务端游标每次读取HISTORY_PARTITION_SIZE行，
+        内存占用与日期区间长度无关；迭代期间持有数据库会话
+
+        Args:
+            stock_code: 股票代码
+            factor_names: 因子名称列表
+            start_date: 开始日期
+            end_date: 结束日期
+
+        Yields:
+            (factor_name, trade_date, factor_value)行，按因子名称、交易日期升序排列
+        """
+        try:
+            async with get_db_session() as session:
+                result = await session.stream(
+                    cls._history_statement(stock_code, factor_names, start_date, end_date),
+                    execution_options={"yield_per": cls.HISTORY_PARTITION_SIZE},
+                )
+                async for partition in result.partitions():
+                    for row in partition:
+                        yield row
+        except SQLAlchemyError as e:
+            logger.error(f"流式获取技术因子历史数据失败: {e}")
+            raise
+
     @classmethod
     async def update(cls, factor_id: int, **kwargs: Any) -> bool:
         """更新技术因子数据"""
@@ -608,7 +725,7 @@ class NewsSentimentFactorDAO(BaseFactorDAO):
         try:
             async with get_db_session() as session:
                 result = await session.execute(
-                    select(SentimentFactor).where(SentimentFactor.id == factor_id)
+                    lambda_stmt(lambda: select(SentimentFactor).where(SentimentFactor.id == factor_id))
                 )
                 return result.scalar_one_or_none()
         except SQLAlchemyError as e:
@@ -623,8 +740,8 @@ class NewsSentimentFactorDAO(BaseFactorDAO):
         try:
             async with get_db_session() as session:
                 result = await session.execute(
-                    select(SentimentFactor).where(
-                        and_(
+                    lambda_stmt(
+                        lambda: select(SentimentFactor).where(
                             SentimentFactor.stock_code == stock_code,
                             SentimentFactor.calculation_date == calculation_date,
                         )
@@ -690,10 +807,12 @@ class NewsSentimentFactorDAO(BaseFactorDAO):
         try:
             async with get_db_session() as session:
                 result = await session.execute(
-                    select(SentimentFactor)
-                    .where(SentimentFactor.stock_code == stock_code)
-                    .order_by(desc(SentimentFactor.calculation_date))
-                    .limit(limit)
+                    lambda_stmt(
+                        lambda: select(SentimentFactor)
+                        .where(SentimentFactor.stock_code == stock_code)
+                        .order_by(desc(SentimentFactor.calculation_date))
+                        .limit(limit)
+                    )
                 )
                 return list(result.scalars().all())
         except SQLAlchemyError as e:
@@ -715,14 +834,16 @@ class NewsSentimentFactorDAO(BaseFactorDAO):
         """
         try:
             # 将字符串日期转换为date对象
-            date_obj = datetime.strptime(calculation_date, "%Y-%m-%d").date()
+            date_obj = date.fromisoformat(calculation_date)
             
             async with get_db_session() as session:
                 result = await session.execute(
-                    select(SentimentFactor)
-                    .where(SentimentFactor.calculation_date == date_obj)
-                    .order_by(desc(SentimentFactor.factor_value))
-                    .limit(limit)
+                    lambda_stmt(
+                        lambda: select(SentimentFactor)
+                        .where(SentimentFactor.calculation_date == date_obj)
+                        .order_by(desc(SentimentFactor.factor_value))
+                        .limit(limit)
+                    )
                 )
                 return list(result.scalars().all())
         except SQLAlchemyError as e:
@@ -769,43 +890,22 @@ class NewsSentimentFactorDAO(BaseFactorDAO):
         try:
             async with get_db_session() as session:
                 # 转换日期格式
-                calc_date = datetime.strptime(calculation_date, "%Y-%m-%d").date()
-                
-                # 检查是否已存在相同记录
-                existing = await session.execute(
-                    select(SentimentFactor).where(
-                        and_(
-                            SentimentFactor.stock_code == stock_code,
-                            SentimentFactor.calculation_date == calc_date,
-                        )
-                    )
-                )
-                existing_record = existing.scalar_one_or_none()
+                calc_date = date.fromisoformat(calculation_date)
 
-                if existing_record:
-                    # 更新现有记录
-                    existing_record.factor_value = sentiment_factor
-                    existing_record.news_count = news_count
-                    existing_record.updated_at = datetime.now()
-
-                    await session.commit()
-                    logger.info(f"更新情绪因子数据: {stock_code} - {calculation_date}")
-                    return int(existing_record.id)
-                else:
-                    # 创建新记录
-                    sentiment_factor_record = SentimentFactor(
-                        stock_code=stock_code,
-                        factor_value=sentiment_factor,
-                        calculation_date=calc_date,
-                        news_count=news_count,
-                    )
-
-                    session.add(sentiment_factor_record)
-                    await session.commit()
-                    await session.refresh(sentiment_factor_record)
+                # 按(stock_code, calculation_date)唯一键一次完成插入或更新
+                result = await session.execute(
+                    cls._upsert_statement([{
+                        "stock_code": stock_code,
+                        "factor_value": sentiment_factor,
+                        "calculation_date": calc_date,
+                        "news_count": news_count,
+                    }])
+                )
+                await session.commit()
 
-                    logger.info(f"保存情绪因子数据: {stock_code} - {calculation_date}")
-                    return int(sentiment_factor_record.id)
+            await invalidate_sentiment_cache([(stock_code, calculation_date)])
+            logger.info(f"保存情绪因子数据: {stock_code} - {calculation_date}")
+            return int(result.lastrowid)
 
         except SQLAlchemyError as e:
             logger.error(f"保存情绪因子数据失败: {e}")
@@ -814,6 +914,74 @@ class NewsSentimentFactorDAO(BaseFactorDAO):
             logger.error(f"保存情绪因子数据时发生未知错误: {e}")
             raise
 
+    @staticmethod
+    def _upsert_statement(rows: list[dict[str, Any]]) -> Any:
+        """构建情绪因子的INSERT ... ON DUPLICATE KEY UPDATE语句
+
+        已存在的记录更新因子值和新闻数量，并通过LAST_INSERT_ID(id)
+        使lastrowid在更新时也返回该记录的ID
+        """
+        stmt = mysql_insert(SentimentFactor).values(rows)
+        return stmt.on_duplicate_key_update(
+            id=func.last_insert_id(SentimentFactor.id),
+            factor_value=stmt.inserted.factor_value,
+            news_count=stmt.inserted.news_count,
+            updated_at=func.now(),
+        )
+
+    # 批量保存时单条INSERT语句包含的最大行数
+    BULK_UPSERT_CHUNK_SIZE: ClassVar[int] = 1000
+
+    # 流式读取时每批获取的行数
+    STREAM_PARTITION_SIZE: ClassVar[int] = 200
+
+    @classmethod
+    async def save_sentiment_factors_bulk(cls, records: list[dict[str, Any]]) -> int:
+        """批量保存情绪因子数据
+
+        按BULK_UPSERT_CHUNK_SIZE分块执行多行INSERT ... ON DUPLICATE KEY UPDATE，
+        所有分块在同一事务中提交
+
+        Args:
+            records: 情绪因子记录列表，每条包含stock_code、sentiment_factor、
+                news_count、calculation_date (YYYY-MM-DD)
+
+        Returns:
+            int: 保存的记录数
+
+        Raises:
+            SQLAlchemyError: 数据库操作异常
+        """
+        if not records:
+            return 0
+
+        rows = [
+            {
+                "stock_code": record["stock_code"],
+                "factor_value": record["sentiment_factor"],
+                "calculation_date": date.fromisoformat(record["calculation_date"]),
+                "news_count": record["news_count"],
+            }
+            for record in records
+        ]
+
+        try:
+            async with get_db_session() as session:
+                for start in range(0, len(rows), cls.BULK_UPSERT_CHUNK_SIZE):
+                    chunk = rows[start:start + cls.BULK_UPSERT_CHUNK_SIZE]
+                    await session.execute(cls._upsert_statement(chunk))
+                await session.commit()
+
+            await invalidate_sentiment_cache(
+                (record["stock_code"], record["calculation_date"]) for record in records
+            )
+            logger.info(f"批量保存情绪因子数据: {len(rows)}条")
+            return len(rows)
+
+        except SQLAlchemyError as e:
+            logger.error(f"批量保存情绪因子数据失败: {e}")
+            raise
+
     @classmethod
     async def save_sentiment_factor(
         cls,
@@ -862,6 +1030,12 @@ class NewsSentimentFactorDAO(BaseFactorDAO):
         )
 
     @classmethod
+    @redis_cached(
+        SENTIMENT_FACTOR_KEY,
+        ttl_by_date("date"),
+        model=SentimentFactorResponse,
+        key_args=SENTIMENT_KEY_ARGS,
+    )
     async def get_sentiment_factor_response(
         cls, stock_code: str, date: str
     ) -> Any:
@@ -876,12 +1050,12 @@ class NewsSentimentFactorDAO(BaseFactorDAO):
         """
         try:
             # 将字符串日期转换为date对象
-            date_obj = datetime.strptime(date, "%Y-%m-%d").date()
+            date_obj = datetime.fromisoformat(date).date()
             
             async with get_db_session() as session:
                 result = await session.execute(
-                    select(SentimentFactor).where(
-                        and_(
+                    lambda_stmt(
+                        lambda: select(SentimentFactor).where(
                             SentimentFactor.stock_code == stock_code,
                             SentimentFactor.calculation_date == date_obj,
                         )
@@ -900,7 +1074,7 @@ class NewsSentimentFactorDAO(BaseFactorDAO):
                             "neutral_score": 0.0,
                             "confidence": 0.0,
                         },
-                        source_weights={"news": 1.0},
+                        source_weights=_NEWS_SOURCE_WEIGHTS,
                         data_counts={"news_count": record.news_count},
                     )
                 return None
@@ -912,44 +1086,89 @@ class NewsSentimentFactorDAO(BaseFactorDAO):
             logger.error(f"获取情绪因子数据时发生未知错误: {e}")
             raise
 
+    @staticmethod
+    def by_date_cursor(response: SentimentFactorResponse) -> str:
+        """生成按日期查询的分页游标：因子值|股票代码"""
+        return f"{response.sentiment_factors['sentiment_factor']:.6f}|{response.stock_code}"
+
+    @staticmethod
+    def _parse_by_date_cursor(cursor: str) -> tuple[Decimal, str]:
+        """解析按日期查询的分页游标
+
+        Raises:
+            ValueError: 游标格式无效
+        """
+        value, _, stock_code = cursor.partition("|")
+        try:
+            return Decimal(value), stock_code
+        except InvalidOperation as e:
+            raise ValueError(f"无效的分页游标: {cursor}") from e
+
     @classmethod
-    async def get_sentiment_factors_by_date_response(
-        cls, calculation_date: str, limit: int = 100
-    ) -> list[Any]:
-        """获取指定日期的所有情绪因子
+    async def iter_sentiment_factors_by_date(
+        cls, calculation_date: str, limit: int = 100, cursor: str | None = None
+    ) -> AsyncIterator[SentimentFactorResponse]:
+        """逐条产出指定日期的情绪因子
+
+        按因子值降序、股票代码升序排列，以服务端游标分批读取；迭代期间持有数据库会话，
+        适合全市场数据的流式输出
 
         Args:
             calculation_date: 计算日期
             limit: 返回记录数限制
+            cursor: 上一页最后一条记录的游标，见by_date_cursor
 
-        Returns:
-            list[SentimentFactorResponse]: 情绪因子响应对象列表
+        Yields:
+            SentimentFactorResponse: 情绪因子响应对象
+
+        Raises:
+            ValueError: 日期或游标格式无效
         """
+        # 将字符串日期转换为date对象
+        date_obj = date.fromisoformat(calculation_date)
+
         try:
             async with get_db_session() as session:
-                # 将字符串日期转换为date对象
-                date_obj = datetime.strptime(calculation_date, "%Y-%m-%d").date()
-                
-                result = await session.execute(
-                    select(SentimentFactor)
-                    .where(SentimentFactor.calculation_date == date_obj)
-                    .order_by(desc(SentimentFactor.factor_value))
-                    .limit(limit)
+                # 只查询响应需要的列，不构建ORM对象
+                stmt = lambda_stmt(
+                    lambda: select(
+                        SentimentFactor.stock_code,
+                        SentimentFactor.calculation_date,
+                        SentimentFactor.factor_value,
+                        SentimentFactor.news_count,
+                    ).where(SentimentFactor.calculation_date == date_obj)
                 )
-                records = result.scalars().all()
-
-                return [
-                    SentimentFactorResponse(
-                        stock_code=record.stock_code,
-                        date=record.calculation_date.isoformat(),
-                        sentiment_factors={
-                            "sentiment_factor": record.factor_value,
-                        },
-                        source_weights={"news": 1.0},
-                        data_counts={"news_count": record.news_count},
+                if cursor:
+                    after_value, after_code = cls._parse_by_date_cursor(cursor)
+                    stmt += lambda s: s.where(
+                        or_(
+                            SentimentFactor.factor_value < after_value,
+                            and_(
+                                SentimentFactor.factor_value == after_value,
+                                SentimentFactor.stock_code > after_code,
+                            ),
+                        )
                     )
-                    for record in records
-                ]
+                stmt += lambda s: s.order_by(
+                    desc(SentimentFactor.factor_value), SentimentFactor.stock_code
+                ).limit(limit)
+
+                result = await session.stream(
+                    stmt, execution_options={"yield_per": cls.STREAM_PARTITION_SIZE}
+                )
+
+                # 数据库返回的列类型已确定，跳过逐行的Pydantic校验直接构造响应
+                async for partition in result.partitions():
+                    for stock_code, calc_date, factor_value, news_count in partition:
+                        yield SentimentFactorResponse.model_construct(
+                            stock_code=stock_code,
+                            date=calc_date.isoformat(),
+                            sentiment_factors={
+                                "sentiment_factor": float(factor_value),
+                            },
+                            source_weights=_NEWS_SOURCE_WEIGHTS,
+                            data_counts={"news_count": news_count},
+                        )
 
         except SQLAlchemyError as e:
             logger.error(f"获取日期情绪因子数据失败: {e}")
@@ -959,6 +1178,39 @@ class NewsSentimentFactorDAO(BaseFactorDAO):
             raise
 
     @classmethod
+    @redis_cached(
+        SENTIMENT_BY_DATE_KEY,
+        ttl_by_date("calculation_date"),
+        model=list[SentimentFactorResponse],
+        key_args=SENTIMENT_KEY_ARGS,
+    )
+    async def get_sentiment_factors_by_date_response(
+        cls, calculation_date: str, limit: int = 100, cursor: str | None = None
+    ) -> list[Any]:
+        """获取指定日期的所有情绪因子
+
+        按因子值降序、股票代码升序排列，使用游标（键集）分页
+
+        Args:
+            calculation_date: 计算日期
+            limit: 返回记录数限制
+            cursor: 上一页最后一条记录的游标，见by_date_cursor
+
+        Returns:
+            list[SentimentFactorResponse]: 情绪因子响应对象列表
+
+        Raises:
+            ValueError: 日期或游标格式无效
+        """
+        return [
+            response
+            async for response in cls.iter_sentiment_factors_by_date(
+                calculation_date, limit, cursor
+            )
+        ]
+
+    @classmethod
+    @redis_cached(SENTIMENT_TREND_KEY, SENTIMENT_TREND_TTL, key_args=SENTIMENT_KEY_ARGS)
     async def get_sentiment_trend(
         cls, stock_code: str, days: int = 30
     ) -> list[dict[str, Any]]:
@@ -974,25 +1226,31 @@ class NewsSentimentFactorDAO(BaseFactorDAO):
 
         try:
             async with get_db_session() as session:
+                # 只查询趋势需要的列，不构建ORM对象
                 result = await session.execute(
-                    select(SentimentFactor)
-                    .where(SentimentFactor.stock_code == stock_code)
-                    .order_by(desc(SentimentFactor.calculation_date))
-                    .limit(days)
+                    lambda_stmt(
+                        lambda: select(
+                            SentimentFactor.calculation_date,
+                            SentimentFactor.factor_value,
+                            SentimentFactor.news_count,
+                        )
+                        .where(SentimentFactor.stock_code == stock_code)
+                        .order_by(desc(SentimentFactor.calculation_date))
+                        .limit(days)
+                    )
                 )
-                records = result.scalars().all()
 
                 return [
                     {
-                        "date": record.calculation_date.strftime("%Y-%m-%d"),
-                        "sentiment_factor": float(record.factor_value),
+                        "date": calc_date.strftime("%Y-%m-%d"),
+                        "sentiment_factor": float(factor_value),
                         "positive_score": 0.0,  # 暂时使用默认值
                         "negative_score": 0.0,  # 暂时使用默认值
                         "neutral_score": 1.0,   # 暂时使用默认值
                         "confidence": 0.5,      # 暂时使用默认值
-                        "news_count": record.news_count,
+                        "news_count": news_count,
                     }
-                    for record in records
+                    for calc_date, factor_value, news_count in result.all()
                 ]
 
         except SQLAlchemyError as e:
@@ -1016,48 +1274,47 @@ class NewsSentimentFactorDAO(BaseFactorDAO):
             dict[str, Any]: 统计数据
         """
 
+        # 在Python中计算起始日期，使calculation_date条件可走索引范围扫描
+        cutoff = date.today() - timedelta(days=days)
+
         try:
             async with get_db_session() as session:
-                # 获取统计数据
+                # 空值合并和类型转换在查询中完成，结果行可直接转换为字典；
+                # 无数据时聚合结果全部为0
                 result = await session.execute(
-                    select(
-                        func.avg(SentimentFactor.factor_value).label("avg_sentiment"),
-                        func.max(SentimentFactor.factor_value).label("max_sentiment"),
-                        func.min(SentimentFactor.factor_value).label("min_sentiment"),
-                        func.stddev(SentimentFactor.factor_value).label("std_sentiment"),
-                        func.sum(SentimentFactor.news_count).label("total_news"),
-                        func.count(SentimentFactor.id).label("total_days"),
-                    ).where(
-                        and_(
+                    lambda_stmt(
+                        lambda: select(
+                            type_coerce(
+                                func.coalesce(func.avg(SentimentFactor.factor_value), 0), Float
+                            ).label("average_sentiment"),
+                            type_coerce(
+                                func.coalesce(func.max(SentimentFactor.factor_value), 0), Float
+                            ).label("max_sentiment"),
+                            type_coerce(
+                                func.coalesce(func.min(SentimentFactor.factor_value), 0), Float
+                            ).label("min_sentiment"),
+                            type_coerce(
+                                func.coalesce(func.stddev(SentimentFactor.factor_value), 0), Float
+                            ).label("std_sentiment"),
+                            cast(
+                                func.coalesce(func.sum(SentimentFactor.news_count), 0), Integer
+                            ).label("total_news"),
+                            func.count(SentimentFactor.id).label("total_days"),
+                            type_coerce(
+                                func.coalesce(
+                                    func.sum(SentimentFactor.news_count)
+                                    / func.nullif(func.count(SentimentFactor.id), 0),
+                                    0,
+                                ),
+                                Float,
+                            ).label("avg_news_per_day"),
+                        ).where(
                             SentimentFactor.stock_code == stock_code,
-                            SentimentFactor.calculation_date >= func.date_sub(
-                                func.curdate(), text(f"INTERVAL {days} DAY")
-                            ),
+                            SentimentFactor.calculation_date >= cutoff,
                         )
                     )
                 )
-                stats = result.first()
-
-                if stats and stats.total_days > 0:
-                    return {
-                        "average_sentiment": float(stats.avg_sentiment or 0),
-                        "max_sentiment": float(stats.max_sentiment or 0),
-                        "min_sentiment": float(stats.min_sentiment or 0),
-                        "std_sentiment": float(stats.std_sentiment or 0),
-                        "total_news": int(stats.total_news or 0),
-                        "total_days": int(stats.total_days or 0),
-                        "avg_news_per_day": float((stats.total_news or 0) / stats.total_days),
-                    }
-                else:
-                    return {
-                        "average_sentiment": 0.0,
-                        "max_sentiment": 0.0,
-                        "min_sentiment": 0.0,
-                        "std_sentiment": 0.0,
-                        "total_news": 0,
-                        "total_days": 0,
-                        "avg_news_per_day": 0.0,
-                    }
+                return dict(result.one()._mapping)
 
         except SQLAlchemyError as e:
             logger.error(f"获取情绪统计数据失败: {e}")
@@ -3,13 +3,39 @@
 本模块定义了因子数据的Redis缓存策略，提供高性能的数据访问。
 """
 
+import functools
+import inspect
 import json
 import pickle
+from collections.abc import Awaitable, Callable, Iterable
 from datetime import date, datetime
-from typing import Any
+from typing import Any, ParamSpec, TypeVar
 
+from loguru import logger
+from pydantic import TypeAdapter
 from redis import Redis
 
+from ...config.redis import async_redis_client
+from ...utils.json_codec import json_dumps, json_loads
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+# 情绪因子查询缓存Key模板及TTL（秒）
+SENTIMENT_FACTOR_KEY = "sentiment:factor:{stock_code}:{date}"
+SENTIMENT_FACTOR_TTL = 86400
+SENTIMENT_BY_DATE_KEY = "sentiment:date:{calculation_date}:{limit}:{cursor}"
+SENTIMENT_TREND_KEY = "sentiment:trend:{stock_code}:{days}"
+SENTIMENT_TREND_TTL = 300
+# 当日情绪因子仍可能被重新计算，缓存时间较短
+SENTIMENT_TODAY_TTL = 900
+
+# 技术、基本面、市场因子缓存Key模板及TTL（秒），与FactorCacheManager的Key格式一致
+TECHNICAL_FACTOR_KEY = "factor:technical:{stock_code}:{factor_name}:{trade_date}"
+FUNDAMENTAL_FACTORS_KEY = "factor:fundamental:batch:{stock_code}:{period}"
+MARKET_FACTOR_KEY = "factor:market:{stock_code}:{factor_name}:{trade_date}"
+HOT_FACTOR_TTL = 3600
+
 
 class FactorCacheManager:
     """因子数据缓存管理器"""
@@ -567,3 +593,187 @@ def create_cache_manager(
     )
 
     return FactorCacheManager(redis_client)
+
+
+def canonical_date(value: str | date) -> str:
+    """将日期统一为YYYY-MM-DD格式
+
+    查询接口接受fromisoformat可解析的任意写法（如20240102、2024-01-02T09:30），
+    构建缓存Key、选择TTL和清除缓存前需统一，否则同一天的数据会落在不同的Key上
+
+    Raises:
+        ValueError: 日期格式无效
+    """
+    if isinstance(value, datetime):
+        return value.date().isoformat()
+    if isinstance(value, date):
+        return value.isoformat()
+    return datetime.fromisoformat(value).date().isoformat()
+
+
+def canonical_stock_code(stock_code: str) -> str:
+    """将股票代码统一为大写，如000001.sz -> 000001.SZ"""
+    return stock_code.upper()
+
+
+# 情绪因子查询缓存Key中需要统一格式的参数
+SENTIMENT_KEY_ARGS: dict[str, Callable[[Any], Any]] = {
+    "stock_code": canonical_stock_code,
+    "date": canonical_date,
+    "calculation_date": canonical_date,
+}
+
+
+def ttl_by_date(
+    date_arg: str, today_ttl: int = SENTIMENT_TODAY_TTL, history_ttl: int = SENTIMENT_FACTOR_TTL
+) -> Callable[[dict[str, Any]], int]:
+    """按查询日期选择缓存TTL
+
+    Args:
+        date_arg: 被装饰函数中表示日期的参数名
+        today_ttl: 查询当日及以后日期时的TTL
+        history_ttl: 查询历史日期时的TTL
+    """
+
+    def choose(arguments: dict[str, Any]) -> int:
+        query_date = canonical_date(arguments[date_arg])
+        return today_ttl if query_date >= date.today().isoformat() else history_ttl
+
+    return choose
+
+
+def redis_cached(
+    key: str,
+    ttl: int | Callable[[dict[str, Any]], int],
+    model: Any = None,
+    key_args: dict[str, Callable[[Any], Any]] | None = None,
+) -> Callable[[Callable[P, Awaitable[R]]], Callable[P, Awaitable[R]]]:
+    """异步查询结果的Redis读穿缓存装饰器
+
+    先读缓存，未命中时执行查询并以SET EX写入；结果为None时不缓存。
+    Redis不可用时直接执行查询
+
+    Args:
+        key: 缓存Key模板，以被装饰函数的参数名格式化，如"sentiment:trend:{stock_code}:{days}"
+        ttl: 过期时间（秒），或根据被装饰函数参数计算过期时间的函数
+        model: 返回值的类型（如Pydantic模型类或list[模型类]），用于序列化和还原
+        key_args: 参数名到格式统一函数的映射，构建缓存Key和计算TTL前先转换对应参数，
+            如SENTIMENT_KEY_ARGS
+    """
+
+    def decorator(func: Callable[P, Awaitable[R]]) -> Callable[P, Awaitable[R]]:
+        signature = inspect.signature(func)
+        adapter = TypeAdapter(model) if model is not None else None
+
+        @functools.wraps(func)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            arguments = dict(bound.arguments)
+            for name, normalize in (key_args or {}).items():
+                if name in arguments:
+                    arguments[name] = normalize(arguments[name])
+            cache_key = key.format(**arguments)
+            expire = ttl(arguments) if callable(ttl) else ttl
+
+            try:
+                cached = await async_redis_client.get(cache_key)
+            except Exception as e:
+                logger.warning(f"读取查询缓存失败: {cache_key}, {e}")
+                cached = None
+
+            if cached is not None:
+                data = json_loads(cached)
+                return adapter.validate_python(data) if adapter else data  # type: ignore[no-any-return]
+
+            result = await func(*args, **kwargs)
+            if result is not None:
+                data = adapter.dump_python(result, mode="json") if adapter else result
+                try:
+                    await async_redis_client.set(cache_key, json_dumps(data), ex=expire)
+                except Exception as e:
+                    logger.warning(f"写入查询缓存失败: {cache_key}, {e}")
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+async def invalidate_sentiment_cache(records: Iterable[tuple[str, str]]) -> None:
+    """情绪因子写入后清除相关查询缓存
+
+    Args:
+        records: (股票代码, 计算日期)序列，写法与查询时不同也会统一后再清除
+    """
+    records = [
+        (canonical_stock_code(stock_code), canonical_date(calc_date))
+        for stock_code, calc_date in records
+    ]
+    if not records:
+        return
+
+    stock_codes = {stock_code for stock_code, _ in records}
+    calc_dates = {calc_date for _, calc_date in records}
+    keys = [
+        SENTIMENT_FACTOR_KEY.format(stock_code=stock_code, date=calc_date)
+        for stock_code, calc_date in records
+    ]
+
+    try:
+        # 按日期查询的缓存包含该日全部股票，任一股票更新都需清除
+        for calc_date in calc_dates:
+            pattern = SENTIMENT_BY_DATE_KEY.format(
+                calculation_date=calc_date, limit="*", cursor="*"
+            )
+            keys.extend(
+                [k async for k in async_redis_client.scan_iter(match=pattern, count=1000)]
+            )
+
+        # 单只股票直接按前缀匹配，多只股票时只扫描一遍趋势Key
+        pattern = (
+            SENTIMENT_TREND_KEY.format(stock_code=next(iter(stock_codes)), days="*")
+            if len(stock_codes) == 1
+            else SENTIMENT_TREND_KEY.format(stock_code="*", days="*")
+        )
+        async for trend_key in async_redis_client.scan_iter(match=pattern, count=1000):
+            if trend_key.split(":")[2] in stock_codes:
+                keys.append(trend_key)
+
+        await async_redis_client.delete(*keys)
+    except Exception as e:
+        logger.warning(f"清除情绪因子查询缓存失败: {e}")
+
+
+async def cache_get_many(keys: list[str]) -> list[Any]:
+    """批量读取JSON缓存，一次MGET往返
+
+    Redis不可用时视为全部未命中
+
+    Returns:
+        与keys一一对应的反序列化结果，未命中为None
+    """
+    if not keys:
+        return []
+    try:
+        values = await async_redis_client.mget(keys)
+    except Exception as e:
+        logger.warning(f"批量读取因子缓存失败: {e}")
+        return [None] * len(keys)
+    return [json_loads(value) if value is not None else None for value in values]
+
+
+async def cache_set_many(items: dict[str, Any], ttl: int = HOT_FACTOR_TTL) -> None:
+    """批量写入JSON缓存，所有SET EX在同一管道中发送
+
+    Redis不可用时仅记录警告
+    """
+    if not items:
+        return
+    try:
+        async with async_redis_client.pipeline(transaction=False) as pipe:
+            for key, value in items.items():
+                pipe.set(key, json_dumps(value), ex=ttl)
+            await pipe.execute()
+    except Exception as e:
+        logger.warning(f"批量写入因子缓存失败: {e}")
@@ -1,6 +1,7 @@
 """因子数据访问层模块
 
 提供统一的因子数据访问接口，整合数据库操作和缓存操作。
+数据库访问使用连接池的AsyncSession，缓存使用异步Redis客户端，均不阻塞事件循环。
 """
 
 import logging
@@ -8,12 +9,21 @@ from datetime import datetime
 from typing import Any
 
 import pandas as pd
-from redis import Redis
-from sqlalchemy.orm import Session
+from sqlalchemy import func, select
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.exc import SQLAlchemyError
 
-from ..models.database import MarketFactor, TechnicalFactor
+from ...config.connection_pool import get_db_session
+from ..models.database import FundamentalFactor, MarketFactor, TechnicalFactor
 from .base import FundamentalFactorDAO, TechnicalFactorDAO
-from .cache import FactorCacheManager
+from .cache import (
+    FUNDAMENTAL_FACTORS_KEY,
+    HOT_FACTOR_TTL,
+    MARKET_FACTOR_KEY,
+    TECHNICAL_FACTOR_KEY,
+    cache_get_many,
+    cache_set_many,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -21,28 +31,38 @@ logger = logging.getLogger(__name__)
 class FactorDAO:
     """因子数据访问对象
 
-    整合数据库操作和缓存操作，提供统一的数据访问接口
+    整合数据库操作和缓存操作，提供统一的数据访问接口。
+    与base模块中的DAO一致，所有方法均为类方法，每次操作从连接池获取会话
     """
 
-    def __init__(self, db_session: Session, redis_client: Redis):
-        """初始化因子数据访问对象
+    @staticmethod
+    def _upsert_statement(model: type, rows: list[dict[str, Any]], *columns: str) -> Any:
+        """构建INSERT ... ON DUPLICATE KEY UPDATE语句
 
-        Args:
-            db_session: 数据库会话
-            redis_client: Redis客户端
+        依赖各因子表的唯一约束，已存在的记录只更新指定列和更新时间
         """
-        self.db_session = db_session
-        self.redis_client = redis_client
-
-        # 初始化各类型因子的DAO
-        self.technical_dao = TechnicalFactorDAO(db_session)
-        self.fundamental_dao = FundamentalFactorDAO(db_session)
-
-        # 初始化缓存管理器
-        self.cache_manager = FactorCacheManager(redis_client)
-
+        stmt = mysql_insert(model).values(rows)
+        return stmt.on_duplicate_key_update(
+            **{column: stmt.inserted[column] for column in columns},
+            updated_at=func.now(),
+        )
+
+    @staticmethod
+    def _factor_cache_entry(
+        stock_code: str, factor_name: str, factor_value: float, trade_date: str
+    ) -> dict[str, Any]:
+        """构建单个因子的缓存数据"""
+        return {
+            "stock_code": stock_code,
+            "factor_name": factor_name,
+            "factor_value": factor_value,
+            "trade_date": trade_date,
+            "cached_at": datetime.now().isoformat(),
+        }
+
+    @classmethod
     async def save_technical_factor(
-        self, stock_code: str, factor_name: str, factor_value: float, trade_date: str
+        cls, stock_code: str, factor_name: str, factor_value: float, trade_date: str
     ) -> bool:
         """保存技术因子数据
 
@@ -56,58 +76,40 @@ class FactorDAO:
             保存是否成功
         """
         try:
-            # 转换日期格式
             trade_date_obj = datetime.strptime(trade_date, "%Y-%m-%d").date()
 
-            # 检查是否已存在相同记录
-            existing_factors = self.technical_dao.get_by_stock_and_date(
-                stock_code=stock_code, trade_date=trade_date_obj
-            )
-
-            # 查找是否已存在相同因子
-            existing_factor: TechnicalFactor | None = None
-            for factor in existing_factors:
-                if factor.factor_name == factor_name:
-                    existing_factor = factor
-                    break
-
-            if existing_factor:
-                # 更新现有记录
-                success = self.technical_dao.update(
-                    factor_id=int(existing_factor.id), factor_value=factor_value
-                )
-            else:
-                # 创建新记录
-                factor = self.technical_dao.create(
-                    stock_code=stock_code,
-                    factor_name=factor_name,
-                    factor_value=factor_value,
-                    trade_date=trade_date_obj,
-                )
-                success = factor is not None
-
-                # 提交事务
-                if success:
-                    self.db_session.commit()
-
-            # 缓存数据
-            if success:
-                self.cache_manager.cache_technical_factor(
-                    stock_code=stock_code,
-                    factor_name=factor_name,
-                    trade_date=trade_date_obj,
-                    factor_value=factor_value,
+            async with get_db_session() as session:
+                await session.execute(
+                    cls._upsert_statement(
+                        TechnicalFactor,
+                        [
+                            {
+                                "stock_code": stock_code,
+                                "factor_name": factor_name,
+                                "factor_value": factor_value,
+                                "trade_date": trade_date_obj,
+                            }
+                        ],
+                        "factor_value",
+                    )
                 )
+                await session.commit()
 
-            return success
-
-        except Exception as e:
+        except (SQLAlchemyError, ValueError) as e:
             logger.error(f"保存技术因子数据失败: {str(e)}")
-            self.db_session.rollback()
             return False
 
+        key = TECHNICAL_FACTOR_KEY.format(
+            stock_code=stock_code, factor_name=factor_name, trade_date=trade_date
+        )
+        await cache_set_many(
+            {key: cls._factor_cache_entry(stock_code, factor_name, factor_value, trade_date)}
+        )
+        return True
+
+    @classmethod
     async def save_fundamental_factors(
-        self,
+        cls,
         stock_code: str,
         factors: dict[str, float | None],
         growth_rates: dict[str, float | None],
@@ -116,6 +118,8 @@ class FactorDAO:
     ) -> bool:
         """保存基本面因子数据
 
+        因子与增长率在同一条多行UPSERT语句中写入
+
         Args:
             stock_code: 股票代码
             factors: 因子值字典
@@ -126,113 +130,55 @@ class FactorDAO:
         Returns:
             保存是否成功
         """
+        filtered_factors = {k: v for k, v in factors.items() if v is not None}
+        filtered_growth_rates = {k: v for k, v in growth_rates.items() if v is not None}
+        if not filtered_factors and not filtered_growth_rates:
+            return True
+
         try:
-            # 转换日期格式
             ann_date_obj = datetime.strptime(ann_date, "%Y-%m-%d").date()
+            rows = [
+                {
+                    "stock_code": stock_code,
+                    "factor_name": factor_name,
+                    "factor_value": factor_value,
+                    "report_period": period,
+                    "ann_date": ann_date_obj,
+                }
+                for factor_name, factor_value in (
+                    filtered_factors | filtered_growth_rates
+                ).items()
+            ]
 
-            # 查询已存在的因子记录
-            existing_factors = self.fundamental_dao.get_by_stock_and_period(
-                stock_code=stock_code, report_period=period
-            )
-
-            success_count = 0
-            total_count = 0
-
-            # 保存基本面因子
-            for factor_name, factor_value in factors.items():
-                if factor_value is not None:
-                    total_count += 1
-                    try:
-                        # 查找是否已存在相同因子
-                        existing_factor = None
-                        for factor in existing_factors:
-                            if factor.factor_name == factor_name:
-                                existing_factor = factor
-                                break
-
-                        if existing_factor:
-                            # 更新现有记录
-                            success = self.fundamental_dao.update(
-                                factor_id=int(existing_factor.id),
-                                factor_value=factor_value,
-                                ann_date=ann_date_obj,
-                            )
-                        else:
-                            # 创建新记录
-                            factor = self.fundamental_dao.create(
-                                stock_code=stock_code,
-                                factor_name=factor_name,
-                                factor_value=factor_value,
-                                report_period=period,
-                                ann_date=ann_date_obj,
-                            )
-                            success = factor is not None
-
-                        if success:
-                            success_count += 1
-
-                    except Exception as e:
-                        logger.warning(f"保存基本面因子{factor_name}失败: {e}")
-
-            # 保存增长率数据
-            for growth_name, growth_value in growth_rates.items():
-                if growth_value is not None:
-                    total_count += 1
-                    try:
-                        # 查找是否已存在相同因子
-                        existing_factor = None
-                        for factor in existing_factors:
-                            if factor.factor_name == growth_name:
-                                existing_factor = factor
-                                break
-
-                        if existing_factor:
-                            # 更新现有记录
-                            success = self.fundamental_dao.update(
-                                factor_id=int(existing_factor.id),
-                                factor_value=growth_value,
-                                ann_date=ann_date_obj,
-                            )
-                        else:
-                            # 创建新记录
-                            factor = self.fundamental_dao.create(
-                                stock_code=stock_code,
-                                factor_name=growth_name,
-                                factor_value=growth_value,
-                                report_period=period,
-                                ann_date=ann_date_obj,
-                            )
-                            success = factor is not None
-
-                        if success:
-                            success_count += 1
-
-                    except Exception as e:
-                        logger.warning(f"保存增长率{growth_name}失败: {e}")
-
-            # 提交事务
-            if success_count > 0:
-                self.db_session.commit()
-
-                # 缓存数据（过滤掉None值）
-                filtered_factors = {k: v for k, v in factors.items() if v is not None}
-                filtered_growth_rates = {k: v for k, v in growth_rates.items() if v is not None}
-                self.cache_manager.cache_fundamental_factors(
-                    stock_code=stock_code,
-                    period=period,
-                    factors=filtered_factors,
-                    growth_rates=filtered_growth_rates,
+            async with get_db_session() as session:
+                await session.execute(
+                    cls._upsert_statement(
+                        FundamentalFactor, rows, "factor_value", "ann_date"
+                    )
                 )
+                await session.commit()
 
-            return success_count == total_count
-
-        except Exception as e:
+        except (SQLAlchemyError, ValueError) as e:
             logger.error(f"保存基本面因子数据失败: {str(e)}")
-            self.db_session.rollback()
             return False
 
+        key = FUNDAMENTAL_FACTORS_KEY.format(stock_code=stock_code, period=period)
+        await cache_set_many(
+            {
+                key: {
+                    "stock_code": stock_code,
+                    "period": period,
+                    "factors": filtered_factors,
+                    "growth_rates": filtered_growth_rates,
+                    "cached_at": datetime.now().isoformat(),
+                }
+            }
+        )
+        return True
+
+    @classmethod
     async def get_fundamental_factor_history(
-        self, stock_code: str, factor_name: str, start_period: str, end_period: str
+        cls, stock_code: str, factor_name: str, start_period: str, end_period: str
     ) -> list[dict[str, Any]]:
         """获取基本面因子历史数据
 
@@ -246,35 +192,31 @@ class FactorDAO:
             历史数据列表
         """
         try:
-            # 从数据库查询历史数据
-            factors = self.fundamental_dao.get_by_stock_and_factor(
+            factors = await FundamentalFactorDAO.get_by_stock_and_factor(
                 stock_code=stock_code,
                 factor_name=factor_name,
                 start_period=start_period,
                 end_period=end_period,
             )
 
-            # 转换为字典格式
-            result = []
-            for factor in factors:
-                result.append(
-                    {
-                        "report_period": factor.report_period,
-                        "factor_value": factor.factor_value,
-                        "ann_date": factor.ann_date,
-                        "created_at": factor.created_at,
-                        "updated_at": factor.updated_at,
-                    }
-                )
-
-            return result
+            return [
+                {
+                    "report_period": factor.report_period,
+                    "factor_value": factor.factor_value,
+                    "ann_date": factor.ann_date,
+                    "created_at": factor.created_at,
+                    "updated_at": factor.updated_at,
+                }
+                for factor in factors
+            ]
 
-        except Exception as e:
+        except SQLAlchemyError as e:
             logger.error(f"获取基本面因子历史数据失败: {str(e)}")
             return []
 
+    @classmethod
     async def get_cached_fundamental_factors(
-        self, stock_code: str, period: str
+        cls, stock_code: str, period: str
     ) -> dict[str, Any] | None:
         """获取缓存的基本面因子数据
 
@@ -285,23 +227,18 @@ class FactorDAO:
         Returns:
             缓存的基本面因子数据或None
         """
-        try:
-            cached_data = self.cache_manager.get_fundamental_factors(
-                stock_code=stock_code, period=period
-            )
+        key = FUNDAMENTAL_FACTORS_KEY.format(stock_code=stock_code, period=period)
+        [cached_data] = await cache_get_many([key])
 
-            if cached_data:
-                logger.debug(f"从缓存获取基本面因子数据: {stock_code}-{period}")
-                return dict(cached_data) if isinstance(cached_data, dict) else None
+        if isinstance(cached_data, dict):
+            logger.debug(f"从缓存获取基本面因子数据: {stock_code}-{period}")
+            return cached_data
 
-            return None
-
-        except Exception as e:
-            logger.warning(f"获取缓存基本面因子数据失败: {str(e)}")
-            return None
+        return None
 
+    @classmethod
     async def get_factor_history(
-        self, stock_code: str, factor_name: str, start_date: str, end_date: str
+        cls, stock_code: str, factor_name: str, start_date: str, end_date: str
     ) -> list[dict[str, Any]]:
         """获取因子历史数据
 
@@ -315,38 +252,30 @@ class FactorDAO:
             历史数据列表
         """
         try:
-            # 转换日期格式
-            start_date_obj = datetime.strptime(start_date, "%Y-%m-%d").date()
-            end_date_obj = datetime.strptime(end_date, "%Y-%m-%d").date()
-
-            # 从数据库查询历史数据
-            factors = self.technical_dao.get_by_stock_and_factor(
+            factors = await TechnicalFactorDAO.get_by_stock_and_factor(
                 stock_code=stock_code,
                 factor_name=factor_name,
-                start_date=start_date_obj,
-                end_date=end_date_obj,
+                start_date=datetime.strptime(start_date, "%Y-%m-%d").date(),
+                end_date=datetime.strptime(end_date, "%Y-%m-%d").date(),
             )
 
-            # 转换为字典格式
-            result = []
-            for factor in factors:
-                result.append(
-                    {
-                        "trade_date": factor.trade_date,
-                        "factor_value": factor.factor_value,
-                        "created_at": factor.created_at,
-                        "updated_at": factor.updated_at,
-                    }
-                )
-
-            return result
+            return [
+                {
+                    "trade_date": factor.trade_date,
+                    "factor_value": factor.factor_value,
+                    "created_at": factor.created_at,
+                    "updated_at": factor.updated_at,
+                }
+                for factor in factors
+            ]
 
-        except Exception as e:
+        except (SQLAlchemyError, ValueError) as e:
             logger.error(f"获取因子历史数据失败: {str(e)}")
             return []
 
+    @classmethod
     async def get_stock_price_data(
-        self, stock_code: str, start_date: str, end_date: str
+        cls, stock_code: str, start_date: str, end_date: str
     ) -> pd.DataFrame:
         """获取股票价格数据
 
@@ -398,11 +327,14 @@ class FactorDAO:
             logger.error(f"获取股票价格数据失败: {str(e)}")
             return pd.DataFrame()
 
+    @classmethod
     async def get_cached_factors(
-        self, stock_code: str, factor_names: list[str], calculation_date: str
+        cls, stock_code: str, factor_names: list[str], calculation_date: str
     ) -> dict[str, float]:
         """获取缓存的因子数据
 
+        所有因子的缓存Key通过一次MGET读取
+
         Args:
             stock_code: 股票代码
             factor_names: 因子名称列表
@@ -411,34 +343,29 @@ class FactorDAO:
         Returns:
             缓存的因子数据
         """
-        try:
-            cached_factors = {}
-            calculation_date_obj = datetime.strptime(
-                calculation_date, "%Y-%m-%d"
-            ).date()
-
-            for factor_name in factor_names:
-                cached_data = self.cache_manager.get_technical_factor(
-                    stock_code=stock_code,
-                    factor_name=factor_name,
-                    trade_date=calculation_date_obj,
-                )
-
-                if cached_data and "factor_value" in cached_data:
-                    cached_factors[factor_name] = cached_data["factor_value"]
-
-            return cached_factors
+        keys = [
+            TECHNICAL_FACTOR_KEY.format(
+                stock_code=stock_code,
+                factor_name=factor_name,
+                trade_date=calculation_date,
+            )
+            for factor_name in factor_names
+        ]
+        cached_values = await cache_get_many(keys)
 
-        except Exception as e:
-            logger.warning(f"获取缓存因子数据失败: {str(e)}")
-            return {}
+        return {
+            factor_name: cached_data["factor_value"]
+            for factor_name, cached_data in zip(factor_names, cached_values, strict=True)
+            if isinstance(cached_data, dict) and "factor_value" in cached_data
+        }
 
+    @classmethod
     async def cache_factors(
-        self,
+        cls,
         stock_code: str,
         calculation_date: str,
         factors_data: dict[str, float],
-        ttl: int = 3600,
+        ttl: int = HOT_FACTOR_TTL,
     ) -> None:
         """缓存因子数据
 
@@ -448,26 +375,24 @@ class FactorDAO:
             factors_data: 因子数据
             ttl: 缓存过期时间（秒）
         """
-        try:
-            calculation_date_obj = datetime.strptime(
-                calculation_date, "%Y-%m-%d"
-            ).date()
-
-            for factor_name, factor_value in factors_data.items():
-                self.cache_manager.cache_technical_factor(
+        await cache_set_many(
+            {
+                TECHNICAL_FACTOR_KEY.format(
                     stock_code=stock_code,
                     factor_name=factor_name,
-                    trade_date=calculation_date_obj,
-                    factor_value=factor_value,
+                    trade_date=calculation_date,
+                ): cls._factor_cache_entry(
+                    stock_code, factor_name, factor_value, calculation_date
                 )
+                for factor_name, factor_value in factors_data.items()
+            },
+            ttl=ttl,
+        )
+        logger.debug(f"成功缓存股票{stock_code}的因子数据")
 
-            logger.debug(f"成功缓存股票{stock_code}的因子数据")
-
-        except Exception as e:
-            logger.warning(f"缓存因子数据失败: {str(e)}")
-
+    @classmethod
     async def get_latest_factors(
-        self, stock_code: str, factor_names: list[str], limit: int = 1
+        cls, stock_code: str, factor_names: list[str], limit: int = 1
     ) -> list[dict[str, Any]]:
         """获取最新的因子数据
 
@@ -480,42 +405,35 @@ class FactorDAO:
             最新的因子数据列表
         """
         try:
-            latest_factors = self.technical_dao.get_latest_by_stock(
+            latest_factors = await TechnicalFactorDAO.get_latest_by_stock(
                 stock_code=stock_code, limit=limit * len(factor_names)
             )
 
-            # 过滤指定的因子名称
-            filtered_factors = [
-                factor
+            return [
+                {
+                    "factor_name": factor.factor_name,
+                    "factor_value": factor.factor_value,
+                    "trade_date": factor.trade_date,
+                    "created_at": factor.created_at,
+                }
                 for factor in latest_factors
                 if factor.factor_name in factor_names
             ]
 
-            # 转换为字典格式
-            result = []
-            for factor in filtered_factors:
-                result.append(
-                    {
-                        "factor_name": factor.factor_name,
-                        "factor_value": factor.factor_value,
-                        "trade_date": factor.trade_date,
-                        "created_at": factor.created_at,
-                    }
-                )
-
-            return result
-
-        except Exception as e:
+        except SQLAlchemyError as e:
             logger.error(f"获取最新因子数据失败: {str(e)}")
             return []
 
     # ==================== 市场因子相关方法 ====================
 
+    @classmethod
     async def save_market_factors(
-        self, stock_code: str, trade_date: str, factors: dict[str, float]
+        cls, stock_code: str, trade_date: str, factors: dict[str, float]
     ) -> bool:
         """保存市场因子数据
 
+        所有因子在同一条多行UPSERT语句中写入
+
         Args:
             stock_code: 股票代码
             trade_date: 交易日期
@@ -524,64 +442,48 @@ class FactorDAO:
         Returns:
             保存是否成功
         """
+        if not factors:
+            return True
+
         try:
             trade_date_obj = datetime.strptime(trade_date, "%Y-%m-%d").date()
-            success_count = 0
+            rows = [
+                {
+                    "stock_code": stock_code,
+                    "factor_name": factor_name,
+                    "factor_value": factor_value,
+                    "trade_date": trade_date_obj,
+                }
+                for factor_name, factor_value in factors.items()
+            ]
 
-            for factor_name, factor_value in factors.items():
-                # 检查是否已存在相同记录
-                existing_factor = (
-                    self.db_session.query(MarketFactor)
-                    .filter(
-                        MarketFactor.stock_code == stock_code,
-                        MarketFactor.factor_name == factor_name,
-                        MarketFactor.trade_date == trade_date_obj,
-                    )
-                    .first()
+            async with get_db_session() as session:
+                await session.execute(
+                    cls._upsert_statement(MarketFactor, rows, "factor_value")
                 )
+                await session.commit()
 
-                if existing_factor:
-                    # 更新现有记录
-                    existing_factor.factor_value = factor_value
-                    existing_factor.updated_at = datetime.now()  # type: ignore
-                else:
-                    # 创建新记录
-                    new_factor = MarketFactor(
-                        stock_code=stock_code,
-                        factor_name=factor_name,
-                        factor_value=factor_value,
-                        trade_date=trade_date_obj,
-                        created_at=datetime.now(),
-                        updated_at=datetime.now(),
-                    )
-                    self.db_session.add(new_factor)
-
-                success_count += 1
-
-            # 提交事务
-            self.db_session.commit()
+        except (SQLAlchemyError, ValueError) as e:
+            logger.error(f"保存市场因子数据失败: {str(e)}")
+            return False
 
-            # 缓存数据
-            for factor_name, factor_value in factors.items():
-                self.cache_manager.cache_market_factor(
-                    stock_code=stock_code,
-                    factor_name=factor_name,
-                    trade_date=trade_date_obj,
-                    factor_value=factor_value,
+        await cache_set_many(
+            {
+                MARKET_FACTOR_KEY.format(
+                    stock_code=stock_code, factor_name=factor_name, trade_date=trade_date
+                ): cls._factor_cache_entry(
+                    stock_code, factor_name, factor_value, trade_date
                 )
+                for factor_name, factor_value in factors.items()
+            }
+        )
 
-            logger.debug(
-                f"成功保存股票{stock_code}的{success_count}个市场因子数据"
-            )
-            return True
-
-        except Exception as e:
-            logger.error(f"保存市场因子数据失败: {str(e)}")
-            self.db_session.rollback()
-            return False
+        logger.debug(f"成功保存股票{stock_code}的{len(rows)}个市场因子数据")
+        return True
 
+    @classmethod
     async def get_market_factor_history(
-        self, stock_code: str, factor_name: str, start_date: str, end_date: str
+        cls, stock_code: str, factor_name: str, start_date: str, end_date: str
     ) -> list[dict[str, Any]]:
         """获取市场因子历史数据
 
@@ -598,40 +500,42 @@ class FactorDAO:
             start_date_obj = datetime.strptime(start_date, "%Y-%m-%d").date()
             end_date_obj = datetime.strptime(end_date, "%Y-%m-%d").date()
 
-            factors = (
-                self.db_session.query(MarketFactor)
-                .filter(
-                    MarketFactor.stock_code == stock_code,
-                    MarketFactor.factor_name == factor_name,
-                    MarketFactor.trade_date >= start_date_obj,
-                    MarketFactor.trade_date <= end_date_obj,
+            async with get_db_session() as session:
+                rows = await session.execute(
+                    select(
+                        MarketFactor.trade_date,
+                        MarketFactor.factor_value,
+                        MarketFactor.created_at,
+                    )
+                    .where(
+                        MarketFactor.stock_code == stock_code,
+                        MarketFactor.factor_name == factor_name,
+                        MarketFactor.trade_date.between(start_date_obj, end_date_obj),
+                    )
+                    .order_by(MarketFactor.trade_date.asc())
                 )
-                .order_by(MarketFactor.trade_date.asc())
-                .all()
-            )
 
-            # 转换为字典格式
-            result = []
-            for factor in factors:
-                result.append(
+                result = [
                     {
-                        "trade_date": factor.trade_date.isoformat(),
-                        "factor_value": factor.factor_value,
-                        "created_at": factor.created_at.isoformat(),
+                        "trade_date": row.trade_date.isoformat(),
+                        "factor_value": row.factor_value,
+                        "created_at": row.created_at.isoformat(),
                     }
-                )
+                    for row in rows
+                ]
 
             logger.debug(
                 f"成功获取股票{stock_code}因子{factor_name}的历史数据，共{len(result)}条记录"
             )
             return result
 
-        except Exception as e:
+        except (SQLAlchemyError, ValueError) as e:
             logger.error(f"获取市场因子历史数据失败: {str(e)}")
             return []
 
+    @classmethod
     async def get_latest_market_factors(
-        self, stock_code: str, factor_names: list[str], limit: int = 1
+        cls, stock_code: str, factor_names: list[str], limit: int = 1
     ) -> list[dict[str, Any]]:
         """获取最新的市场因子数据
 
@@ -644,39 +548,32 @@ class FactorDAO:
             最新的市场因子数据列表
         """
         try:
-            latest_factors = (
-                self.db_session.query(MarketFactor)
-                .filter(
-                    MarketFactor.stock_code == stock_code,
-                    MarketFactor.factor_name.in_(factor_names),
+            async with get_db_session() as session:
+                rows = await session.execute(
+                    select(
+                        MarketFactor.factor_name,
+                        MarketFactor.factor_value,
+                        MarketFactor.trade_date,
+                        MarketFactor.created_at,
+                    )
+                    .where(
+                        MarketFactor.stock_code == stock_code,
+                        MarketFactor.factor_name.in_(factor_names),
+                    )
+                    .order_by(MarketFactor.trade_date.desc())
+                    .limit(limit * len(factor_names))
                 )
-                .order_by(MarketFactor.trade_date.desc())
-                .limit(limit * len(factor_names))
-                .all()
-            )
 
-            # 转换为字典格式
-            result = []
-            for factor in latest_factors:
-                result.append(
+                return [
                     {
-                        "factor_name": factor.factor_name,
-                        "factor_value": factor.factor_value,
-                        "trade_date": factor.trade_date.isoformat(),
-                        "created_at": factor.created_at.isoformat(),
+                        "factor_name": row.factor_name,
+                        "factor_value": row.factor_value,
+                        "trade_date": row.trade_date.isoformat(),
+                        "created_at": row.created_at.isoformat(),
                     }
-                )
-
-            return result
+                    for row in rows
+                ]
 
-        except Exception as e:
+        except SQLAlchemyError as e:
             logger.error(f"获取最新市场因子数据失败: {str(e)}")
             return []
-
-    def close(self) -> None:
-        """关闭数据库连接"""
-        if self.db_session:
-            self.db_session.close()
-
-        if self.redis_client:
-            self.redis_client.close()
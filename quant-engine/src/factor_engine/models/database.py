@@ -164,8 +164,22 @@ class SentimentFactor(Base):
 
     # 索引定义
     __table_args__ = (
-        Index("idx_stock_calc_date", "stock_code", "calculation_date"),
-        Index("idx_calculation_date", "calculation_date"),
+        # 趋势查询按日期倒序取最近N条，降序覆盖索引避免回表和排序
+        Index(
+            "idx_stock_calc_date_desc",
+            stock_code,
+            calculation_date.desc(),
+            factor_value,
+            news_count,
+        ),
+        # 按日期查询按因子值降序、股票代码分页，索引顺序与排序一致
+        Index(
+            "idx_calc_date_factor_value",
+            calculation_date,
+            factor_value.desc(),
+            stock_code,
+            news_count,
+        ),
         Index("idx_factor_value", "factor_value"),
         UniqueConstraint("stock_code", "calculation_date", name="uk_stock_calc_date"),
         {"comment": "情绪因子表"},
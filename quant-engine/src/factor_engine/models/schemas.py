@@ -8,6 +8,9 @@ from decimal import Decimal
 
 from pydantic import BaseModel, Field, field_validator
 
+# 单次批量情绪因子计算的股票数量上限，约为全市场A股数量
+MAX_SENTIMENT_BATCH_SIZE = 5000
+
 
 class BaseFactorModel(BaseModel):
     """因子模型基类"""
@@ -499,7 +502,9 @@ class ErrorResponse(BaseFactorModel):
 class BatchSentimentFactorRequest(BaseFactorModel):
     """批量情绪因子计算请求模型"""
 
-    stock_codes: list[str] = Field(..., description="股票代码列表")
+    stock_codes: list[str] = Field(
+        ..., max_length=MAX_SENTIMENT_BATCH_SIZE, description="股票代码列表"
+    )
     calculation_date: str = Field(..., description="计算日期，格式：YYYY-MM-DD")
     days_back: int = Field(default=7, description="向前追溯天数")
     use_model: bool = Field(default=True, description="是否使用深度学习模型")
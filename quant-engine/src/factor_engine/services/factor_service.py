@@ -6,16 +6,20 @@
 - 数据持久化逻辑
 """
 
+import asyncio
 import logging
-from datetime import datetime, timedelta
+from collections.abc import AsyncIterator
+from datetime import date, datetime, timedelta
+from typing import Any
 
 import pandas as pd
 
-from ...clients.tushare_client import TushareClient
+from ...clients.tushare_client import TushareClient, get_tushare_client
 from ..calculators.fundamental import FundamentalFactorCalculator
 from ..calculators.market import MarketFactorCalculator
 from ..calculators.sentiment import SentimentFactorCalculator
 from ..calculators.technical import TechnicalFactorCalculator
+from ..dao.base import TechnicalFactorDAO
 from ..dao.factor_dao import FactorDAO
 from ..models.schemas import (
     BatchFundamentalFactorRequest,
@@ -41,6 +45,9 @@ from ..models.schemas import (
 
 logger = logging.getLogger(__name__)
 
+# 批量计算基本面因子时同时处理的股票数
+FUNDAMENTAL_BATCH_CONCURRENCY = 5
+
 
 class FactorService:
     """因子服务类
@@ -127,23 +134,22 @@ class FactorService:
             技术因子历史数据响应
         """
         try:
-            # 从数据库查询历史数据
-            history_data = await FactorDAO.get_factor_history(
-                stock_code=stock_code,
-                factor_name=factor_name,
-                start_date=start_date,
-                end_date=end_date,
+            # 从数据库查询历史数据，过滤和排序在SQL中完成
+            history_data = await TechnicalFactorDAO.get_history(
+                stock_code,
+                [factor_name],
+                date.fromisoformat(start_date),
+                date.fromisoformat(end_date),
             )
 
             # 构造响应数据
-            data = []
-            for record in history_data:
-                data.append(
-                    {
-                        "trade_date": record["trade_date"].strftime("%Y-%m-%d"),
-                        "factor_value": record["factor_value"],
-                    }
-                )
+            data = [
+                {
+                    "trade_date": trade_date.isoformat(),
+                    "factor_value": float(factor_value),
+                }
+                for _, trade_date, factor_value in history_data
+            ]
 
             response = TechnicalFactorHistoryResponse(
                 stock_code=stock_code,
@@ -162,6 +168,35 @@ class FactorService:
             logger.error(f"获取技术因子历史数据失败: {str(e)}")
             raise
 
+    async def iter_technical_factor_history(
+        self, stock_code: str, factor_name: str, start_date: str, end_date: str
+    ) -> AsyncIterator[dict[str, Any]]:
+        """逐条获取技术因子历史数据，用于流式输出
+
+        Args:
+            stock_code: 股票代码
+            factor_name: 因子名称
+            start_date: 开始日期
+            end_date: 结束日期
+
+        Yields:
+            包含trade_date和factor_value的历史数据，按交易日期升序排列
+
+        Raises:
+            ValueError: 日期格式无效
+        """
+        rows = TechnicalFactorDAO.iter_history(
+            stock_code,
+            [factor_name],
+            date.fromisoformat(start_date),
+            date.fromisoformat(end_date),
+        )
+        async for _, trade_date, factor_value in rows:
+            yield {
+                "trade_date": trade_date.isoformat(),
+                "factor_value": float(factor_value),
+            }
+
     async def batch_calculate_technical_factors(
         self, request: BatchTechnicalFactorRequest
     ) -> BatchTechnicalFactorResponse:
@@ -350,12 +385,15 @@ class FactorService:
     # ==================== 基本面因子服务方法 ====================
 
     async def calculate_fundamental_factors(
-        self, request: FundamentalFactorRequest
+        self,
+        request: FundamentalFactorRequest,
+        financial_data: dict[str, Any] | None = None,
     ) -> FundamentalFactorResponse:
         """计算基本面因子
 
         Args:
             request: 基本面因子计算请求
+            financial_data: 批量计算时预取的财务数据，为空时由计算器单独获取
 
         Returns:
             基本面因子计算响应
@@ -369,12 +407,23 @@ class FactorService:
                 logger.info(f"从缓存获取股票{request.stock_code}的基本面因子数据")
                 return cached_data
 
+            # 一次性获取因子和同比增长率计算所需的各报告期财务数据
+            period_cache = await self.fundamental_calculator.get_period_data(
+                stock_code=request.stock_code,
+                period=request.period,
+                factors=request.factors,
+                report_type=request.report_type,
+                include_prior_year=True,
+                financial_data=financial_data,
+            )
+
             # 计算基本面因子
             factors_result = await self.fundamental_calculator.calculate_factors(
                 stock_code=request.stock_code,
                 factors=request.factors,
                 period=request.period,
                 report_type=request.report_type,
+                period_cache=period_cache,
             )
 
             # 计算同比增长率
@@ -382,6 +431,8 @@ class FactorService:
                 stock_code=request.stock_code,
                 factors=request.factors,
                 current_period=request.period,
+                report_type=request.report_type,
+                period_cache=period_cache,
             )
 
             # 保存计算结果到数据库
@@ -433,31 +484,42 @@ class FactorService:
 
         logger.info(f"开始批量计算基本面因子，股票数量: {total_stocks}")
 
-        for stock_code in request.stock_codes:
-            try:
-                # 创建单个股票的计算请求
-                single_request = FundamentalFactorRequest(
-                    stock_code=stock_code,
-                    factors=request.factors,
-                    period=request.period,
-                    report_type=request.report_type,
-                )
+        # 入口处一次性预取全部股票的财务数据，避免逐只股票串行请求四张报表
+        financial_data = await self.fundamental_calculator.get_financial_data_bulk(
+            request.stock_codes, request.period, request.report_type
+        )
 
-                # 计算基本面因子
-                single_response = await self.calculate_fundamental_factors(
-                    single_request
+        # fina_indicator等财务接口每次只能查询一只股票，按股票并发计算并限制并发数
+        semaphore = asyncio.Semaphore(FUNDAMENTAL_BATCH_CONCURRENCY)
+
+        async def calculate_one(stock_code: str) -> FundamentalFactorResponse:
+            single_request = FundamentalFactorRequest(
+                stock_code=stock_code,
+                factors=request.factors,
+                period=request.period,
+                report_type=request.report_type,
+            )
+            async with semaphore:
+                return await self.calculate_fundamental_factors(
+                    single_request, financial_data=financial_data.get(stock_code)
                 )
 
-                # 记录成功结果
-                results[stock_code] = single_response.factors
-                successful_stocks += 1
+        outcomes = await asyncio.gather(
+            *(calculate_one(stock_code) for stock_code in request.stock_codes),
+            return_exceptions=True,
+        )
 
-            except Exception as e:
+        for stock_code, outcome in zip(request.stock_codes, outcomes, strict=True):
+            if isinstance(outcome, BaseException):
                 # 记录失败信息
-                error_msg = str(e)
+                error_msg = str(outcome)
                 errors[stock_code] = error_msg
                 failed_stocks += 1
                 logger.warning(f"股票{stock_code}计算失败: {error_msg}")
+            else:
+                # 记录成功结果
+                results[stock_code] = outcome.factors
+                successful_stocks += 1
 
         response = BatchFundamentalFactorResponse(
             period=request.period,
@@ -699,12 +761,15 @@ class FactorService:
     # ==================== 统一因子计算方法 ====================
 
     async def calculate_all_factors(
-        self, request: UnifiedFactorRequest
+        self,
+        request: UnifiedFactorRequest,
+        financial_data: dict[str, Any] | None = None,
     ) -> UnifiedFactorResponse:
         """计算所有类型的因子
 
         Args:
             request: 统一因子计算请求
+            financial_data: 批量计算时预取的财务数据，见calculate_fundamental_factors
 
         Returns:
             统一因子计算响应
@@ -732,7 +797,9 @@ class FactorService:
                     factors=request.fundamental_factors,
                     period=request.period or calculation_date[:4],
                 )
-                fund_response = await self.calculate_fundamental_factors(fund_request)
+                fund_response = await self.calculate_fundamental_factors(
+                    fund_request, financial_data=financial_data
+                )
                 # 基本面因子直接赋值
                 all_factors["fundamental_factors"] = fund_response.factors
 
@@ -843,6 +910,13 @@ class FactorService:
 
         logger.info(f"开始批量计算所有因子，股票数量: {total_stocks}")
 
+        # 需要基本面因子时一次性预取全部股票的财务数据
+        financial_data: dict[str, dict[str, Any] | None] = {}
+        if "fundamental" in request.factor_types and request.fundamental_factors:
+            financial_data = await self.fundamental_calculator.get_financial_data_bulk(
+                request.stock_codes, request.period or calculation_date[:4]
+            )
+
         for stock_code in request.stock_codes:
             try:
                 # 创建单个股票的计算请求
@@ -858,7 +932,9 @@ class FactorService:
                 )
 
                 # 计算所有因子
-                single_response = await self.calculate_all_factors(single_request)
+                single_response = await self.calculate_all_factors(
+                    single_request, financial_data=financial_data.get(stock_code)
+                )
 
                 # 记录成功结果
                 results[stock_code] = single_response
@@ -912,14 +988,22 @@ class FactorService:
             market_history: list[dict[str, str | float]] = []
             sentiment_history: list[dict[str, str | float]] = []
 
-            # 获取技术因子历史数据
+            # 获取技术因子历史数据，全部因子一次查询
             if technical_factors:
-                for factor_name in technical_factors:
-                    tech_history = await self.get_technical_factor_history(
-                        stock_code, factor_name, start_date, end_date
-                    )
-                    if tech_history and tech_history.data:
-                        technical_history.extend(tech_history.data)
+                tech_rows = await TechnicalFactorDAO.get_history(
+                    stock_code,
+                    technical_factors,
+                    date.fromisoformat(start_date),
+                    date.fromisoformat(end_date),
+                )
+                technical_history = [
+                    {
+                        "factor_name": factor_name,
+                        "trade_date": trade_date.isoformat(),
+                        "factor_value": float(factor_value),
+                    }
+                    for factor_name, trade_date, factor_value in tech_rows
+                ]
 
             # 获取基本面因子历史数据
             if fundamental_factors:
@@ -966,3 +1050,20 @@ class FactorService:
         except Exception as e:
             logger.error(f"获取统一因子历史数据失败: {str(e)}")
             raise
+
+
+# 全局因子服务实例
+_factor_service_instance: FactorService | None = None
+
+
+async def get_factor_service() -> FactorService:
+    """获取全局因子服务的依赖注入函数（首次使用时创建）
+
+    服务本身不保存请求状态，各路由共享同一实例，避免每个请求重复构建
+    计算器及情绪分析器。检查与赋值之间没有await，并发请求不会重复创建
+    """
+    global _factor_service_instance
+    data_client = await get_tushare_client()
+    if _factor_service_instance is None:
+        _factor_service_instance = FactorService(data_client)
+    return _factor_service_instance
@@ -1,8 +1,12 @@
 """情感因子服务层"""
 
+import asyncio
+from collections.abc import AsyncIterator
 from datetime import datetime, timedelta
+from itertools import zip_longest
 from typing import List, Optional, Dict, Any
 
+from fastapi import BackgroundTasks
 from loguru import logger
 
 from ..calculators.sentiment import SentimentFactorCalculator
@@ -30,11 +34,16 @@ class SentimentFactorService:
         """初始化情感因子服务"""
         self.sentiment_calculator = SentimentFactorCalculator()
     
-    async def calculate_sentiment_factor(self, request: SentimentFactorRequest) -> SentimentFactorResponse:
+    async def calculate_sentiment_factor(
+        self,
+        request: SentimentFactorRequest,
+        background_tasks: Optional[BackgroundTasks] = None,
+    ) -> SentimentFactorResponse:
         """计算单个股票情感因子
         
         Args:
             request: 情感因子计算请求
+            background_tasks: 传入时在响应返回后再保存结果，否则同步保存
             
         Returns:
             SentimentFactorResponse: 情感因子响应
@@ -46,9 +55,9 @@ class SentimentFactorService:
         try:
             logger.info(f"开始计算情感因子: {request.stock_code} ({request.date})")
             
-            # 计算日期范围
-            start_date = datetime.strptime(request.date, "%Y-%m-%d") - timedelta(days=request.time_window)
-            end_date = datetime.strptime(request.date, "%Y-%m-%d")
+            # 计算日期范围，日期只解析一次
+            end_date = datetime.fromisoformat(request.date)
+            start_date = end_date - timedelta(days=request.time_window)
             
             # 计算情感因子
             result = await self.sentiment_calculator.calculate_stock_sentiment_factor(
@@ -61,19 +70,23 @@ class SentimentFactorService:
                 raise ValueError(f"未找到股票 {request.stock_code} 在指定时间范围内的新闻数据")
             
             # 保存到数据库
-            await NewsSentimentFactorDAO.save_sentiment_factor(
-                stock_code=request.stock_code,
-                sentiment_factor=result["sentiment_factor"],
-                positive_score=result["positive_score"],
-                negative_score=result["negative_score"],
-                neutral_score=result["neutral_score"],
-                confidence=result.get("confidence", 0.8),
-                news_count=result["news_count"],
-                calculation_date=request.date,
-                start_date=start_date.strftime("%Y-%m-%d"),
-                end_date=end_date.strftime("%Y-%m-%d"),
-                volume_adjustment=1.0
-            )
+            save_kwargs = {
+                "stock_code": request.stock_code,
+                "sentiment_factor": result["sentiment_factor"],
+                "positive_score": result["positive_score"],
+                "negative_score": result["negative_score"],
+                "neutral_score": result["neutral_score"],
+                "confidence": result.get("confidence", 0.8),
+                "news_count": result["news_count"],
+                "calculation_date": request.date,
+                "start_date": start_date.strftime("%Y-%m-%d"),
+                "end_date": end_date.strftime("%Y-%m-%d"),
+                "volume_adjustment": 1.0
+            }
+            if background_tasks is not None:
+                background_tasks.add_task(self._save_sentiment_factor_quietly, save_kwargs)
+            else:
+                await NewsSentimentFactorDAO.save_sentiment_factor(**save_kwargs)
             
             logger.info(f"情感因子计算完成: {request.stock_code} = {result['sentiment_factor']}")
             
@@ -94,6 +107,14 @@ class SentimentFactorService:
         except Exception as e:
             logger.error(f"计算情感因子失败: {e}")
             raise
+
+    @staticmethod
+    async def _save_sentiment_factor_quietly(save_kwargs: Dict[str, Any]) -> None:
+        """后台保存情感因子，失败只记录日志（响应已返回）"""
+        try:
+            await NewsSentimentFactorDAO.save_sentiment_factor(**save_kwargs)
+        except Exception as e:
+            logger.error(f"后台保存情感因子失败: {save_kwargs['stock_code']}, {e}")
     
     async def batch_calculate_sentiment_factors(self, request: BatchSentimentFactorRequest) -> BatchSentimentFactorResponse:
         """批量计算情感因子
@@ -104,28 +125,38 @@ class SentimentFactorService:
         Returns:
             BatchSentimentFactorResponse: 批量计算响应
         """
+        # 循环中使用的请求字段先绑定为局部变量
+        stock_codes = request.stock_codes
+        calc_date_str = request.calculation_date
+
+        # 空列表直接返回，不调用计算器也不访问数据库
+        if not stock_codes:
+            return BatchSentimentFactorResponse(
+                calculation_date=calc_date_str,
+                total_stocks=0,
+                successful_stocks=0,
+                failed_stocks=0,
+                results=[],
+            )
+
         try:
-            logger.info(f"开始批量计算情感因子: {len(request.stock_codes)} 只股票")
-            
-            # 计算日期范围
-            end_date = datetime.strptime(request.calculation_date, "%Y-%m-%d")
-            start_date = end_date - timedelta(days=request.days_back)
+            logger.info(f"开始批量计算情感因子: {len(stock_codes)} 只股票")
             
             results = []
+            records = []
             errors = []
             successful_count = 0
             
             # 批量计算情感因子
-            calculation_date = datetime.strptime(request.calculation_date, "%Y-%m-%d")
+            calculation_date = datetime.fromisoformat(calc_date_str)
             batch_results = await self.sentiment_calculator.calculate_batch_sentiment_factors(
-                request.stock_codes,
+                stock_codes,
                 calculation_date
             )
             
-            for i, stock_code in enumerate(request.stock_codes):
+            # 计算结果与股票代码一一对应，结果缺失时补None
+            for stock_code, result in zip_longest(stock_codes, batch_results):
                 try:
-                    # 获取对应的计算结果
-                    result = batch_results[i] if i < len(batch_results) else None
                     if not result:
                         errors.append({
                             "stock_code": stock_code,
@@ -133,23 +164,13 @@ class SentimentFactorService:
                         })
                         continue
                     
-                    # 批量保存到数据库
-                    start_date = calculation_date - timedelta(days=7)
-                    await NewsSentimentFactorDAO.save_sentiment_factor(
-                        stock_code=stock_code,
-                        sentiment_factor=result["sentiment_factor"],
-                        positive_score=result["positive_score"],
-                        negative_score=result["negative_score"],
-                        neutral_score=result["neutral_score"],
-                        confidence=result["confidence"],
-                        news_count=result["news_count"],
-                        calculation_date=request.calculation_date,
-                        start_date=start_date.strftime("%Y-%m-%d"),
-                        end_date=request.calculation_date,
-                        volume_adjustment=1.0
-                    )
+                    records.append({
+                        "stock_code": stock_code,
+                        "sentiment_factor": result["sentiment_factor"],
+                        "news_count": result["news_count"],
+                        "calculation_date": calc_date_str,
+                    })
                     results.append(result)
-                    successful_count += 1
                     
                 except Exception as e:
                     logger.error(f"计算股票 {stock_code} 情感因子失败: {e}")
@@ -158,33 +179,44 @@ class SentimentFactorService:
                         "error": str(e)
                     })
             
-            # 转换结果格式
-            response_results = []
-            for result in results:
-                if result:
-                    response_results.append(SentimentFactorResponse(
-                        stock_code=result["stock_code"],
-                        date=request.calculation_date,
-                        sentiment_factors={
-                            "overall": result["sentiment_factor"],
-                            "positive": result["positive_score"],
-                            "negative": result["negative_score"],
-                            "neutral": result["neutral_score"]
-                        },
-                        source_weights={"news": 1.0},
-                        data_counts={"news": result["news_count"]}
-                    ))
+            # 批量保存到数据库，一次事务写入全部结果
+            try:
+                successful_count = await NewsSentimentFactorDAO.save_sentiment_factors_bulk(records)
+            except Exception as e:
+                logger.error(f"批量保存情感因子失败: {e}")
+                errors.extend(
+                    {"stock_code": record["stock_code"], "error": str(e)} for record in records
+                )
+                results = []
             
-            logger.info(f"批量计算完成: 成功 {successful_count}/{len(request.stock_codes)}")
+            # 转换结果格式：直接构造字典，由外层响应模型一次性校验
+            response_results = [
+                {
+                    "stock_code": result["stock_code"],
+                    "date": calc_date_str,
+                    "sentiment_factors": {
+                        "overall": result["sentiment_factor"],
+                        "positive": result["positive_score"],
+                        "negative": result["negative_score"],
+                        "neutral": result["neutral_score"]
+                    },
+                    "source_weights": {"news": 1.0},
+                    "data_counts": {"news": result["news_count"]}
+                }
+                for result in results
+            ]
             
-            return BatchSentimentFactorResponse(
-                calculation_date=request.calculation_date,
-                total_stocks=len(request.stock_codes),
-                successful_stocks=successful_count,
-                failed_stocks=len(errors),
-                results=response_results,
-                errors=errors if errors else None,
-            )
+            logger.info(f"批量计算完成: 成功 {successful_count}/{len(stock_codes)}")
+            
+            # 整个响应经model_validate一次校验，结果字典中的numpy标量同时转换为float
+            return BatchSentimentFactorResponse.model_validate({
+                "calculation_date": calc_date_str,
+                "total_stocks": len(stock_codes),
+                "successful_stocks": successful_count,
+                "failed_stocks": len(errors),
+                "results": response_results,
+                "errors": errors if errors else None,
+            })
             
         except Exception as e:
             logger.error(f"批量计算情感因子失败: {e}")
@@ -220,38 +252,48 @@ class SentimentFactorService:
             logger.error(f"获取情感因子数据失败: {e}")
             raise
     
-    async def get_sentiment_factors_by_date(self, date: str, limit: int = 100) -> List[Dict[str, Any]]:
+    async def get_sentiment_factors_by_date(
+        self, date: str, limit: int = 100, cursor: str | None = None
+    ) -> List[SentimentFactorResponse]:
         """获取指定日期的所有情感因子数据
         
         Args:
             date: 日期 (YYYY-MM-DD)
             limit: 返回数量限制
+            cursor: 分页游标，为空时从第一条开始
             
         Returns:
-            情感因子数据列表
+            情感因子响应列表，由响应类直接序列化，不再逐个转换为字典
         """
         try:
-            factors = await NewsSentimentFactorDAO.get_sentiment_factors_by_date_response(
-                date=date,
-                limit=limit
+            return await NewsSentimentFactorDAO.get_sentiment_factors_by_date_response(
+                calculation_date=date,
+                limit=limit,
+                cursor=cursor,
             )
-            
-            # 转换为字典格式
-            result = []
-            for factor in factors:
-                result.append({
-                    "stock_code": factor.stock_code,
-                    "date": factor.date,
-                    "sentiment_factors": factor.sentiment_factors,
-                    "source_weights": factor.source_weights,
-                    "data_counts": factor.data_counts
-                })
-            
-            return result
         except Exception as e:
             logger.error(f"获取日期情感因子数据失败: {e}")
             raise
     
+    def iter_sentiment_factors_by_date(
+        self, date: str, limit: int = 100, cursor: str | None = None
+    ) -> AsyncIterator[SentimentFactorResponse]:
+        """逐条获取指定日期的情感因子数据，用于流式输出
+        
+        Args:
+            date: 日期 (YYYY-MM-DD)
+            limit: 返回数量限制
+            cursor: 分页游标，为空时从第一条开始
+            
+        Returns:
+            情感因子响应的异步迭代器，不经过查询缓存
+        """
+        return NewsSentimentFactorDAO.iter_sentiment_factors_by_date(
+            calculation_date=date,
+            limit=limit,
+            cursor=cursor,
+        )
+    
     async def get_sentiment_trend(self, request: SentimentTrendRequest) -> SentimentTrendResponse:
         """获取股票情感趋势
         
@@ -262,16 +304,16 @@ class SentimentFactorService:
             SentimentTrendResponse: 趋势数据响应
         """
         try:
-            # 获取趋势数据
-            trend_data = await NewsSentimentFactorDAO.get_sentiment_trend(
-                stock_code=request.stock_code,
-                days=request.days,
-            )
-            
-            # 获取统计数据
-            statistics = await NewsSentimentFactorDAO.get_sentiment_statistics(
-                stock_code=request.stock_code,
-                days=request.days,
+            # 趋势数据和统计数据互不依赖，并发查询
+            trend_data, statistics = await asyncio.gather(
+                NewsSentimentFactorDAO.get_sentiment_trend(
+                    stock_code=request.stock_code,
+                    days=request.days,
+                ),
+                NewsSentimentFactorDAO.get_sentiment_statistics(
+                    stock_code=request.stock_code,
+                    days=request.days,
+                ),
             )
             
             return SentimentTrendResponse(
@@ -98,6 +98,15 @@ class DataSourceError(QuantEngineException):
         )
 
 
+class ConcurrentUpdateError(QuantEngineException):
+    """并发更新冲突异常（乐观锁版本不匹配）"""
+
+    def __init__(self, message: str, details: dict[str, Any] | None = None):
+        super().__init__(
+            message=message, error_code="CONCURRENT_UPDATE_ERROR", details=details
+        )
+
+
 async def quant_engine_exception_handler(
     request: Request, exc: QuantEngineException
 ) -> JSONResponse:
@@ -0,0 +1,29 @@
+"""JSON编解码模块
+
+orjson直接处理字节，解析和序列化开销明显低于标准库；未安装时回退到标准库。
+两种实现的函数签名一致，调用方无需关心当前使用的是哪一种
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+
+    def json_loads(data: bytes | str) -> Any:
+        """解析JSON字节或字符串"""
+        return orjson.loads(data)
+
+    def json_dumps(obj: Any) -> bytes:
+        """序列化为紧凑格式的JSON字节"""
+        return orjson.dumps(obj)
+
+except ImportError:  # pragma: no cover - 取决于运行环境
+
+    def json_loads(data: bytes | str) -> Any:
+        """解析JSON字节或字符串"""
+        return json.loads(data)
+
+    def json_dumps(obj: Any) -> bytes:
+        """序列化为紧凑格式的JSON字节"""
+        return json.dumps(obj, separators=(",", ":")).encode()
@@ -0,0 +1,72 @@
+"""测试公共配置
+
+提供内存中的异步Redis替身，自动替换查询缓存和Tushare接口缓存使用的Redis客户端，
+避免测试访问真实Redis
+"""
+
+from fnmatch import fnmatch
+
+import pytest
+
+from src.clients import tushare_client
+from src.factor_engine.dao import cache
+
+
+class FakeAsyncRedis:
+    """内存中的异步Redis替身"""
+
+    def __init__(self) -> None:
+        self.store: dict[str, bytes | str] = {}
+        self.expires: dict[str, int | None] = {}
+
+    async def get(self, key: str) -> bytes | str | None:
+        return self.store.get(key)
+
+    async def set(self, key: str, value: bytes | str, ex: int | None = None) -> None:
+        self.store[key] = value
+        self.expires[key] = ex
+
+    async def mget(self, keys: list[str]) -> list[bytes | str | None]:
+        return [self.store.get(key) for key in keys]
+
+    def pipeline(self, transaction: bool = True) -> "FakePipeline":
+        return FakePipeline(self)
+
+    async def delete(self, *keys: str) -> int:
+        return sum(self.store.pop(key, None) is not None for key in keys)
+
+    async def scan_iter(self, match: str, count: int | None = None):
+        for key in list(self.store):
+            if fnmatch(key, match):
+                yield key
+
+
+class FakePipeline:
+    """缓冲SET命令，execute时一并写入"""
+
+    def __init__(self, redis: FakeAsyncRedis) -> None:
+        self.redis = redis
+        self.commands: list[tuple[str, bytes | str, int | None]] = []
+
+    async def __aenter__(self) -> "FakePipeline":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        self.commands.clear()
+
+    def set(self, key: str, value: bytes | str, ex: int | None = None) -> None:
+        self.commands.append((key, value, ex))
+
+    async def execute(self) -> list[bool]:
+        for key, value, ex in self.commands:
+            await self.redis.set(key, value, ex=ex)
+        return [True] * len(self.commands)
+
+
+@pytest.fixture(autouse=True)
+def fake_redis(monkeypatch: pytest.MonkeyPatch) -> FakeAsyncRedis:
+    """替换查询缓存和Tushare接口缓存使用的Redis客户端"""
+    fake = FakeAsyncRedis()
+    monkeypatch.setattr(cache, "async_redis_client", fake)
+    monkeypatch.setattr(tushare_client, "_cache_client", fake)
+    return fake
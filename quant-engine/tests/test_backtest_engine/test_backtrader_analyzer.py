@@ -8,6 +8,8 @@ from unittest.mock import Mock, patch
 from uuid import UUID
 
 import backtrader as bt
+import numpy as np
+import pandas as pd
 import pytest
 
 from src.backtest_engine.models.backtest_models import (
@@ -16,9 +18,14 @@ from src.backtest_engine.models.backtest_models import (
     BacktestResult,
 )
 from src.backtest_engine.services.backtrader_analyzer import (
+    TRADE_DTYPE,
+    TRADE_TYPE_BUY,
+    TRADE_TYPE_SELL,
     BacktraderAnalyzer,
     CalmarRatioAnalyzer,
     PortfolioValueAnalyzer,
+    TradeRecordAnalyzer,
+    calculate_trade_stats,
 )
 
 
@@ -45,7 +52,7 @@ class TestBacktraderAnalyzer:
         self.analyzer.add_analyzers(mock_cerebro)
 
         # 验证addanalyzer被调用了正确的次数
-        assert mock_cerebro.addanalyzer.call_count == 12
+        assert mock_cerebro.addanalyzer.call_count == 13
 
         # 验证添加了正确的分析器
         calls = mock_cerebro.addanalyzer.call_args_list
@@ -54,7 +61,8 @@ class TestBacktraderAnalyzer:
         expected_names = [
             'returns', 'sharpe', 'drawdown', 'trades',
             'annual_return', 'time_return', 'vwr', 'sqn',
-            'transactions', 'positions', 'calmar', 'portfolio_value'
+            'transactions', 'positions', 'calmar', 'portfolio_value',
+            'trade_records'
         ]
 
         for name in expected_names:
@@ -119,7 +127,10 @@ class TestBacktraderAnalyzer:
         metrics = self.analyzer._extract_risk_metrics(mock_analyzers)
 
         assert metrics['max_drawdown'] == 0.08
-        assert 'volatility' in metrics
+        assert metrics['volatility'] == pytest.approx(
+            np.std([0.01, -0.005, 0.015]) * np.sqrt(252), rel=1e-5
+        )
+        assert metrics['var_95'] == pytest.approx(0.005, rel=1e-5)
         assert metrics['beta'] == 1.0  # 默认值
         assert metrics['alpha'] == 0.0  # 默认值
 
@@ -403,6 +414,71 @@ class TestPortfolioValueAnalyzer:
         assert result[date(2023, 1, 2)] == 101000.0
 
 
+class TestTradeRecordAnalyzer:
+    """TradeRecordAnalyzer及成交统计测试"""
+
+    def test_calculate_trade_stats(self) -> None:
+        """测试向量化成交统计"""
+        trades = np.array([
+            (1, b'000001.SZ', TRADE_TYPE_BUY, 10.0, 100, 1.0, 0.0),
+            (2, b'000001.SZ', TRADE_TYPE_SELL, 12.0, 100, 1.0, 200.0),
+            (3, b'000001.SZ', TRADE_TYPE_BUY, 12.0, 100, 1.0, 0.0),
+            (4, b'000001.SZ', TRADE_TYPE_SELL, 11.0, 100, 1.0, -100.0),
+        ], dtype=TRADE_DTYPE)
+
+        stats = calculate_trade_stats(trades)
+
+        assert stats['closed_trades'] == 2
+        assert stats['win_rate'] == 0.5
+        assert stats['avg_profit'] == 200.0
+        assert stats['avg_loss'] == 100.0
+        assert stats['profit_loss_ratio'] == 2.0
+        assert stats['total_commission'] == 4.0
+
+    def test_calculate_trade_stats_empty(self) -> None:
+        """测试无成交时的统计"""
+        stats = calculate_trade_stats(np.empty(0, dtype=TRADE_DTYPE))
+
+        assert stats['closed_trades'] == 0
+        assert stats['win_rate'] == 0.0
+        assert stats['profit_loss_ratio'] == 0.0
+
+    def test_records_grow_beyond_capacity(self) -> None:
+        """测试成交记录超过初始容量时自动扩容"""
+
+        class AlternatingStrategy(bt.Strategy):
+            def next(self) -> None:
+                if self.position:
+                    self.close()
+                else:
+                    self.buy(size=10)
+
+        prices = np.linspace(10.0, 20.0, 20)
+        df = pd.DataFrame(
+            {
+                'open': prices, 'high': prices, 'low': prices,
+                'close': prices, 'volume': 1000.0,
+            },
+            index=pd.date_range('2023-01-02', periods=20, freq='D'),
+        )
+
+        cerebro = bt.Cerebro()
+        cerebro.adddata(bt.feeds.PandasData(dataname=df), name='000001.SZ')
+        cerebro.addstrategy(AlternatingStrategy)
+        cerebro.addanalyzer(TradeRecordAnalyzer, _name='trade_records')
+
+        with patch.object(TradeRecordAnalyzer, 'INITIAL_CAPACITY', 4):
+            strategy = cerebro.run()[0]
+
+        analyzer = strategy.analyzers.trade_records
+        trades = analyzer.trades
+        assert len(trades) > 4
+        assert trades['code'][0] == b'000001.SZ'
+        assert trades['type'][0] == TRADE_TYPE_BUY
+        assert trades['type'][1] == TRADE_TYPE_SELL
+        assert analyzer.get_analysis()['win_rate'] == 1.0
+
+
 class TestIntegration:
     """集成测试"""
 
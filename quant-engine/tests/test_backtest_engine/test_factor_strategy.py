@@ -20,7 +20,10 @@ from src.backtest_engine.models.backtest_models import (
     BacktestMode,
     FactorItem,
 )
-from src.backtest_engine.services.factor_strategy import FactorStrategy
+from src.backtest_engine.services.factor_strategy import (
+    FactorStrategy,
+    calculate_composite_signals,
+)
 
 
 class TestFactorStrategy:
@@ -650,3 +653,85 @@ class TestFactorStrategy:
             (1 / (1 + math.exp(-0.7))) * 0.3
         ) / 0.7  # 总权重为0.7
         assert abs(composite_signal - expected_signal) < 0.01
+
+    @pytest.mark.parametrize("current_factors", [
+        {"PE": 15.5, "RSI": 0.7, "MA": 0.6},
+        {"PE": float("nan"), "RSI": 0.7, "MA": 0.6},
+        {"PE": float("inf"), "RSI": float("-inf"), "MA": 0.6},
+        {"PE": None, "RSI": "invalid", "MA": -1000.0},
+        {"PE": float("nan"), "RSI": float("nan"), "MA": float("nan")},
+        {"RSI": 0.7},
+        {},
+    ])
+    def test_composite_signal_matches_batch(self, current_factors: dict[str, Any]) -> None:
+        """测试缺失、NaN和无穷大因子值在单股票和批量计算中得到相同信号"""
+        strategy = self._create_strategy_instance()
+        strategy.data.factor_data = [current_factors]
+
+        single_signal = strategy._calculate_composite_signal()
+        batch_signal = calculate_composite_signals(
+            {"000001.SZ": current_factors}, strategy.factor_weights
+        )["000001.SZ"]
+
+        assert not math.isnan(single_signal)
+        assert single_signal == pytest.approx(batch_signal)
+
+
+class TestCalculateCompositeSignals:
+    """批量综合信号计算测试类"""
+
+    factor_weights = {"PE": 0.4, "RSI": 0.3, "MA": 0.3}
+
+    def test_matches_single_stock_signal(self) -> None:
+        """测试批量计算结果与单股票计算口径一致"""
+        signals = calculate_composite_signals(
+            {
+                "000001.SZ": {"PE": 15.5, "RSI": 0.7, "MA": 0.6},
+                "000002.SZ": {"PE": 15.5, "RSI": 0.7},
+            },
+            self.factor_weights,
+        )
+
+        expected_full = (
+            (1 / (1 + math.exp(-15.5))) * 0.4 +
+            (1 / (1 + math.exp(-0.7))) * 0.3 +
+            (1 / (1 + math.exp(-0.6))) * 0.3
+        )
+        expected_missing = (
+            (1 / (1 + math.exp(-15.5))) * 0.4 +
+            (1 / (1 + math.exp(-0.7))) * 0.3
+        ) / 0.7
+        assert signals["000001.SZ"] == pytest.approx(expected_full)
+        assert signals["000002.SZ"] == pytest.approx(expected_missing)
+
+    def test_invalid_and_missing_values(self) -> None:
+        """测试非数值、溢出和无因子数据时返回中性信号"""
+        signals = calculate_composite_signals(
+            {
+                "000001.SZ": {"PE": None, "RSI": "invalid", "MA": -1000.0},
+                "000002.SZ": {},
+                "000003.SZ": None,  # type: ignore[dict-item]
+            },
+            self.factor_weights,
+        )
+
+        assert signals == {"000001.SZ": 0.5, "000002.SZ": 0.5, "000003.SZ": 0.5}
+
+    def test_empty_universe(self) -> None:
+        """测试空股票池"""
+        assert calculate_composite_signals({}, self.factor_weights) == {}
+
+    def test_chunked_parallel_execution(self) -> None:
+        """测试按块并行计算与整体计算结果一致"""
+        stock_factors = {
+            f"{i:06d}.SZ": {"PE": i * 0.1, "RSI": -i * 0.05, "MA": 0.5}
+            for i in range(10)
+        }
+
+        expected = calculate_composite_signals(stock_factors, self.factor_weights)
+        with patch("src.backtest_engine.services.factor_strategy.SIGNAL_CHUNK_SIZE", 3):
+            signals = calculate_composite_signals(
+                stock_factors, self.factor_weights, max_workers=2
+            )
+
+        assert signals == pytest.approx(expected)
@@ -0,0 +1,71 @@
+"""任务管理器分页单元测试
+
+本模块测试任务列表的键集分页游标：
+- TaskDAO 游标生成与解析
+- TaskManager 分页参数校验
+"""
+
+from datetime import datetime
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.backtest_engine.dao.task_dao import TaskDAO
+from src.backtest_engine.services.task_manager import TaskManager
+from src.utils.exceptions import ValidationException
+
+
+class TestTaskCursor:
+    """任务分页游标测试类"""
+
+    def test_cursor_round_trip(self):
+        """测试游标生成后可原样解析出创建时间和任务ID"""
+        created_at = datetime(2024, 1, 2, 9, 30, 0)
+        cursor = TaskDAO.task_cursor(created_at, "task-1")
+
+        assert TaskDAO.parse_task_cursor(cursor) == (created_at, "task-1")
+
+    @pytest.mark.parametrize("cursor", ["2024-01-02T09:30:00", "not-a-date|task-1", "2024-01-02T09:30:00|"])
+    def test_parse_invalid_cursor(self, cursor):
+        """测试无效游标抛出ValueError"""
+        with pytest.raises(ValueError):
+            TaskDAO.parse_task_cursor(cursor)
+
+
+class TestTaskManagerPagination:
+    """任务管理器分页参数测试类"""
+
+    @pytest.mark.asyncio
+    async def test_cursor_passed_to_dao(self):
+        """测试游标解析为(创建时间, 任务ID)后传给DAO"""
+        manager = TaskManager()
+        task_dao = AsyncMock()
+        task_dao.get_tasks_by_batch.return_value = []
+        task_dao.convert_many_to_task_info.return_value = []
+        manager._task_dao = task_dao
+
+        created_at = datetime(2024, 1, 2, 9, 30, 0)
+        await manager.get_tasks_by_batch(
+            "batch-1", limit=10, cursor=TaskDAO.task_cursor(created_at, "task-1")
+        )
+
+        task_dao.get_tasks_by_batch.assert_awaited_once_with(
+            "batch-1", skip=0, limit=10, cursor=(created_at, "task-1")
+        )
+
+    @pytest.mark.asyncio
+    async def test_skip_with_cursor_rejected(self):
+        """测试skip与游标同时使用时抛出验证异常"""
+        manager = TaskManager()
+        cursor = TaskDAO.task_cursor(datetime(2024, 1, 2), "task-1")
+
+        with pytest.raises(ValidationException):
+            await manager.list_tasks(skip=10, cursor=cursor)
+
+    @pytest.mark.asyncio
+    async def test_invalid_cursor_rejected(self):
+        """测试无效游标抛出验证异常"""
+        manager = TaskManager()
+
+        with pytest.raises(ValidationException):
+            await manager.get_tasks_by_batch("batch-1", cursor="bad-cursor")
@@ -0,0 +1,189 @@
+"""DataCollectorClient单元测试
+
+本模块测试data-collector客户端的功能，包括：
+- 共享HTTP客户端复用
+- 只读接口响应缓存
+- 批量并发请求
+- 熔断器与健康检查缓存
+"""
+
+from collections.abc import Iterator
+
+import httpx
+import pytest
+
+from src.clients import data_collector_client as module
+from src.clients.data_collector_client import (
+    DataCollectorClient,
+    _CircuitBreaker,
+    _ResponseCache,
+    clear_data_collector_cache,
+)
+from src.utils.exceptions import DataCollectorException
+
+
+@pytest.fixture
+def request_log() -> list[httpx.Request]:
+    """记录发出的HTTP请求"""
+    return []
+
+
+@pytest.fixture(autouse=True)
+def mock_shared_client(request_log: list[httpx.Request]) -> Iterator[None]:
+    """用MockTransport替换共享HTTP客户端"""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        request_log.append(request)
+        if request.url.path == "/health":
+            return httpx.Response(200, json={"status": "ok"})
+        if request.url.path == "/api/v1/policy/data":
+            return httpx.Response(503, json={"detail": "unavailable"})
+        symbol = request.url.params.get("symbol")
+        return httpx.Response(200, json={"data": [{"symbol": symbol}]})
+
+    original = module._shared_client
+    module._shared_client = httpx.AsyncClient(
+        base_url="http://data-collector", transport=httpx.MockTransport(handler)
+    )
+    clear_data_collector_cache()
+    module._circuit_breaker.record_success()
+    yield
+    module._shared_client = original
+    clear_data_collector_cache()
+    module._circuit_breaker.record_success()
+
+
+class TestResponseCache:
+    """响应缓存测试"""
+
+    async def test_stock_data_cached(self, request_log: list[httpx.Request]) -> None:
+        """相同参数的股票数据请求只访问一次服务"""
+        client = DataCollectorClient()
+
+        first = await client.get_stock_data("000001.SZ", "20240101", "20240131")
+        second = await client.get_stock_data("000001.SZ", "20240101", "20240131")
+
+        assert first == second == [{"symbol": "000001.SZ"}]
+        assert len(request_log) == 1
+
+    async def test_different_params_not_shared(self, request_log: list[httpx.Request]) -> None:
+        """不同参数分别缓存"""
+        client = DataCollectorClient()
+
+        await client.get_stock_data("000001.SZ")
+        await client.get_stock_data("000002.SZ")
+
+        assert len(request_log) == 2
+
+    async def test_uncacheable_endpoint(self, request_log: list[httpx.Request]) -> None:
+        """非只读数据接口不缓存"""
+        client = DataCollectorClient()
+
+        await client.get_market_data()
+        await client.get_market_data()
+
+        assert len(request_log) == 2
+
+    def test_expired_entry(self) -> None:
+        """过期条目视为未命中"""
+        cache = _ResponseCache(maxsize=10, ttl=0)
+        key = cache.make_key("/api/v1/stock/data", {"symbol": "000001.SZ"})
+
+        cache.set(key, {"data": []})
+
+        assert cache.get(key) is None
+        assert len(cache) == 0
+
+    def test_lru_eviction(self) -> None:
+        """超出容量时淘汰最久未使用的条目"""
+        cache = _ResponseCache(maxsize=2, ttl=60)
+        keys = [cache.make_key("/api/v1/stock/data", {"symbol": s}) for s in "abc"]
+
+        cache.set(keys[0], 0)
+        cache.set(keys[1], 1)
+        cache.get(keys[0])
+        cache.set(keys[2], 2)
+
+        assert cache.get(keys[0]) == 0
+        assert cache.get(keys[1]) is None
+        assert cache.get(keys[2]) == 2
+
+
+class TestBatchRequests:
+    """批量请求测试"""
+
+    async def test_get_bundle(self) -> None:
+        """按需并发获取多类数据"""
+        client = DataCollectorClient()
+
+        bundle = await client.get_bundle("000001.SZ", {"stock", "financial"})
+
+        assert set(bundle) == {"stock", "financial"}
+        assert bundle["stock"] == [{"symbol": "000001.SZ"}]
+
+    async def test_get_bundle_unknown_type(self) -> None:
+        """不支持的数据类型抛出异常"""
+        client = DataCollectorClient()
+
+        with pytest.raises(ValueError):
+            await client.get_bundle("000001.SZ", {"unknown"})
+
+    async def test_get_stock_data_many(self, request_log: list[httpx.Request]) -> None:
+        """多只股票数据按代码返回"""
+        client = DataCollectorClient()
+        symbols = ["000001.SZ", "000002.SZ", "600000.SH"]
+
+        result = await client.get_stock_data_many(symbols)
+
+        assert list(result) == symbols
+        assert result["600000.SH"] == [{"symbol": "600000.SH"}]
+        assert len(request_log) == 3
+
+
+class TestCircuitBreaker:
+    """熔断器测试"""
+
+    async def test_opens_after_consecutive_failures(
+        self, request_log: list[httpx.Request]
+    ) -> None:
+        """连续5xx达到阈值后不再访问服务"""
+        client = DataCollectorClient()
+
+        for _ in range(module.CIRCUIT_FAILURE_THRESHOLD):
+            with pytest.raises(httpx.HTTPStatusError):
+                await client.get_policy_data()
+
+        with pytest.raises(DataCollectorException):
+            await client.get_stock_data("000001.SZ")
+
+        assert len(request_log) == module.CIRCUIT_FAILURE_THRESHOLD
+
+    def test_half_open_probe(self) -> None:
+        """恢复时间后放行一次试探请求，成功则关闭"""
+        breaker = _CircuitBreaker(failure_threshold=1, reset_timeout=0)
+        breaker.record_failure()
+        assert breaker.is_open
+
+        breaker.before_request()
+        breaker.record_success()
+
+        assert not breaker.is_open
+
+    def test_rejects_while_open(self) -> None:
+        """熔断期间拒绝请求"""
+        breaker = _CircuitBreaker(failure_threshold=2, reset_timeout=60)
+        breaker.record_failure()
+        breaker.before_request()
+        breaker.record_failure()
+
+        with pytest.raises(DataCollectorException):
+            breaker.before_request()
+
+    async def test_health_check_cached(self, request_log: list[httpx.Request]) -> None:
+        """健康检查结果在缓存期内复用"""
+        client = DataCollectorClient()
+
+        assert await client.health_check() is True
+        assert await client.health_check() is True
+
+        assert len(request_log) == 1
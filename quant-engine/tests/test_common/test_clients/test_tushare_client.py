@@ -0,0 +1,255 @@
+"""TushareClient单元测试
+
+本模块测试Tushare客户端的功能，包括：
+- Tushare Pro HTTP接口调用与响应解析
+- 接口错误处理
+- 接口响应缓存
+- 列式记录集合
+"""
+
+import json
+from collections.abc import Iterator
+
+import httpx
+import numpy as np
+import pytest
+
+from src.clients import tushare_client as module
+from src.clients.tushare_client import ColumnarRecords, TushareClient
+from src.config.settings import settings
+from src.utils.exceptions import DataSourceError
+from tests.conftest import FakeAsyncRedis
+
+DAILY_RESPONSE = {
+    "code": 0,
+    "msg": "",
+    "data": {
+        "fields": ["ts_code", "trade_date", "close"],
+        "items": [["000001.SZ", "20240103", 10.2], ["000001.SZ", "20240102", 10.0]],
+    },
+}
+
+
+@pytest.fixture
+def request_log() -> list[dict]:
+    """记录发出的接口请求体"""
+    return []
+
+
+@pytest.fixture(autouse=True)
+def mock_tushare_api(
+    request_log: list[dict], fake_redis: FakeAsyncRedis, monkeypatch: pytest.MonkeyPatch
+) -> Iterator[None]:
+    """用MockTransport模拟Tushare Pro接口"""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        request_log.append(body)
+        if body["api_name"] == "daily":
+            return httpx.Response(200, json=DAILY_RESPONSE)
+        if body["api_name"] == "income":
+            code = body["params"]["ts_code"]
+            if code == "BAD":
+                return httpx.Response(500)
+            return httpx.Response(200, json={"code": 0, "data": {"fields": ["ts_code"], "items": [[code]]}})
+        if body["api_name"] == "trade_cal":
+            return httpx.Response(200, json={"code": 0, "data": {"fields": ["cal_date"], "items": [["20240102"]]}})
+        if body["api_name"] == "fina_indicator":
+            fields = body["fields"].split(",")
+            return httpx.Response(200, json={"code": 0, "data": {"fields": fields, "items": []}})
+        if body["api_name"] == "daily_basic":
+            return httpx.Response(200, json={"code": 0, "data": {"fields": ["ts_code", "pe"], "items": []}})
+        return httpx.Response(200, json={"code": 40203, "msg": "没有接口访问权限"})
+
+    monkeypatch.setattr(settings, "tushare_token", "test-token")
+    monkeypatch.setattr(settings, "tushare_retry_delay", 0)
+    monkeypatch.setattr(TushareClient, "_verified_token", None)
+    original = module._shared_client
+    module._shared_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    yield
+    module._shared_client = original
+
+
+@pytest.fixture
+def client() -> TushareClient:
+    """已初始化的客户端"""
+    tushare = TushareClient()
+    tushare._initialized = True
+    return tushare
+
+
+class TestTushareApi:
+    """Tushare Pro接口调用测试"""
+
+    async def test_call_api_returns_columns(self, client: TushareClient, request_log: list[dict]) -> None:
+        """响应按列返回，且不发送值为None的参数"""
+        columns = await client._call_api("daily", ts_code="000001.SZ", start_date=None)
+
+        assert columns == {
+            "ts_code": ["000001.SZ", "000001.SZ"],
+            "trade_date": ["20240103", "20240102"],
+            "close": [10.2, 10.0],
+        }
+        assert request_log[0]["params"] == {"ts_code": "000001.SZ"}
+        assert request_log[0]["token"] == "test-token"
+
+    async def test_get_daily_data_sorted(self, client: TushareClient) -> None:
+        """日线数据按交易日期排序"""
+        result = await client.get_daily_data("000001.SZ")
+
+        assert list(result["trade_date"]) == ["20240102", "20240103"]
+        assert list(result.index) == [0, 1]
+
+    async def test_empty_daily_basic(self, client: TushareClient) -> None:
+        """无数据时返回空列表"""
+        assert await client.get_daily_basic(trade_date="20240102") == []
+
+    async def test_api_error_retried_then_raised(
+        self, client: TushareClient, request_log: list[dict]
+    ) -> None:
+        """接口返回错误码时重试后抛出DataSourceError"""
+        with pytest.raises(DataSourceError):
+            await client.get_stock_basic()
+
+        assert len(request_log) == settings.tushare_retry_count
+
+    async def test_connection_verified_once(self, request_log: list[dict]) -> None:
+        """同一token的连接测试在实例间共享"""
+        await TushareClient().initialize()
+        await TushareClient().initialize()
+
+        assert [body["api_name"] for body in request_log] == ["trade_cal"]
+
+    async def test_financial_indicator_fields(self, client: TushareClient, request_log: list[dict]) -> None:
+        """按需请求财务指标字段，标识字段始终包含"""
+        await client.get_financial_indicators("000001.SZ", fields=["roe", "ts_code"])
+
+        assert request_log[0]["fields"] == "ts_code,ann_date,end_date,roe"
+
+    async def test_unknown_financial_indicator_field(self, client: TushareClient) -> None:
+        """不支持的指标字段直接报错"""
+        with pytest.raises(ValueError):
+            await client.get_financial_indicators("000001.SZ", fields=["not_a_field"])
+
+    def test_financial_indicator_fields_unique(self) -> None:
+        """默认请求的财务指标字段没有重复"""
+        fields = module._FINA_INDICATOR_FIELDS.split(",")
+
+        assert len(fields) == len(set(fields))
+
+    async def test_income_statement_batch(self, client: TushareClient) -> None:
+        """批量获取按代码返回结果，单只失败不影响其他"""
+        result = await client.get_income_statement_batch(["000001.SZ", "BAD", "600000.SH"])
+
+        assert list(result) == ["000001.SZ", "BAD", "600000.SH"]
+        assert list(result["600000.SH"]["ts_code"]) == ["600000.SH"]
+        assert isinstance(result["BAD"], DataSourceError)
+
+
+class TestResponseCache:
+    """接口响应缓存测试"""
+
+    async def test_repeated_call_served_from_cache(
+        self, client: TushareClient, request_log: list[dict], fake_redis: FakeAsyncRedis
+    ) -> None:
+        """相同参数的调用只请求一次接口"""
+        first = await client._call_api("daily", ts_code="000001.SZ")
+        second = await client._call_api("daily", ts_code="000001.SZ")
+
+        assert first == second
+        assert len(request_log) == 1
+        assert list(fake_redis.expires.values()) == [settings.cache_ttl]
+        assert all(key.startswith("ts:") for key in fake_redis.store)
+
+    async def test_param_order_shares_key(
+        self, client: TushareClient, request_log: list[dict]
+    ) -> None:
+        """参数顺序不影响缓存键"""
+        await client._call_api("daily", ts_code="000001.SZ", start_date="20240101")
+        await client._call_api("daily", start_date="20240101", ts_code="000001.SZ")
+
+        assert len(request_log) == 1
+
+    async def test_errors_not_cached(self, client: TushareClient, fake_redis: FakeAsyncRedis) -> None:
+        """接口错误不写入缓存"""
+        with pytest.raises(DataSourceError):
+            await client.get_stock_basic()
+
+        assert fake_redis.store == {}
+
+    async def test_redis_failure_falls_back_to_api(
+        self, client: TushareClient, request_log: list[dict], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Redis不可用时直接请求接口"""
+
+        class BrokenRedis:
+            async def get(self, key: str) -> None:
+                raise ConnectionError("redis down")
+
+            async def set(self, key: str, value: str, ex: int | None = None) -> None:
+                raise ConnectionError("redis down")
+
+        monkeypatch.setattr(module, "_cache_client", BrokenRedis())
+
+        columns = await client._call_api("daily", ts_code="000001.SZ")
+
+        assert columns["close"] == [10.2, 10.0]
+        assert len(request_log) == 1
+
+
+class TestColumnarRecords:
+    """列式记录集合测试"""
+
+    def test_row_access(self) -> None:
+        """按下标构建单行字典"""
+        records = ColumnarRecords({"ts_code": ["000001.SZ", "600000.SH"], "pe": [5.1, 6.2]})
+
+        assert len(records) == 2
+        assert records[0] == {"ts_code": "000001.SZ", "pe": 5.1}
+        assert records[-1]["ts_code"] == "600000.SH"
+        assert list(records) == [records[0], records[1]]
+
+    def test_empty(self) -> None:
+        """空集合为假值"""
+        records = ColumnarRecords({})
+
+        assert not records
+        with pytest.raises(IndexError):
+            records[0]
+
+    def test_itertuples(self) -> None:
+        """按行迭代命名元组"""
+        records = ColumnarRecords({"ts_code": ["000001.SZ", "600000.SH"], "pe": [5.1, 6.2]})
+
+        rows = list(records.itertuples("StockBasic"))
+
+        assert [row.ts_code for row in rows] == ["000001.SZ", "600000.SH"]
+        assert rows[1]._asdict() == records[1]
+        assert type(rows[0]) is type(next(records.itertuples("StockBasic")))
+
+    def test_column_array(self) -> None:
+        """数值列转换为数组，缺失值为NaN"""
+        records = ColumnarRecords({"pe": [5.1, None, 6.2]})
+
+        array = records.column_array("pe")
+
+        assert array.dtype == np.float64
+        assert np.isnan(array[1])
+        assert array[[0, 2]].tolist() == [5.1, 6.2]
+
+    def test_to_dataframe(self) -> None:
+        """按列转换为DataFrame"""
+        frame = ColumnarRecords({"ts_code": ["000001.SZ"], "pe": [5.1]}).to_dataframe()
+
+        assert list(frame.columns) == ["ts_code", "pe"]
+        assert frame.iloc[0]["pe"] == 5.1
+
+    def test_to_dataframe_float32(self) -> None:
+        """浮点列可按需转换为float32，其他列不变"""
+        frame = ColumnarRecords(
+            {"ts_code": ["000001.SZ", "600000.SH"], "pe": [5.1, None], "vol": [100, 200]}
+        ).to_dataframe(float_dtype=np.float32)
+
+        assert frame["pe"].dtype == np.float32
+        assert frame["vol"].dtype == np.int64
+        assert list(frame["ts_code"]) == ["000001.SZ", "600000.SH"]
@@ -5,10 +5,16 @@
 
 from unittest.mock import AsyncMock
 
+import pandas as pd
 import pytest
 
 from src.clients.data_collector_client import DataCollectorClient
-from src.factor_engine.calculators.fundamental import FundamentalFactorCalculator
+from src.clients.tushare_client import TushareClient
+from src.factor_engine.calculators.fundamental import (
+    FINANCIAL_DATA_TTL,
+    FundamentalFactorCalculator,
+)
+from src.utils.exceptions import DataSourceError
 
 
 class TestFundamentalFactorCalculator:
@@ -105,60 +111,56 @@ class TestFundamentalFactorCalculator:
         assert result is not None
         assert isinstance(result, float)
 
-    @pytest.mark.asyncio
-    async def test_calculate_gross_margin_normal(self, calculator):
+    def test_calculate_gross_margin_normal(self, calculator):
         """测试正常情况下的毛利率计算"""
         financial_data = {
             "revenue": 8000000000,
             "cost_of_sales": 6000000000
         }
 
-        result = await calculator.calculate_gross_margin("000001", "2023Q3", financial_data)
+        result = calculator.calculate_gross_margin("000001", "2023Q3", financial_data)
 
         # 毛利率 = (营收 - 销售成本) / 营收 = (80亿 - 60亿) / 80亿 = 0.25 = 25%
         assert result is not None
         assert isinstance(result, float)
         assert 0 <= result <= 1
 
-    @pytest.mark.asyncio
-    async def test_calculate_net_profit_margin_normal(self, calculator):
+    def test_calculate_net_profit_margin_normal(self, calculator):
         """测试正常情况下的净利率计算"""
         financial_data = {
             "net_profit": 1000000000,
             "revenue": 8000000000
         }
 
-        result = await calculator.calculate_net_profit_margin("000001", "2023Q3", financial_data)
+        result = calculator.calculate_net_profit_margin("000001", "2023Q3", financial_data)
 
         # 净利率 = 净利润 / 营收 = 10亿 / 80亿 = 0.125 = 12.5%
         assert result is not None
         assert isinstance(result, float)
         assert 0 <= result <= 1
 
-    @pytest.mark.asyncio
-    async def test_calculate_debt_ratio_normal(self, calculator):
+    def test_calculate_debt_ratio_normal(self, calculator):
         """测试正常情况下的资产负债率计算"""
         financial_data = {
             "total_liabilities": 5000000000,
             "total_assets": 10000000000
         }
 
-        result = await calculator.calculate_debt_ratio("000001", "2023Q3", financial_data)
+        result = calculator.calculate_debt_ratio("000001", "2023Q3", financial_data)
 
         # 资产负债率 = 总负债 / 总资产 = 50亿 / 100亿 = 0.5 = 50%
         assert result is not None
         assert isinstance(result, float)
         assert 0 <= result <= 1
 
-    @pytest.mark.asyncio
-    async def test_calculate_current_ratio_normal(self, calculator):
+    def test_calculate_current_ratio_normal(self, calculator):
         """测试正常情况下的流动比率计算"""
         financial_data = {
             "current_assets": 3000000000,
             "current_liabilities": 2000000000
         }
 
-        result = await calculator.calculate_current_ratio("000001", "2023Q3", financial_data)
+        result = calculator.calculate_current_ratio("000001", "2023Q3", financial_data)
 
         # 流动比率 = 流动资产 / 流动负债 = 30亿 / 20亿 = 1.5
         assert result is not None
@@ -166,15 +168,14 @@ class TestFundamentalFactorCalculator:
         assert result > 0
 
     # 边界条件测试
-    @pytest.mark.asyncio
-    async def test_edge_case_zero_revenue(self, calculator):
+    def test_edge_case_zero_revenue(self, calculator):
         """测试营收为零的边界情况"""
         financial_data = {
             "net_profit": 1000000000,
             "revenue": 0
         }
 
-        result = await calculator.calculate_net_profit_margin("000001", "2023Q3", financial_data)
+        result = calculator.calculate_net_profit_margin("000001", "2023Q3", financial_data)
         assert result is None
 
     @pytest.mark.asyncio
@@ -188,17 +189,43 @@ class TestFundamentalFactorCalculator:
         result = await calculator.calculate_roa("000001", "2023Q3", financial_data)
         assert result is None
 
-    @pytest.mark.asyncio
-    async def test_edge_case_zero_current_liabilities(self, calculator):
+    def test_edge_case_zero_current_liabilities(self, calculator):
         """测试流动负债为零的边界情况"""
         financial_data = {
             "current_assets": 3000000000,
             "current_liabilities": 0
         }
 
-        result = await calculator.calculate_current_ratio("000001", "2023Q3", financial_data)
+        result = calculator.calculate_current_ratio("000001", "2023Q3", financial_data)
         assert result is None
 
+    def test_missing_values_return_none(self, calculator):
+        """财务字段为None时直接返回None"""
+        financial_data = {"revenue": None, "cost_of_sales": 1.0, "net_profit": None,
+                          "total_liabilities": None, "total_assets": 10.0}
+
+        assert calculator.calculate_gross_margin("000001", "2023Q3", financial_data) is None
+        assert calculator.calculate_net_profit_margin("000001", "2023Q3", financial_data) is None
+        assert calculator.calculate_debt_ratio("000001", "2023Q3", financial_data) is None
+
+    def test_calculate_ratio_factors_bulk(self, calculator, mock_data_client):
+        """批量计算与逐个因子计算结果一致，分母为0时为None"""
+        financial_data = mock_data_client.get_financial_data.return_value[0]
+        zero_data = {"net_profit": 1.0, "total_equity": 0, "revenue": 0}
+        prev_data = {"total_equity": 15000000000, "total_assets": 10000000000}
+        factors = ["ROE", "ROA", "GROSS_MARGIN", "NET_MARGIN", "DEBT_RATIO",
+                   "CURRENT_RATIO", "UNKNOWN"]
+
+        results = calculator.calculate_ratio_factors(
+            factors, [financial_data, zero_data], [prev_data, None]
+        )
+
+        assert results[0] == {
+            "ROE": 0.1, "ROA": 0.1, "GROSS_MARGIN": 0.25, "NET_MARGIN": 0.125,
+            "DEBT_RATIO": 0.5, "CURRENT_RATIO": 1.5,
+        }
+        assert results[1] == dict.fromkeys(factors[:-1])
+
     # 辅助方法测试
     def test_get_previous_period_quarterly(self, calculator):
         """测试季度期间的上一期间计算"""
@@ -216,3 +243,110 @@ class TestFundamentalFactorCalculator:
     def test_get_previous_year_period_annual(self, calculator):
         """测试年度期间的上年同期计算"""
         assert calculator._get_previous_year_period("2023") == "2022"
+
+
+class TestFinancialData:
+    """财务数据获取与缓存测试"""
+
+    @pytest.fixture
+    def tushare_client(self):
+        """600000.SH利润表获取失败，其他股票返回固定报表"""
+        client = AsyncMock(spec=TushareClient)
+
+        async def income(ts_code, **kwargs):
+            if ts_code == "600000.SH":
+                raise DataSourceError("获取利润表失败")
+            return pd.DataFrame({"revenue": [8.0], "n_income": [1.0]})
+
+        client.get_income_statement.side_effect = income
+        client.get_balance_sheet.return_value = pd.DataFrame({"total_assets": [10.0]})
+        client.get_cashflow_statement.return_value = pd.DataFrame()
+        client.get_financial_indicators.return_value = pd.DataFrame()
+        return client
+
+    @pytest.mark.asyncio
+    async def test_bulk_keyed_by_stock_code(self, tushare_client, fake_redis):
+        """结果以原始股票代码为键，获取失败的股票对应None"""
+        calculator = FundamentalFactorCalculator(tushare_client)
+
+        result = await calculator.get_financial_data_bulk(["000001", "600000"], "2023Q3")
+
+        assert result["000001"]["revenue"] == 8.0
+        assert result["000001"]["total_assets"] == 10.0
+        assert result["600000"] is None
+        tushare_client.get_balance_sheet.assert_any_await(
+            ts_code="000001.SZ", end_date="20230930", period="Q"
+        )
+
+    @pytest.mark.asyncio
+    async def test_cached_by_period(self, tushare_client, fake_redis):
+        """同一报告期的财务数据只请求一次，已披露报告期使用长TTL"""
+        calculator = FundamentalFactorCalculator(tushare_client)
+
+        first = await calculator._get_financial_data("000001", "2023Q3")
+        second = await calculator._get_financial_data("000001.SZ", "2023Q3")
+
+        assert first == second
+        assert tushare_client.get_income_statement.await_count == 1
+        assert fake_redis.expires == {
+            "fundamental:financial:000001.SZ:20230930:Q": FINANCIAL_DATA_TTL
+        }
+
+    @pytest.mark.asyncio
+    async def test_prefetched_data_skips_fetch(self, tushare_client, fake_redis):
+        """传入预取的财务数据时不再请求接口"""
+        calculator = FundamentalFactorCalculator(tushare_client)
+
+        result = await calculator.calculate_factors(
+            "000001", ["GROSS_MARGIN"], "2023Q3",
+            financial_data={"revenue": 8.0, "cost_of_sales": 6.0},
+        )
+
+        assert result == {"GROSS_MARGIN": 0.25}
+        tushare_client.get_income_statement.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_period_data_fetched_once(self, tushare_client, fake_redis):
+        """ROE、ROA及同比增长率共用各报告期数据，每个报告期只获取一次"""
+        calculator = FundamentalFactorCalculator(tushare_client)
+        fetched = []
+
+        async def get_financial_data(stock_code, period, report_type="quarterly"):
+            fetched.append(period)
+            return {"net_profit": 1.0, "total_equity": 5.0, "total_assets": 10.0}
+
+        calculator._get_financial_data = get_financial_data
+
+        period_cache = await calculator.get_period_data(
+            "000001", "2023Q1", ["ROE", "ROA"], include_prior_year=True
+        )
+        factors = await calculator.calculate_factors(
+            "000001", ["ROE", "ROA"], "2023Q1", period_cache=period_cache
+        )
+        growth = await calculator.calculate_growth_rates(
+            "000001", "2023Q1", ["ROE", "ROA"], period_cache=period_cache
+        )
+
+        assert sorted(fetched) == ["2021Q4", "2022Q1", "2022Q4", "2023Q1"]
+        assert factors == {"ROE": 0.2, "ROA": 0.1}
+        assert growth == {"ROE_YOY": 0.0, "ROA_YOY": 0.0}
+
+    @pytest.mark.asyncio
+    async def test_growth_rates_missing_or_zero_prior(self, tushare_client):
+        """上年同期缺失或为0的因子增长率为None，不支持的因子不返回"""
+        calculator = FundamentalFactorCalculator(tushare_client)
+        period_cache = {
+            "2023Q3": {"revenue": 8.0, "cost_of_sales": 6.0, "net_profit": 2.0,
+                       "current_assets": 3.0, "current_liabilities": 2.0},
+            "2022Q3": {"revenue": 4.0, "cost_of_sales": 2.0, "net_profit": 0.0,
+                       "current_assets": 3.0, "current_liabilities": 0.0},
+        }
+
+        growth = await calculator.calculate_growth_rates(
+            "000001", "2023Q3", ["GROSS_MARGIN", "NET_MARGIN", "CURRENT_RATIO", "UNKNOWN"],
+            period_cache=period_cache,
+        )
+
+        assert growth == {
+            "GROSS_MARGIN_YOY": -0.5, "NET_MARGIN_YOY": None, "CURRENT_RATIO_YOY": None
+        }
@@ -0,0 +1,223 @@
+"""因子缓存测试模块
+
+测试情绪因子查询缓存装饰器和写入后的缓存清除
+"""
+
+from datetime import date
+
+import pytest
+
+from src.factor_engine.dao import cache as module
+from src.factor_engine.dao.cache import (
+    HOT_FACTOR_TTL,
+    SENTIMENT_FACTOR_TTL,
+    SENTIMENT_KEY_ARGS,
+    SENTIMENT_TODAY_TTL,
+    invalidate_sentiment_cache,
+    redis_cached,
+    ttl_by_date,
+)
+from src.factor_engine.dao.factor_dao import FactorDAO
+from src.factor_engine.models.schemas import SentimentFactorResponse
+from tests.conftest import FakeAsyncRedis
+
+
+class TestRedisCached:
+    """查询缓存装饰器测试"""
+
+    async def test_cache_hit_skips_query(self, fake_redis: FakeAsyncRedis) -> None:
+        """命中缓存时不再执行查询"""
+        calls = []
+
+        @redis_cached("trend:{stock_code}:{days}", ttl=300)
+        async def get_trend(stock_code: str, days: int = 30) -> list[dict]:
+            calls.append(stock_code)
+            return [{"date": "2024-01-02", "sentiment_factor": 0.5}]
+
+        first = await get_trend("000001.SZ")
+        second = await get_trend(stock_code="000001.SZ", days=30)
+
+        assert first == second
+        assert calls == ["000001.SZ"]
+        assert fake_redis.expires == {"trend:000001.SZ:30": 300}
+
+    async def test_model_round_trip(self, fake_redis: FakeAsyncRedis) -> None:
+        """Pydantic模型结果可从缓存还原"""
+        response = SentimentFactorResponse(
+            stock_code="000001.SZ",
+            date="2024-01-02",
+            sentiment_factors={"sentiment_factor": 0.5},
+            source_weights={"news": 1.0},
+            data_counts={"news_count": 3},
+        )
+
+        @redis_cached("factor:{stock_code}:{date}", ttl=60, model=SentimentFactorResponse)
+        async def get_factor(stock_code: str, date: str) -> SentimentFactorResponse:
+            return response
+
+        await get_factor("000001.SZ", "2024-01-02")
+        cached = await get_factor("000001.SZ", "2024-01-02")
+
+        assert isinstance(cached, SentimentFactorResponse)
+        assert cached == response
+
+    async def test_model_list_round_trip(self, fake_redis: FakeAsyncRedis) -> None:
+        """模型列表结果可从缓存还原"""
+        responses = [
+            SentimentFactorResponse(
+                stock_code=code,
+                date="2024-01-02",
+                sentiment_factors={"sentiment_factor": 0.5},
+                source_weights={"news": 1.0},
+                data_counts={"news_count": 3},
+            )
+            for code in ("000001.SZ", "600000.SH")
+        ]
+
+        @redis_cached("date:{calculation_date}", ttl=60, model=list[SentimentFactorResponse])
+        async def get_factors(calculation_date: str) -> list[SentimentFactorResponse]:
+            return responses
+
+        await get_factors("2024-01-02")
+        cached = await get_factors("2024-01-02")
+
+        assert cached == responses
+
+    async def test_ttl_by_date(self, fake_redis: FakeAsyncRedis) -> None:
+        """当日数据使用短TTL，历史日期使用长TTL"""
+
+        @redis_cached("factor:{date}", ttl=ttl_by_date("date"))
+        async def get_factor(date: str) -> dict:
+            return {"date": date}
+
+        today = date.today().isoformat()
+        await get_factor(today)
+        await get_factor("2024-01-02")
+
+        assert fake_redis.expires == {
+            f"factor:{today}": SENTIMENT_TODAY_TTL,
+            "factor:2024-01-02": SENTIMENT_FACTOR_TTL,
+        }
+
+    async def test_ttl_by_non_canonical_date(self, fake_redis: FakeAsyncRedis) -> None:
+        """非YYYY-MM-DD写法的当日日期同样使用短TTL"""
+
+        @redis_cached("factor:{date}", ttl=ttl_by_date("date"), key_args=SENTIMENT_KEY_ARGS)
+        async def get_factor(date: str) -> dict:
+            return {"date": date}
+
+        today = date.today()
+        await get_factor(today.strftime("%Y%m%d"))
+
+        assert fake_redis.expires == {f"factor:{today.isoformat()}": SENTIMENT_TODAY_TTL}
+
+    async def test_none_not_cached(self, fake_redis: FakeAsyncRedis) -> None:
+        """查询结果为None时不写入缓存"""
+
+        @redis_cached("factor:{stock_code}", ttl=60)
+        async def get_factor(stock_code: str) -> None:
+            return None
+
+        assert await get_factor("000001.SZ") is None
+        assert fake_redis.store == {}
+
+
+class TestInvalidateSentimentCache:
+    """情绪因子缓存清除测试"""
+
+    async def test_deletes_factor_and_trend_keys(self, fake_redis: FakeAsyncRedis) -> None:
+        """清除对应日期的因子缓存、按日期查询缓存及该股票的全部趋势缓存"""
+        fake_redis.store = {
+            "sentiment:factor:000001.SZ:2024-01-02": "{}",
+            "sentiment:factor:000001.SZ:2024-01-01": "{}",
+            "sentiment:trend:000001.SZ:30": "[]",
+            "sentiment:trend:000001.SZ:7": "[]",
+            "sentiment:trend:600000.SH:30": "[]",
+            "sentiment:date:2024-01-02:100:None": "[]",
+            "sentiment:date:2024-01-02:100:0.500000|000001.SZ": "[]",
+            "sentiment:date:2024-01-01:100:None": "[]",
+        }
+
+        await invalidate_sentiment_cache([("000001.SZ", "2024-01-02")])
+
+        assert set(fake_redis.store) == {
+            "sentiment:factor:000001.SZ:2024-01-01",
+            "sentiment:trend:600000.SH:30",
+            "sentiment:date:2024-01-01:100:None",
+        }
+
+    async def test_multiple_stocks(self, fake_redis: FakeAsyncRedis) -> None:
+        """多只股票一次清除"""
+        fake_redis.store = {
+            "sentiment:trend:000001.SZ:30": "[]",
+            "sentiment:trend:600000.SH:30": "[]",
+            "sentiment:trend:000002.SZ:30": "[]",
+        }
+
+        await invalidate_sentiment_cache(
+            [("000001.SZ", "2024-01-02"), ("600000.SH", "2024-01-02")]
+        )
+
+        assert set(fake_redis.store) == {"sentiment:trend:000002.SZ:30"}
+
+
+    async def test_read_and_write_with_different_date_forms(
+        self, fake_redis: FakeAsyncRedis
+    ) -> None:
+        """以非标准日期写法读取并缓存后，以标准写法保存仍会清除该缓存"""
+        calls = []
+
+        @redis_cached(module.SENTIMENT_FACTOR_KEY, ttl=60, key_args=SENTIMENT_KEY_ARGS)
+        async def get_factor(stock_code: str, date: str) -> dict:
+            calls.append(date)
+            return {"sentiment_factor": len(calls)}
+
+        first = await get_factor("000001.sz", "20240102")
+        assert await get_factor("000001.SZ", "2024-01-02T09:30") == first
+        assert set(fake_redis.store) == {"sentiment:factor:000001.SZ:2024-01-02"}
+
+        await invalidate_sentiment_cache([("000001.SZ", "2024-01-02")])
+        assert fake_redis.store == {}
+
+        assert await get_factor("000001.sz", "20240102") != first
+        await invalidate_sentiment_cache([("000001.sz", "20240102")])
+        assert fake_redis.store == {}
+
+
+class TestFactorValueCache:
+    """技术因子缓存批量读写测试"""
+
+    async def test_round_trip(self, fake_redis: FakeAsyncRedis) -> None:
+        """批量写入的因子可通过一次MGET读回，未缓存的因子不返回"""
+        await FactorDAO.cache_factors(
+            stock_code="000001.SZ",
+            calculation_date="2024-01-02",
+            factors_data={"RSI": 55.0, "MA_5": 10.2},
+        )
+
+        cached = await FactorDAO.get_cached_factors(
+            stock_code="000001.SZ",
+            factor_names=["RSI", "MA_5", "MACD"],
+            calculation_date="2024-01-02",
+        )
+
+        assert cached == {"RSI": 55.0, "MA_5": 10.2}
+        assert fake_redis.expires == {
+            "factor:technical:000001.SZ:RSI:2024-01-02": HOT_FACTOR_TTL,
+            "factor:technical:000001.SZ:MA_5:2024-01-02": HOT_FACTOR_TTL,
+        }
+
+    async def test_redis_failure_is_miss(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Redis不可用时视为未命中"""
+
+        class BrokenRedis:
+            async def mget(self, keys: list[str]) -> None:
+                raise ConnectionError("redis down")
+
+        monkeypatch.setattr(module, "async_redis_client", BrokenRedis())
+
+        cached = await FactorDAO.get_cached_factors(
+            stock_code="000001.SZ", factor_names=["RSI"], calculation_date="2024-01-02"
+        )
+
+        assert cached == {}